@@ -0,0 +1,88 @@
+"""Cache of parsed `nao_config.yaml` files for the SQL endpoints."""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+from nao_core.config import NaoConfig, connection_registry
+from pydantic import ValidationError
+
+
+@dataclass
+class _CachedConfig:
+    config: NaoConfig
+    stamp: tuple[int, int]
+
+
+class ConfigCache:
+    """Keeps the parsed config of each project folder until its `nao_config.yaml` changes.
+
+    Entries are keyed by the resolved project path and checked against the
+    modification time and size of the file on every lookup, so an edited
+    config is picked up by the next request. Reusing the same config objects
+    also keeps their connections warm in the connection registry.
+
+    Configs are loaded without changing the working directory, which requests
+    for other projects share: relative file paths are resolved against the
+    project folder instead.
+
+    When a config is replaced or invalidated, the idle connections of
+    databases it no longer defines are closed; connections in use are left to
+    the registry's idle eviction.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[Path, _CachedConfig] = {}
+
+    def get(self, project_path: Path) -> NaoConfig | None:
+        """Return the config of a project folder, loading it when missing or out of date."""
+        key = project_path.resolve()
+        try:
+            stat = (key / "nao_config.yaml").stat()
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached.stamp == stamp:
+                return cached.config
+
+            config = self._load(key)
+            if config is None:
+                return None
+            self._entries[key] = _CachedConfig(config=config, stamp=stamp)
+
+        if cached is not None:
+            self._close_stale(cached.config, config)
+        return config
+
+    def invalidate(self) -> None:
+        """Drop every cached config, e.g. after the context was refreshed."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for cached in entries:
+            self._close_stale(cached.config, None)
+
+    @staticmethod
+    def _load(project_path: Path) -> NaoConfig | None:
+        try:
+            config = NaoConfig.load(project_path)
+        except (OSError, yaml.YAMLError, ValidationError, ValueError):
+            return None
+        for db in config.databases:
+            db.resolve_paths(project_path)
+        return config
+
+    @staticmethod
+    def _close_stale(old: NaoConfig, new: NaoConfig | None) -> None:
+        kept = {db.connection_key() for db in new.databases} if new is not None else set()
+        for db in old.databases:
+            if db.connection_key() not in kept:
+                connection_registry.close_idle(db)
+
+
+config_cache = ConfigCache()
@@ -1,29 +1,60 @@
+import asyncio
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
-import numpy as np
+import pyarrow as pa
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from ibis import BaseBackend
+from pydantic import BaseModel, Field
 
 load_dotenv()
 
 cli_path = Path(__file__).parent.parent.parent / "cli"
 sys.path.insert(0, str(cli_path))
 
-from nao_core.config import NaoConfig
+from nao_core.config import connection_registry
+from nao_core.config.databases.base import DatabaseConfig
 from nao_core.context import get_context_provider
 
+from config_cache import config_cache
+from sql_cache import result_cache
+from sql_cursors import OpenCursor, PendingCursor, result_cursors
+from sql_results import (
+    ARROW_STREAM_MEDIA_TYPE,
+    ArrowStream,
+    arrow_to_ipc,
+    arrow_to_json,
+    fetch_arrow,
+    iter_arrow_batches,
+    wants_arrow,
+)
+
 port = int(os.environ.get("PORT", 8005))
 
 # Global scheduler instance
 scheduler = None
 
+# Blocking database calls run in this pool, so slow queries do not stall the event loop
+sql_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("NAO_SQL_THREADS", 16)),
+    thread_name_prefix="nao-sql",
+)
+
+# How often a running query checks whether its client disconnected (seconds)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+# Rows returned by queries that set neither max_rows nor page_size (0 disables the cap)
+DEFAULT_MAX_ROWS = int(os.environ.get("NAO_SQL_MAX_ROWS", 10_000))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -57,6 +88,10 @@ async def lifespan(app: FastAPI):
     if scheduler:
         scheduler.shutdown(wait=False)
 
+    sql_executor.shutdown(wait=False, cancel_futures=True)
+    result_cursors.close()
+    connection_registry.close()
+
 
 async def _refresh_context_task():
     """Background task for scheduled context refresh."""
@@ -64,6 +99,8 @@ async def _refresh_context_task():
         provider = get_context_provider()
         updated = provider.refresh()
         if updated:
+            config_cache.invalidate()
+            result_cache.invalidate()
             print(f"[Scheduler] Context refreshed at {datetime.now().isoformat()}")
         else:
             print(f"[Scheduler] Context already up-to-date at {datetime.now().isoformat()}")
@@ -90,12 +127,24 @@ class ExecuteSQLRequest(BaseModel):
     sql: str
     nao_project_folder: str
     database_id: str | None = None
+    max_rows: int | None = Field(
+        default=None, ge=1, description="Maximum number of rows returned for the query (NAO_SQL_MAX_ROWS by default)"
+    )
+    page_size: int | None = Field(
+        default=None, ge=1, description="Return the result in pages of this many rows, with a continuation cursor"
+    )
+    cursor: str | None = Field(default=None, description="Continuation cursor of the previous page (`sql` is ignored)")
+    use_cache: bool = Field(default=True, description="Serve the result from the result cache when possible")
 
 
 class ExecuteSQLResponse(BaseModel):
     data: list[dict]
     row_count: int
     columns: list[str]
+    truncated: bool = False
+    """More rows exist than were returned"""
+    next_cursor: str | None = None
+    """Cursor to pass back to fetch the next page, if any"""
 
 
 class RefreshResponse(BaseModel):
@@ -151,6 +200,9 @@ async def refresh_context():
         updated = provider.refresh()
 
         if updated:
+            # New context may come with a new nao_config.yaml and new data
+            config_cache.invalidate()
+            result_cache.invalidate()
             return RefreshResponse(
                 status="ok",
                 updated=True,
@@ -169,92 +221,274 @@ async def refresh_context():
         )
 
 
-@app.post("/execute_sql", response_model=ExecuteSQLResponse)
-async def execute_sql(request: ExecuteSQLRequest):
-    try:
-        # Load the nao config from the project folder
-        project_path = Path(request.nao_project_folder)
-        os.chdir(project_path)
-        config = NaoConfig.try_load(project_path)
+def _load_database_config(request: ExecuteSQLRequest) -> DatabaseConfig:
+    """Load the nao config of the project folder and pick the database the query runs on."""
+    project_path = Path(request.nao_project_folder)
+    config = config_cache.get(project_path)
 
-        if config is None:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Could not load nao_config.yaml from {request.nao_project_folder}",
-            )
+    if config is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Could not load nao_config.yaml from {request.nao_project_folder}",
+        )
 
-        if len(config.databases) == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="No databases configured in nao_config.yaml",
-            )
+    if len(config.databases) == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="No databases configured in nao_config.yaml",
+        )
 
-        # Determine which database to use
-        if len(config.databases) == 1:
-            db_config = config.databases[0]
-        elif request.database_id:
-            # Find the database by name
-            db_config = next(
-                (db for db in config.databases if db.name == request.database_id),
-                None,
-            )
-            if db_config is None:
-                available_databases = [db.name for db in config.databases]
-                raise HTTPException(
-                    status_code=400,
-                    detail={
-                        "message": f"Database '{request.database_id}' not found",
-                        "available_databases": available_databases,
-                    },
-                )
-        else:
-            # Multiple databases and no database_id specified
+    # Determine which database to use
+    if len(config.databases) == 1:
+        return config.databases[0]
+    if request.database_id:
+        # Find the database by name
+        db_config = next(
+            (db for db in config.databases if db.name == request.database_id),
+            None,
+        )
+        if db_config is None:
             available_databases = [db.name for db in config.databases]
             raise HTTPException(
                 status_code=400,
                 detail={
-                    "message": "Multiple databases configured. Please specify database_id.",
+                    "message": f"Database '{request.database_id}' not found",
                     "available_databases": available_databases,
                 },
             )
+        return db_config
+
+    # Multiple databases and no database_id specified
+    available_databases = [db.name for db in config.databases]
+    raise HTTPException(
+        status_code=400,
+        detail={
+            "message": "Multiple databases configured. Please specify database_id.",
+            "available_databases": available_databases,
+        },
+    )
+
+
+class RunningQuery:
+    """The connection a request's query runs on, so it can be cancelled from the event loop.
 
-        connection = db_config.connect()
+    The worker attaches the connection while the query runs and detaches it
+    before releasing it, so a late cancel never reaches a connection that was
+    handed to another request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._config: DatabaseConfig | None = None
+        self._conn: BaseBackend | None = None
+
+    def attach(self, config: DatabaseConfig, conn: BaseBackend) -> None:
+        with self._lock:
+            self._config, self._conn = config, conn
+
+    def detach(self) -> None:
+        with self._lock:
+            self._config, self._conn = None, None
+
+    def cancel(self) -> bool:
+        """Interrupt the running query. Returns False when nothing was cancelled."""
+        with self._lock:
+            if self._config is None or self._conn is None:
+                return False
+            try:
+                return self._config.cancel_query(self._conn)
+            except Exception:
+                return False
+
+
+def _open_cursor(request: ExecuteSQLRequest, db_config: DatabaseConfig, run: RunningQuery) -> OpenCursor:
+    """Start a query and return a cursor streaming its result, holding a leased connection."""
+    connection = connection_registry.acquire(db_config)
+    run.attach(db_config, connection)
+    try:
+        with connection_registry.query_slot(db_config):
+            cursor = connection.raw_sql(request.sql)
+        batch_size = min(request.page_size or 10_000, request.max_rows or 10_000)
+        stream = ArrowStream(iter_arrow_batches(cursor, batch_size), getattr(cursor, "description", None))
+    except BaseException:
+        run.detach()
+        connection_registry.release(connection, discard=True)
+        raise
+    return OpenCursor(
+        config=db_config, conn=connection, stream=stream, max_rows=request.max_rows, page_size=request.page_size
+    )
 
-        # Use raw_sql to execute arbitrary SQL (including CTEs)
-        cursor = connection.raw_sql(request.sql)
 
-        # Handle different cursor types from different backends
-        if hasattr(cursor, "fetchdf"):
-            # DuckDB returns a cursor with fetchdf()
-            df = cursor.fetchdf()
-        elif hasattr(cursor, "to_dataframe"):
-            # Some backends return cursors with to_dataframe()
-            df = cursor.to_dataframe()
+def _resume_cursor(request: ExecuteSQLRequest, pending: PendingCursor, run: RunningQuery) -> OpenCursor:
+    """Run the query of a pending cursor again and skip the rows its cached first page returned."""
+    resumed = request.model_copy(
+        update={"sql": pending.sql, "max_rows": pending.max_rows, "page_size": pending.page_size, "cursor": None}
+    )
+    cursor = _open_cursor(resumed, pending.config, run)
+    try:
+        with connection_registry.query_slot(cursor.config):
+            cursor.stream.read(pending.skip_rows)
+    except BaseException:
+        run.detach()
+        connection_registry.release(cursor.conn, discard=True)
+        raise
+    return cursor
+
+
+def _cached_page_cursor(
+    request: ExecuteSQLRequest, db_config: DatabaseConfig, table: pa.Table, truncated: bool
+) -> str | None:
+    """Continuation cursor of a first page served from the result cache, if rows are left."""
+    if not (request.page_size and truncated):
+        return None
+    if request.max_rows is not None and table.num_rows >= request.max_rows:
+        return None
+    pending = PendingCursor(
+        config=db_config,
+        sql=request.sql,
+        skip_rows=table.num_rows,
+        max_rows=request.max_rows,
+        page_size=request.page_size,
+    )
+    return result_cursors.put(pending)
+
+
+def _read_page(
+    request: ExecuteSQLRequest, run: RunningQuery, db_config: DatabaseConfig | None = None
+) -> tuple[pa.Table, bool, str | None]:
+    """Read the next page of a paged or capped query: its rows, whether rows are left, and the next cursor."""
+    if request.cursor:
+        cursor = result_cursors.take(request.cursor)
+        if cursor is None:
+            raise HTTPException(status_code=410, detail="Cursor expired or unknown, run the query again")
+        if isinstance(cursor, PendingCursor):
+            cursor = _resume_cursor(request, cursor, run)
         else:
-            # Fallback: try to use pandas read_sql or fetchall
-            import pandas as pd
-
-            columns = [desc[0] for desc in cursor.description]
-            df = pd.DataFrame(cursor.fetchall(), columns=columns)
-
-        def convert_value(v):
-            if isinstance(v, (np.integer,)):
-                return int(v)
-            if isinstance(v, (np.floating,)):
-                return float(v)
-            if isinstance(v, np.ndarray):
-                return v.tolist()
-            if hasattr(v, "item"):  # numpy scalar
-                return v.item()
-            return v
-
-        data = [{k: convert_value(v) for k, v in row.items()} for row in df.to_dict(orient="records")]
-
-        return ExecuteSQLResponse(
-            data=data,
-            row_count=len(data),
-            columns=[str(c) for c in df.columns.tolist()],
-        )
+            run.attach(cursor.config, cursor.conn)
+    else:
+        cursor = _open_cursor(request, db_config or _load_database_config(request), run)
+
+    page_size = request.page_size or cursor.page_size
+    try:
+        remaining = cursor.remaining_rows()
+        limit = min(n for n in (page_size, remaining) if n is not None)
+        with connection_registry.query_slot(cursor.config):
+            table = cursor.stream.read(limit)
+            has_more = cursor.stream.has_more()
+    except BaseException:
+        run.detach()
+        connection_registry.release(cursor.conn, discard=True)
+        raise
+
+    run.detach()
+
+    if has_more and page_size is not None and cursor.remaining_rows() != 0:
+        return table, True, result_cursors.put(cursor)
+    cursor.close()
+    return table, has_more, None
+
+
+def _run_query(request: ExecuteSQLRequest, db_config: DatabaseConfig, run: RunningQuery) -> tuple[pa.Table, bool]:
+    """Run a query that is not paged, returning its rows (up to `max_rows`) and whether rows were left out."""
+    if request.max_rows:
+        table, truncated, _ = _read_page(request, run, db_config)
+        return table, truncated
+
+    # Reuse a warm connection from the process-wide registry
+    with connection_registry.lease(db_config) as connection:
+        run.attach(db_config, connection)
+        try:
+            with connection_registry.query_slot(db_config):
+                # Use raw_sql to execute arbitrary SQL (including CTEs)
+                cursor = connection.raw_sql(request.sql)
+                table = fetch_arrow(cursor)
+        finally:
+            run.detach()
+    return table, False
+
+
+def _execute_sql(request: ExecuteSQLRequest, run: RunningQuery, accept: str | None) -> Response:
+    """Run a query and serialize its result; blocking, called in the SQL thread pool."""
+    if not (request.cursor or request.page_size or request.max_rows) and DEFAULT_MAX_ROWS:
+        request = request.model_copy(update={"max_rows": DEFAULT_MAX_ROWS})
+    headers: dict[str, str] = {}
+    next_cursor = None
+    if request.cursor:
+        # Later pages are read from an open result and never cached
+        table, truncated, next_cursor = _read_page(request, run)
+        headers["X-Cache"] = "BYPASS"
+    else:
+        db_config = _load_database_config(request)
+        project_path = Path(request.nao_project_folder)
+        cache_key = None
+        if request.use_cache and result_cache.enabled:
+            cache_key = result_cache.key(db_config, request.sql, request.max_rows, request.page_size)
+        cached = result_cache.get(cache_key, project_path) if cache_key else None
+
+        if cached is not None:
+            table, truncated = cached.table, cached.truncated
+            next_cursor = _cached_page_cursor(request, db_config, table, truncated)
+            headers["X-Cache"] = "HIT"
+            headers["Age"] = str(int(cached.age))
+        else:
+            if request.page_size:
+                table, truncated, next_cursor = _read_page(request, run, db_config)
+            else:
+                table, truncated = _run_query(request, db_config, run)
+            if cache_key:
+                result_cache.put(cache_key, project_path, table, truncated)
+            headers["X-Cache"] = "MISS" if cache_key else "BYPASS"
+
+    if wants_arrow(accept):
+        headers["X-Truncated"] = str(truncated).lower()
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return Response(content=arrow_to_ipc(table), media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers)
+    # Serialized directly: the payload is not re-validated against ExecuteSQLResponse
+    content = arrow_to_json(table, truncated=truncated, next_cursor=next_cursor)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+async def _run_until_disconnected(http_request: Request, run: RunningQuery, work) -> Response:
+    """Run blocking work in the SQL thread pool, cancelling its query if the client disconnects."""
+    future = asyncio.get_running_loop().run_in_executor(sql_executor, work)
+    while True:
+        done, _ = await asyncio.wait({future}, timeout=DISCONNECT_POLL_INTERVAL)
+        if done:
+            return future.result()
+        if await http_request.is_disconnected():
+            # Drops the work if it is still queued, otherwise interrupts its query
+            future.cancel()
+            run.cancel()
+            raise HTTPException(status_code=499, detail="Client disconnected, query cancelled")
+
+
+@app.post(
+    "/execute_sql",
+    response_model=ExecuteSQLResponse,
+    responses={200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}}}},
+)
+async def execute_sql(request: ExecuteSQLRequest, http_request: Request, accept: str | None = Header(default=None)):
+    """Run a SQL query and return its result.
+
+    The result is fetched as an Arrow table and serialized column-wise to JSON,
+    or sent as an Arrow IPC stream when the `Accept` header asks for it.
+
+    With `max_rows` or `page_size`, rows are streamed from the driver and only
+    the rows returned are fetched. `truncated` tells whether rows were left out;
+    when paging, `next_cursor` continues the same open result in a later request.
+
+    Database calls run in a bounded thread pool, within the database's
+    `max_concurrent_queries` limit, and the query is cancelled when the client
+    disconnects (on backends that support it).
+
+    Results of SELECT queries are cached (see `ResultCache`) unless `use_cache`
+    is false; the `X-Cache` header tells whether a result was a HIT, a MISS, or
+    bypassed the cache.
+    """
+    run = RunningQuery()
+    try:
+        return await _run_until_disconnected(http_request, run, partial(_execute_sql, request, run, accept))
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,202 @@
+"""Cache of `/execute_sql` results, with TTL, a byte budget and optional spill to Parquet."""
+
+import hashlib
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import sqlglot as sg
+from nao_core.config.databases.base import DatabaseConfig
+
+# Metadata keys of spilled Parquet files
+_TRUNCATED_KEY = b"nao_truncated"
+_CREATED_AT_KEY = b"nao_created_at"
+
+
+@dataclass
+class CachedResult:
+    table: pa.Table
+    truncated: bool
+    created_at: float
+    spill_path: Path | None = None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+
+def normalize_sql(sql: str, dialect: str | None) -> str | None:
+    """Canonical form of a read-only query, or None when the query must not be cached.
+
+    Queries are re-rendered by sqlglot, so formatting and keyword case do not
+    change the cache key. Statements other than SELECT queries, and queries
+    sqlglot cannot parse, are not cached.
+    """
+    try:
+        expressions = sg.parse(sql, read=dialect)
+    except Exception:
+        return None
+    if len(expressions) != 1 or not isinstance(expressions[0], sg.exp.Query):
+        return None
+    return expressions[0].sql(dialect=dialect)
+
+
+class ResultCache:
+    """LRU cache of query results, keyed by normalized SQL, database and context version.
+
+    Results older than `ttl` seconds are dropped, and the least recently used
+    results are evicted once the cached Arrow tables exceed `max_bytes`. With
+    `spill` set, evicted (and oversized) results are written as Parquet files
+    to the `.nao/cache/sql` folder of their project and read back from there
+    until they expire.
+
+    `invalidate()` starts a new context version: every cached result is
+    dropped, including spilled files. Spilled files of earlier versions, e.g.
+    written before the server restarted, can never be read again: a project's
+    spill folder is emptied the first time it is used in a version.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_bytes: int = 256 * 1024 * 1024, spill: bool = False):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedResult] = OrderedDict()
+        # Spill folders emptied of earlier versions' files
+        self._spill_dirs: set[Path] = set()
+        self._bytes = 0
+        self._version = secrets.token_hex(8)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def key(
+        self, db_config: DatabaseConfig, sql: str, max_rows: int | None, page_size: int | None = None
+    ) -> str | None:
+        """Cache key of a query, or of its first page with `page_size`; None when it must not be cached."""
+        normalized = normalize_sql(sql, db_config.type)
+        if normalized is None:
+            return None
+        payload = [self._version, db_config.connection_key(), db_config.name, normalized, max_rows, page_size]
+        return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
+    def get(self, key: str, project_path: Path) -> CachedResult | None:
+        """Return a cached result that has not expired, from memory or from its spilled file."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.age <= self.ttl:
+                    self._entries.move_to_end(key)
+                    return entry
+                self._pop(key)
+
+        if self.spill:
+            return self._read_spilled(self._spill_path(project_path, key))
+        return None
+
+    def put(self, key: str, project_path: Path, table: pa.Table, truncated: bool) -> None:
+        """Cache a result, evicting the least recently used ones beyond `max_bytes`."""
+        spill_path = self._spill_path(project_path, key) if self.spill else None
+        entry = CachedResult(table=table, truncated=truncated, created_at=time.time(), spill_path=spill_path)
+        evicted: list[CachedResult] = []
+        with self._lock:
+            self._pop(key)
+            if table.nbytes <= self.max_bytes:
+                self._entries[key] = entry
+                self._bytes += table.nbytes
+            else:
+                evicted.append(entry)
+            while self._bytes > self.max_bytes:
+                _, oldest = self._entries.popitem(last=False)
+                self._bytes -= oldest.table.nbytes
+                evicted.append(oldest)
+
+        for result in evicted:
+            if result.spill_path is not None and result.age <= self.ttl:
+                self._write_spilled(result.spill_path, result)
+
+    def invalidate(self) -> None:
+        """Drop every cached result and start a new context version."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = secrets.token_hex(8)
+            spill_dirs = list(self._spill_dirs)
+            self._spill_dirs.clear()
+
+        for spill_dir in spill_dirs:
+            _clear_spill_dir(spill_dir)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of results and bytes cached in memory."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes}
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.table.nbytes
+
+    def _spill_path(self, project_path: Path, key: str) -> Path:
+        spill_dir = project_path / ".nao" / "cache" / "sql"
+        with self._lock:
+            if spill_dir not in self._spill_dirs:
+                _clear_spill_dir(spill_dir)
+                self._spill_dirs.add(spill_dir)
+        return spill_dir / f"{key}.parquet"
+
+    @staticmethod
+    def _write_spilled(path: Path, result: CachedResult) -> None:
+        metadata = {
+            **(result.table.schema.metadata or {}),
+            _TRUNCATED_KEY: b"1" if result.truncated else b"0",
+            _CREATED_AT_KEY: str(result.created_at).encode(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            pq.write_table(result.table.replace_schema_metadata(metadata), tmp_path)
+            tmp_path.replace(path)
+        except Exception:
+            # Spilling is best effort: some Arrow types cannot be written to Parquet
+            pass
+
+    def _read_spilled(self, path: Path) -> CachedResult | None:
+        try:
+            table = pq.read_table(path)
+        except Exception:
+            return None
+        metadata = dict(table.schema.metadata or {})
+        created_at = float(metadata.pop(_CREATED_AT_KEY, b"0"))
+        truncated = metadata.pop(_TRUNCATED_KEY, b"0") == b"1"
+        result = CachedResult(
+            table=table.replace_schema_metadata(metadata or None),
+            truncated=truncated,
+            created_at=created_at,
+            spill_path=path,
+        )
+        if result.age > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return result
+
+
+def _clear_spill_dir(spill_dir: Path) -> None:
+    for pattern in ("*.parquet", "*.tmp"):
+        for path in spill_dir.glob(pattern):
+            path.unlink(missing_ok=True)
+
+
+result_cache = ResultCache(
+    ttl=float(os.environ.get("NAO_SQL_CACHE_TTL", 300)),
+    max_bytes=int(os.environ.get("NAO_SQL_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+    spill=os.environ.get("NAO_SQL_CACHE_SPILL", "").lower() in ("1", "true"),
+)
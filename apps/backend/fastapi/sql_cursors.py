@@ -0,0 +1,109 @@
+"""Open result cursors of `/execute_sql`, kept between pages of a result."""
+
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+
+from ibis import BaseBackend
+from nao_core.config import connection_registry
+from nao_core.config.databases.base import DatabaseConfig
+
+from sql_results import ArrowStream
+
+
+@dataclass
+class OpenCursor:
+    """A partially read result, holding the connection it runs on until it is closed."""
+
+    config: DatabaseConfig
+    conn: BaseBackend
+    stream: ArrowStream
+    max_rows: int | None
+    page_size: int | None
+    expires_at: float = field(default=0.0)
+
+    def remaining_rows(self) -> int | None:
+        """Rows that may still be returned under `max_rows`, or None when uncapped."""
+        return None if self.max_rows is None else max(self.max_rows - self.stream.rows_read, 0)
+
+    def close(self) -> None:
+        connection_registry.release(self.conn)
+
+
+@dataclass
+class PendingCursor:
+    """The rest of a result whose first page was served from the result cache.
+
+    It holds no connection: the query runs again when the cursor is resumed,
+    skipping the `skip_rows` rows already returned.
+    """
+
+    config: DatabaseConfig
+    sql: str
+    skip_rows: int
+    max_rows: int | None
+    page_size: int | None
+    expires_at: float = field(default=0.0)
+
+    def close(self) -> None:
+        pass
+
+
+class CursorStore:
+    """Keeps open cursors between the pages of their results, keyed by continuation token.
+
+    A cursor is taken out of the store while a page is read, so a token is only
+    used by one request at a time. Cursors not resumed within `ttl` seconds are
+    closed, and when more than `max_open` cursors are open the ones closest to
+    expiry are closed first. Closing a cursor returns its connection to the
+    connection registry.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_open: int = 32):
+        self.ttl = ttl
+        self.max_open = max_open
+        self._lock = threading.Lock()
+        self._cursors: dict[str, OpenCursor | PendingCursor] = {}
+
+    def put(self, cursor: OpenCursor | PendingCursor, token: str | None = None) -> str:
+        """Store a cursor and return its continuation token."""
+        token = token or secrets.token_urlsafe(16)
+        cursor.expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._cursors[token] = cursor
+            overflow = sorted(self._cursors.items(), key=lambda item: item[1].expires_at)
+            overflow = overflow[: max(len(self._cursors) - self.max_open, 0)]
+            for evicted_token, _ in overflow:
+                del self._cursors[evicted_token]
+        for _, evicted in overflow:
+            evicted.close()
+        self.evict_expired()
+        return token
+
+    def take(self, token: str) -> OpenCursor | PendingCursor | None:
+        """Remove and return the cursor of a token, or None when it is unknown or expired."""
+        self.evict_expired()
+        with self._lock:
+            return self._cursors.pop(token, None)
+
+    def evict_expired(self) -> int:
+        """Close cursors that were not resumed in time. Returns how many were closed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [token for token, cursor in self._cursors.items() if cursor.expires_at < now]
+            closed = [self._cursors.pop(token) for token in expired]
+        for cursor in closed:
+            cursor.close()
+        return len(closed)
+
+    def close(self) -> None:
+        """Close every open cursor."""
+        with self._lock:
+            closed = list(self._cursors.values())
+            self._cursors.clear()
+        for cursor in closed:
+            cursor.close()
+
+
+result_cursors = CursorStore()
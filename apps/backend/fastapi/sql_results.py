@@ -0,0 +1,192 @@
+"""Fetch SQL results as Arrow tables and serialize them for `/execute_sql`."""
+
+import datetime
+import decimal
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from nao_core.config.databases.preview import json_safe_value
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: fall back to the standard library encoder
+    orjson = None
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def fetch_arrow(cursor: Any) -> pa.Table:
+    """Fetch the whole result of a `raw_sql` cursor as an Arrow table.
+
+    Each driver's native Arrow fetch is used when available (DuckDB, Snowflake,
+    Databricks, BigQuery), so no per-row Python objects are created. Other
+    DB-API cursors are fetched as tuples and converted column by column.
+    """
+    if hasattr(cursor, "fetch_arrow_table"):
+        # DuckDB
+        return cursor.fetch_arrow_table()
+    if hasattr(cursor, "fetch_arrow_all"):
+        # Snowflake returns None when the result is empty
+        table = cursor.fetch_arrow_all()
+        if table is not None:
+            return table
+        return _empty_table(cursor.description)
+    if hasattr(cursor, "fetchall_arrow"):
+        # Databricks
+        return cursor.fetchall_arrow()
+    if hasattr(cursor, "to_arrow"):
+        # BigQuery query job
+        return cursor.to_arrow()
+
+    names = [desc[0] for desc in cursor.description] if cursor.description else []
+    rows = cursor.fetchall()
+    columns = list(zip(*rows)) if rows else [() for _ in names]
+    return pa.table({name: _to_arrow_array(list(values)) for name, values in zip(names, columns)})
+
+
+def iter_arrow_batches(cursor: Any, batch_size: int) -> Iterator[pa.RecordBatch | pa.Table]:
+    """Stream the result of a `raw_sql` cursor as Arrow batches of about `batch_size` rows.
+
+    Rows are pulled from the driver as batches are consumed, with each driver's
+    streaming API (DuckDB record batch readers, Snowflake result chunks,
+    Databricks `fetchmany_arrow`, BigQuery result pages), or `fetchmany` for
+    other DB-API cursors. Some drivers choose their own batch sizes.
+    """
+    if hasattr(cursor, "fetch_record_batch"):
+        # DuckDB
+        yield from cursor.fetch_record_batch(batch_size)
+    elif hasattr(cursor, "fetch_arrow_batches"):
+        # Snowflake
+        yield from cursor.fetch_arrow_batches()
+    elif hasattr(cursor, "fetchmany_arrow"):
+        # Databricks
+        while (batch := cursor.fetchmany_arrow(batch_size)).num_rows:
+            yield batch
+    elif hasattr(cursor, "to_arrow_iterable"):
+        # BigQuery row iterator
+        yield from cursor.to_arrow_iterable()
+    elif hasattr(cursor, "result") and hasattr(cursor, "to_arrow"):
+        # BigQuery query job
+        yield from cursor.result(page_size=batch_size).to_arrow_iterable()
+    else:
+        names = [desc[0] for desc in cursor.description] if cursor.description else []
+        while rows := cursor.fetchmany(batch_size):
+            yield pa.table({name: _to_arrow_array(list(values)) for name, values in zip(names, zip(*rows))})
+
+
+class ArrowStream:
+    """Reads a stream of Arrow batches a given number of rows at a time."""
+
+    def __init__(self, batches: Iterator[pa.RecordBatch | pa.Table], description: Any = None):
+        self._batches = batches
+        self._pending: list[pa.Table] = []
+        self._description = description
+        self._schema: pa.Schema | None = None
+        self.rows_read = 0
+        self.exhausted = False
+
+    def _pull(self) -> bool:
+        for batch in self._batches:
+            if batch.num_rows == 0:
+                self._schema = self._schema or batch.schema
+                continue
+            table = batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+            self._schema = self._schema or table.schema
+            self._pending.append(table)
+            return True
+        self.exhausted = True
+        return False
+
+    def has_more(self) -> bool:
+        """Whether rows are left to read, fetching the next batch if needed."""
+        return bool(self._pending) or (not self.exhausted and self._pull())
+
+    def read(self, max_rows: int) -> pa.Table:
+        """Read up to `max_rows` rows."""
+        parts: list[pa.Table] = []
+        remaining = max_rows
+        while remaining > 0 and self.has_more():
+            table = self._pending.pop(0)
+            if table.num_rows > remaining:
+                self._pending.insert(0, table.slice(remaining))
+                table = table.slice(0, remaining)
+            parts.append(table)
+            remaining -= table.num_rows
+
+        self.rows_read += max_rows - remaining
+        if not parts:
+            if self._schema is not None:
+                return self._schema.empty_table()
+            return _empty_table(self._description)
+        return pa.concat_tables(parts, promote_options="permissive") if len(parts) > 1 else parts[0]
+
+
+def _empty_table(description: Any) -> pa.Table:
+    names = [desc[0] for desc in description] if description else []
+    return pa.table({name: pa.array([], pa.null()) for name in names})
+
+
+def _to_arrow_array(values: list[Any]) -> pa.Array:
+    try:
+        return pa.array(values)
+    except (pa.ArrowException, TypeError, ValueError):
+        # Columns mixing incompatible types are sent as strings
+        return pa.array([None if value is None else str(json_safe_value(value)) for value in values], pa.string())
+
+
+def _json_column(column: pa.ChunkedArray) -> list[Any]:
+    # Decimals are sent as JSON numbers, as the pandas-based path did
+    if pa.types.is_decimal(column.type):
+        column = pc.cast(column, pa.float64())
+    # NaN is not valid JSON: send it as null
+    if pa.types.is_floating(column.type):
+        column = pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+    return column.to_pylist()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode(errors="replace")
+    return str(value)
+
+
+def arrow_to_json(table: pa.Table, **extra: Any) -> bytes:
+    """Serialize an Arrow table to the `/execute_sql` JSON payload.
+
+    Columns are converted to Python lists one at a time and zipped into rows,
+    and the payload is encoded in a single call (with orjson when installed).
+    `extra` fields are added to the payload.
+    """
+    names = [str(name) for name in table.column_names]
+    columns = [_json_column(column) for column in table.columns]
+    data = [dict(zip(names, row)) for row in zip(*columns)]
+    payload = {"data": data, "row_count": table.num_rows, "columns": names, **extra}
+
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default)
+    return json.dumps(payload, default=_json_default).encode()
+
+
+def arrow_to_ipc(table: pa.Table) -> bytes:
+    """Serialize an Arrow table to the Arrow IPC streaming format."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def wants_arrow(accept: str | None) -> bool:
+    """Whether the request's Accept header asks for an Arrow IPC stream."""
+    if not accept:
+        return False
+    return any(part.split(";")[0].strip() == ARROW_STREAM_MEDIA_TYPE for part in accept.split(","))
@@ -1,11 +1,21 @@
+import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
+import duckdb
+import pyarrow as pa
 import pytest
 import yaml
 from fastapi.testclient import TestClient
+from nao_core.config import NaoConfig, connection_registry
 
-from main import app
+import main
+from config_cache import config_cache
+from main import ExecuteSQLRequest, RunningQuery, _execute_sql, app
+from sql_cache import ResultCache, result_cache
 
 
 def assert_sql_result(data: dict, *, row_count: int, columns: list[str], expected_data: list[dict]):
@@ -78,6 +88,330 @@ def test_execute_sql_with_cte_duckdb(duckdb_project_folder):
     )
 
 
+def test_execute_sql_reuses_pooled_connection_duckdb(duckdb_project_folder):
+    """Consecutive requests should run on the same warm connection."""
+    client = TestClient(app)
+
+    try:
+        response = client.post(
+            "/execute_sql",
+            json={
+                "sql": "CREATE TABLE pooled AS SELECT 42 AS answer",
+                "nao_project_folder": duckdb_project_folder,
+            },
+        )
+        assert response.status_code == 200
+
+        response = client.post(
+            "/execute_sql",
+            json={
+                "sql": "SELECT answer FROM pooled",
+                "nao_project_folder": duckdb_project_folder,
+            },
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == [{"answer": 42}]
+    finally:
+        connection_registry.close()
+
+
+def test_execute_sql_serializes_arrow_types_duckdb(duckdb_project_folder):
+    """Decimals, dates and NaN should be serialized as JSON numbers, ISO strings and null."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT 1.5::DECIMAL(10, 2) AS amount, DATE '2024-01-31' AS day, 'nan'::DOUBLE AS ratio",
+            "nao_project_folder": duckdb_project_folder,
+        },
+    )
+
+    assert response.status_code == 200
+    assert_sql_result(
+        response.json(),
+        row_count=1,
+        columns=["amount", "day", "ratio"],
+        expected_data=[{"amount": 1.5, "day": "2024-01-31", "ratio": None}],
+    )
+
+
+def test_execute_sql_returns_arrow_stream_duckdb(duckdb_project_folder):
+    """Callers accepting Arrow should get an Arrow IPC stream."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        headers={"Accept": "application/vnd.apache.arrow.stream"},
+        json={
+            "sql": "SELECT * FROM range(3) t(id)",
+            "nao_project_folder": duckdb_project_folder,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column_names == ["id"]
+    assert table.column("id").to_pylist() == [0, 1, 2]
+
+
+def test_execute_sql_max_rows_truncates_duckdb(duckdb_project_folder):
+    """max_rows should cap the result and flag it as truncated."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT * FROM range(100) t(id)",
+            "nao_project_folder": duckdb_project_folder,
+            "max_rows": 5,
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [row["id"] for row in data["data"]] == [0, 1, 2, 3, 4]
+    assert data["truncated"] is True
+    assert data["next_cursor"] is None
+
+
+def test_execute_sql_applies_default_row_cap_duckdb(duckdb_project_folder, monkeypatch):
+    """Queries without max_rows or page_size should be capped at NAO_SQL_MAX_ROWS."""
+    monkeypatch.setattr(main, "DEFAULT_MAX_ROWS", 3)
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={"sql": "SELECT * FROM range(10) t(id)", "nao_project_folder": duckdb_project_folder},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["row_count"] == 3
+    assert data["truncated"] is True
+
+
+def test_execute_sql_pages_through_result_duckdb(duckdb_project_folder):
+    """page_size should return pages linked by continuation cursors."""
+    client = TestClient(app)
+    request = {
+        "sql": "SELECT * FROM range(25) t(id)",
+        "nao_project_folder": duckdb_project_folder,
+        "page_size": 10,
+    }
+
+    ids, page_sizes = [], []
+    while True:
+        response = client.post("/execute_sql", json=request)
+        assert response.status_code == 200
+        data = response.json()
+        ids.extend(row["id"] for row in data["data"])
+        page_sizes.append(data["row_count"])
+        if data["next_cursor"] is None:
+            assert data["truncated"] is False
+            break
+        assert data["truncated"] is True
+        request = {**request, "cursor": data["next_cursor"]}
+
+    assert ids == list(range(25))
+    assert page_sizes == [10, 10, 5]
+
+
+def test_execute_sql_caches_first_page_duckdb(duckdb_project_folder):
+    """The first page of a paged query should be cached, and paging should resume after a cache hit."""
+    client = TestClient(app)
+    result_cache.invalidate()
+    request = {
+        "sql": "SELECT * FROM range(25) t(id) ORDER BY id",
+        "nao_project_folder": duckdb_project_folder,
+        "page_size": 10,
+    }
+
+    first = client.post("/execute_sql", json=request)
+    hit = client.post("/execute_sql", json=request)
+    other_size = client.post("/execute_sql", json={**request, "page_size": 20})
+
+    assert first.headers["x-cache"] == "MISS"
+    assert hit.headers["x-cache"] == "HIT"
+    assert other_size.headers["x-cache"] == "MISS"
+    assert hit.json()["data"] == first.json()["data"]
+    assert hit.json()["truncated"] is True
+
+    second = client.post("/execute_sql", json={**request, "cursor": hit.json()["next_cursor"]})
+    assert second.headers["x-cache"] == "BYPASS"
+    assert [row["id"] for row in second.json()["data"]] == list(range(10, 20))
+    assert second.json()["next_cursor"] is not None
+
+
+def test_execute_sql_unknown_cursor_duckdb(duckdb_project_folder):
+    """An unknown or expired cursor should ask the caller to run the query again."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT 1",
+            "nao_project_folder": duckdb_project_folder,
+            "cursor": "unknown",
+        },
+    )
+
+    assert response.status_code == 410
+
+
+def test_execute_sql_caches_config_until_it_changes(duckdb_project_folder):
+    """The config should be parsed once, and again only after nao_config.yaml changes."""
+    client = TestClient(app)
+    request = {"sql": "SELECT 1 AS id", "nao_project_folder": duckdb_project_folder}
+    config_cache.invalidate()
+
+    with patch.object(NaoConfig, "load", wraps=NaoConfig.load) as load:
+        assert client.post("/execute_sql", json=request).status_code == 200
+        assert client.post("/execute_sql", json=request).status_code == 200
+        assert load.call_count == 1
+
+        config_path = Path(duckdb_project_folder) / "nao_config.yaml"
+        config = yaml.safe_load(config_path.read_text())
+        config["databases"][0]["name"] = "renamed-duckdb"
+        config_path.write_text(yaml.dump(config))
+        os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000))
+
+        response = client.post("/execute_sql", json={**request, "database_id": "renamed-duckdb"})
+        assert response.status_code == 200
+        assert load.call_count == 2
+
+
+def test_running_query_can_be_cancelled_duckdb(duckdb_project_folder):
+    """Cancelling a running query should interrupt it in its worker thread."""
+    run = RunningQuery()
+    request = ExecuteSQLRequest(
+        sql="SELECT count(*) FROM range(10000000000) t(i) WHERE i % 7 = 3",
+        nao_project_folder=duckdb_project_folder,
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(_execute_sql, request, run, None)
+        deadline = time.monotonic() + 10
+        while not future.done() and time.monotonic() < deadline:
+            run.cancel()
+            time.sleep(0.05)
+
+        with pytest.raises(Exception):
+            future.result(timeout=0)
+
+    assert run.cancel() is False
+
+
+def test_execute_sql_caches_select_results_duckdb(duckdb_project_folder):
+    """Repeated SELECT queries should be served from the result cache until it is invalidated."""
+    client = TestClient(app)
+    result_cache.invalidate()
+
+    try:
+        client.post(
+            "/execute_sql",
+            json={"sql": "CREATE TABLE counter AS SELECT 1 AS n", "nao_project_folder": duckdb_project_folder},
+        )
+        first = client.post(
+            "/execute_sql",
+            json={"sql": "SELECT n FROM counter", "nao_project_folder": duckdb_project_folder},
+        )
+        client.post(
+            "/execute_sql",
+            json={"sql": "UPDATE counter SET n = 2", "nao_project_folder": duckdb_project_folder},
+        )
+        # Same query, formatted differently
+        second = client.post(
+            "/execute_sql",
+            json={"sql": "select n\nfrom counter", "nao_project_folder": duckdb_project_folder},
+        )
+        bypass = client.post(
+            "/execute_sql",
+            json={"sql": "SELECT n FROM counter", "nao_project_folder": duckdb_project_folder, "use_cache": False},
+        )
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json()["data"] == [{"n": 1}]
+        assert bypass.headers["x-cache"] == "BYPASS"
+        assert bypass.json()["data"] == [{"n": 2}]
+
+        result_cache.invalidate()
+        third = client.post(
+            "/execute_sql",
+            json={"sql": "SELECT n FROM counter", "nao_project_folder": duckdb_project_folder},
+        )
+        assert third.headers["x-cache"] == "MISS"
+        assert third.json()["data"] == [{"n": 2}]
+    finally:
+        connection_registry.close()
+
+
+def test_result_cache_spills_evicted_results(tmp_path):
+    """Results evicted from memory should be read back from their Parquet spill files."""
+    cache = ResultCache(ttl=60, max_bytes=100, spill=True)
+    first = pa.table({"id": list(range(10))})
+    second = pa.table({"id": list(range(10, 20))})
+
+    cache.put("first", tmp_path, first, truncated=True)
+    cache.put("second", tmp_path, second, truncated=False)
+
+    assert cache.stats()["entries"] == 1
+    spilled = cache.get("first", tmp_path)
+    assert spilled is not None
+    assert spilled.table.column("id").to_pylist() == list(range(10))
+    assert spilled.truncated is True
+
+    cache.invalidate()
+    assert cache.get("first", tmp_path) is None
+    assert list((tmp_path / ".nao" / "cache" / "sql").glob("*.parquet")) == []
+
+
+def test_result_cache_clears_spill_files_of_earlier_versions(tmp_path):
+    """Files spilled before a restart should be deleted once the project's spill folder is used again."""
+    before_restart = ResultCache(ttl=60, max_bytes=0, spill=True)
+    before_restart.put("old", tmp_path, pa.table({"id": [1]}), truncated=False)
+    spill_dir = tmp_path / ".nao" / "cache" / "sql"
+    assert [path.name for path in spill_dir.glob("*.parquet")] == ["old.parquet"]
+
+    after_restart = ResultCache(ttl=60, max_bytes=0, spill=True)
+    assert after_restart.get("new", tmp_path) is None
+    assert list(spill_dir.glob("*.parquet")) == []
+
+    after_restart.put("new", tmp_path, pa.table({"id": [2]}), truncated=False)
+    after_restart.invalidate()
+    assert list(spill_dir.glob("*.parquet")) == []
+
+
+def test_execute_sql_resolves_paths_against_project_folder(tmp_path, monkeypatch):
+    """Relative database paths should resolve against the project folder, whatever the working directory."""
+    project = tmp_path / "project"
+    project.mkdir()
+    duckdb.connect(str(project / "local.duckdb")).execute("CREATE TABLE answers AS SELECT 42 AS answer").close()
+    (project / "nao_config.yaml").write_text(
+        yaml.dump(
+            {
+                "project_name": "test-project",
+                "databases": [{"name": "local", "type": "duckdb", "path": "local.duckdb"}],
+            }
+        )
+    )
+    monkeypatch.chdir(tmp_path)
+    client = TestClient(app)
+
+    try:
+        response = client.post(
+            "/execute_sql",
+            json={"sql": "SELECT answer FROM answers", "nao_project_folder": str(project)},
+        )
+        assert response.status_code == 200
+        assert response.json()["data"] == [{"answer": 42}]
+        assert Path.cwd() == tmp_path
+    finally:
+        connection_registry.close()
+
+
 # BigQuery tests (requires SSO authentication)
 
 @pytest.fixture
@@ -5,7 +5,13 @@ import { tool } from 'ai';
 import { env } from '../../env';
 import { getProjectFolder } from '../../utils/tools';
 
-export async function executeQuery({ sql_query, database_id }: executeSql.Input): Promise<executeSql.Output> {
+/** Rows returned per call, so a large result never lands in the model context at once. */
+const PAGE_SIZE = 1000;
+
+export async function executeQuery(
+	{ sql_query, database_id, cursor }: executeSql.Input,
+	{ pageSize = PAGE_SIZE }: { pageSize?: number | null } = {},
+): Promise<executeSql.Output> {
 	const naoProjectFolder = getProjectFolder();
 
 	const response = await fetch(`${env.FASTAPI_URL}/execute_sql`, {
@@ -16,7 +22,9 @@ export async function executeQuery({ sql_query, database_id }: executeSql.Input)
 		body: JSON.stringify({
 			sql: sql_query,
 			nao_project_folder: naoProjectFolder,
+			...(pageSize && { page_size: pageSize }),
 			...(database_id && { database_id }),
+			...(cursor && { cursor }),
 		}),
 	});
 
@@ -34,8 +42,10 @@ export async function executeQuery({ sql_query, database_id }: executeSql.Input)
 
 export default tool({
 	description:
-		'Execute a SQL query against the connected database and return the results. If multiple databases are configured, specify the database_id.',
+		'Execute a SQL query against the connected database and return the results. If multiple databases are configured, specify the database_id. ' +
+		`At most ${PAGE_SIZE} rows are returned per call: when \`truncated\` is true, more rows exist, and calling the tool again with \`cursor\` set to \`next_cursor\` returns the next page. Prefer aggregating or filtering in SQL over paging through raw rows.`,
 	inputSchema: schemas.InputSchema,
 	outputSchema: schemas.OutputSchema,
-	execute: executeQuery,
+	// The SDK passes its call options as the second argument, so they must not reach `executeQuery`
+	execute: (input) => executeQuery(input),
 });
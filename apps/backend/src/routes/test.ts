@@ -46,7 +46,11 @@ export const testRoutes = async (app: App) => {
 
 				let verification;
 				if (sql) {
-					const { data: expectedData, columns: expectedColumns } = await executeQuery({ sql_query: sql });
+					const { data: expectedData, columns: expectedColumns } = await executeQuery(
+						{ sql_query: sql },
+						// Expected results are compared whole, not paged
+						{ pageSize: null },
+					);
 					const { data } = await testAgentService.runVerification(
 						projectId,
 						result,
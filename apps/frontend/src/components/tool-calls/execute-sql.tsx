@@ -47,7 +47,7 @@ export const ExecuteSqlToolCall = () => {
 					<span className='text-xs font-normal truncate'>{input?.sql_query}</span>
 				</span>
 			}
-			badge={output?.row_count && `${output.row_count} rows`}
+			badge={output?.row_count && `${output.row_count}${output.truncated ? '+' : ''} rows`}
 			actions={isSettled ? actions : []}
 		>
 			{viewMode === 'query' && input?.sql_query ? (
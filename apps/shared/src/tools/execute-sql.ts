@@ -6,12 +6,20 @@ export const InputSchema = z.object({
 		.string()
 		.optional()
 		.describe('The database name/id to use. Required if multiple databases are configured.'),
+	cursor: z
+		.string()
+		.optional()
+		.describe('The `next_cursor` of a previous result, to fetch its next page of rows. Pass the same sql_query.'),
 });
 
 export const OutputSchema = z.object({
 	data: z.array(z.any()),
 	row_count: z.number(),
 	columns: z.array(z.string()),
+	/** Whether the query returned more rows than `data` holds. */
+	truncated: z.boolean().optional(),
+	/** Cursor to pass back as `cursor` to fetch the next page of rows, if any. */
+	next_cursor: z.string().nullable().optional(),
 	/** The id of the query result. May be referenced by the `display_chart` tool call. */
 	id: z.custom<`query_${string}`>(),
 });
@@ -13,6 +13,7 @@ from nao_core.tracking import track_command
 
 from .providers import (
     PROVIDER_CHOICES,
+    DatabaseSyncProvider,
     ProviderSelection,
     SyncResult,
     get_all_providers,
@@ -32,6 +33,37 @@ def sync(
             help=f"Provider(s) to sync. Use `-p provider:name` to sync a specific connection (e.g. databases:my-db). Or just `-p databases` to sync all connections. Options: {', '.join(PROVIDER_CHOICES)}",
         ),
     ] = None,
+    jobs: Annotated[
+        int | None,
+        Parameter(
+            name=["-j", "--jobs"],
+            help="Number of tables to sync in parallel per database connection. Overrides `sync_concurrency` from nao_config.yaml.",
+        ),
+    ] = None,
+    parallel_connections: Annotated[
+        int | None,
+        Parameter(
+            help="Number of database connections to sync at the same time (default: 1).",
+        ),
+    ] = None,
+    incremental: Annotated[
+        bool | None,
+        Parameter(
+            help="Skip database tables whose fingerprint did not change since the last sync. Overrides `incremental` from nao_config.yaml.",
+        ),
+    ] = None,
+    pipelined: Annotated[
+        bool | None,
+        Parameter(
+            help="Prefetch table metadata while earlier tables are rendered and written. Overrides `pipelined` from nao_config.yaml.",
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        Parameter(
+            help="Continue an interrupted database sync from its checkpoint, skipping tables it already rendered.",
+        ),
+    ] = False,
     output_dirs: Annotated[dict[str, str] | None, Parameter(show=False)] = None,
     _providers: Annotated[list[ProviderSelection] | None, Parameter(show=False)] = None,
     render_templates: bool = True,
@@ -56,6 +88,25 @@ def sync(
 
     console.print(f"[dim]Project:[/dim] {config.project_name}")
 
+    if jobs is not None:
+        if jobs < 1:
+            console.print("[red]Error:[/red] --jobs must be at least 1")
+            sys.exit(1)
+        for db in config.databases:
+            db.sync_concurrency = jobs
+
+    if parallel_connections is not None and parallel_connections < 1:
+        console.print("[red]Error:[/red] --parallel-connections must be at least 1")
+        sys.exit(1)
+
+    if incremental is not None:
+        for db in config.databases:
+            db.incremental = incremental
+
+    if pipelined is not None:
+        for db in config.databases:
+            db.pipelined = pipelined
+
     # Resolve providers: CLI names > programmatic providers > all providers
     if provider:
         try:
@@ -68,6 +119,14 @@ def sync(
     else:
         active_providers = get_all_providers()
 
+    if parallel_connections is not None or resume:
+        for selection in active_providers:
+            if isinstance(selection.provider, DatabaseSyncProvider):
+                selection.provider = DatabaseSyncProvider(
+                    max_parallel_connections=parallel_connections or selection.provider.max_parallel_connections,
+                    resume=resume,
+                )
+
     output_dirs = output_dirs or {}
 
     # Run each provider
@@ -33,18 +33,42 @@ class DatabaseSyncState:
     tables_synced: int = 0
     """Count of tables synced"""
 
-    def add_table(self, schema: str, table: str) -> None:
+    tables_unchanged: int = 0
+    """Count of synced tables skipped by incremental sync because nothing changed"""
+
+    cache_hits: int = 0
+    """Count of table metadata calls served from the per-table cache"""
+
+    cache_misses: int = 0
+    """Count of table metadata calls that queried the database"""
+
+    files_written: int = 0
+    """Count of output files created or rewritten because their content changed"""
+
+    files_unchanged: int = 0
+    """Count of rendered output files left untouched because their content was identical"""
+
+    tables_resumed: int = 0
+    """Count of synced tables skipped because an interrupted sync already rendered them"""
+
+    def add_table(self, schema: str, table: str, unchanged: bool = False, resumed: bool = False) -> None:
         """Record that a table was synced.
 
         Args:
             schema: The schema/dataset name
             table: The table name
+            unchanged: Whether the table was left as-is by an incremental sync
+            resumed: Whether the table was rendered by the interrupted sync being resumed
         """
         self.synced_schemas.add(schema)
         if schema not in self.synced_tables:
             self.synced_tables[schema] = set()
         self.synced_tables[schema].add(table)
         self.tables_synced += 1
+        if resumed:
+            self.tables_resumed += 1
+        elif unchanged:
+            self.tables_unchanged += 1
 
     def add_schema(self, schema: str) -> None:
         """Record that a schema was synced (even if empty).
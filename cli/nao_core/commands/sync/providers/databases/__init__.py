@@ -1,6 +1,7 @@
 """Database syncing functionality for generating markdown documentation from database schemas."""
 
-from .context import DatabaseContext
+from nao_core.config.databases.context import DatabaseContext
+
 from .provider import DatabaseSyncProvider, sync_database
 
 __all__ = [
@@ -0,0 +1,136 @@
+"""Checkpoint journal used to resume interrupted database syncs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import IO
+
+from nao_core.config.databases.base import DatabaseConfig
+
+CHECKPOINT_FILENAME = ".sync_checkpoint.jsonl"
+CHECKPOINT_VERSION = 1
+
+# Config fields that only change how a sync runs, not what it renders
+EXECUTION_FIELDS = {"sync_concurrency", "max_concurrent_queries", "pipelined", "incremental"}
+
+
+def compute_sync_generation(db_config: DatabaseConfig, templates_hash: str) -> str:
+    """Identify a sync by its connection settings and templates.
+
+    A checkpoint can only be resumed by a sync of the same generation: changing
+    the config (filters, row count mode, preview options...) or a template
+    means already-rendered tables would differ, so the sync starts over.
+    Execution settings (`--jobs`, `--pipelined`...) are left out, so a sync can
+    be resumed with different ones, e.g. fewer jobs after running out of memory.
+    """
+    config = db_config.model_dump(mode="json", exclude=EXECUTION_FIELDS)
+    payload = json.dumps({"config": config, "templates": templates_hash}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SyncCheckpoint:
+    """Append-only journal of the tables completed by an in-progress database sync.
+
+    Stored as a hidden JSON Lines file at the root of the database output folder
+    (e.g. databases/type=duckdb/database=mydb/.sync_checkpoint.jsonl). The first
+    line holds the sync generation, every following line a completed table. Lines
+    are flushed as they are written, so the journal survives the process dying
+    mid-sync, and the file is removed once the sync completes.
+    """
+
+    def __init__(self, db_path: Path, generation: str):
+        self.db_path = db_path
+        self.generation = generation
+        self.completed: dict[tuple[str, str], str | None] = {}
+        """Tables recorded by the resumed sync, mapped to their fingerprint (if any)"""
+
+        self._file: IO[str] | None = None
+
+    @property
+    def path(self) -> Path:
+        return self.db_path / CHECKPOINT_FILENAME
+
+    @classmethod
+    def open(cls, db_path: Path, generation: str, resume: bool = False) -> SyncCheckpoint:
+        """Start a journal for a new sync, or continue the existing one when `resume` is set.
+
+        An existing journal is only continued if it belongs to the same sync
+        generation; otherwise (or without `resume`) it is replaced.
+        """
+        checkpoint = cls(db_path, generation)
+        if resume:
+            checkpoint._load()
+
+        db_path.mkdir(parents=True, exist_ok=True)
+        if checkpoint.completed:
+            checkpoint._file = checkpoint.path.open("a", encoding="utf-8")
+        else:
+            checkpoint._file = checkpoint.path.open("w", encoding="utf-8")
+            checkpoint._append({"version": CHECKPOINT_VERSION, "generation": generation})
+        return checkpoint
+
+    def is_completed(self, schema: str, table: str) -> bool:
+        """Return whether the resumed sync already rendered a table."""
+        return (schema, table) in self.completed
+
+    def fingerprint(self, schema: str, table: str) -> str | None:
+        """Return the fingerprint recorded for a completed table, if any."""
+        return self.completed.get((schema, table))
+
+    def record(self, schema: str, table: str, fingerprint: str | None = None) -> None:
+        """Append a completed table to the journal."""
+        self.completed[(schema, table)] = fingerprint
+        self._append({"schema": schema, "table": table, "fingerprint": fingerprint})
+
+    def close(self) -> None:
+        """Close the journal, keeping it on disk so the sync can be resumed."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def complete(self) -> None:
+        """Close and remove the journal once every table was synced."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def _append(self, entry: dict) -> None:
+        assert self._file is not None
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+
+        try:
+            header = json.loads(lines[0]) if lines else None
+        except ValueError:
+            return
+        if (
+            not isinstance(header, dict)
+            or header.get("version") != CHECKPOINT_VERSION
+            or header.get("generation") != self.generation
+        ):
+            return
+
+        for line in lines[1:]:
+            # A crash can leave a partially written last line; ignore it
+            try:
+                entry = json.loads(line)
+                self.completed[(entry["schema"], entry["table"])] = entry.get("fingerprint")
+            except (ValueError, KeyError, TypeError):
+                continue
+
+        if self.completed:
+            # Make sure appended entries start on a new line
+            with self.path.open("rb+") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
@@ -0,0 +1,93 @@
+"""Fingerprint manifest used by incremental database sync."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from nao_core.commands.sync.writer import write_if_changed
+from nao_core.config.databases.catalog import TableMetadata
+from nao_core.templates.engine import TemplateEngine
+
+MANIFEST_FILENAME = ".sync_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _hash(payload: Any) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def compute_templates_hash(engine: TemplateEngine, templates: list[str]) -> str:
+    """Hash the names and sources of the templates, so editing a template invalidates the manifest."""
+    return _hash([[name, engine.get_source(name)] for name in templates])
+
+
+def compute_table_fingerprint(ctx: Any, metadata: TableMetadata | None, row_count_mode: str = "exact") -> str:
+    """Fingerprint a table from its columns, row count, last-modified time and size.
+
+    The row count, last-modified time and size come from catalog statistics.
+    Only when the catalog has neither a row count nor a last-modified time,
+    and row counts are exact, is the row count read from the context: the
+    rendered count would go stale otherwise. In the other cases the table is
+    fingerprinted without it, so deciding to skip a table never scans it.
+    """
+    row_count = metadata.row_count if metadata else None
+    last_modified = metadata.last_modified if metadata else None
+    if row_count is None and last_modified is None and row_count_mode == "exact":
+        row_count = ctx.row_count()
+
+    payload = {
+        "columns": [[col["name"], col["type"]] for col in ctx.columns()],
+        "row_count": row_count,
+        "last_modified": last_modified,
+    }
+    if metadata is not None and metadata.size_bytes is not None:
+        # Only some catalogs report sizes; leave the other fingerprints unchanged
+        payload["size_bytes"] = metadata.size_bytes
+    return _hash(payload)
+
+
+@dataclass
+class SyncManifest:
+    """Per-database record of the table fingerprints written by the last sync.
+
+    Stored as a hidden JSON file at the root of the database output folder
+    (e.g. databases/type=duckdb/database=mydb/.sync_manifest.json).
+    """
+
+    templates_hash: str
+    """Hash of the templates used to render the tables"""
+
+    tables: dict[str, str] = field(default_factory=dict)
+    """Dict mapping "schema.table" to the table fingerprint"""
+
+    @classmethod
+    def load(cls, db_path: Path) -> SyncManifest | None:
+        """Load the manifest of a database folder, or None if missing or unreadable."""
+        manifest_file = db_path / MANIFEST_FILENAME
+        try:
+            data = json.loads(manifest_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+
+        return cls(templates_hash=data.get("templates_hash", ""), tables=dict(data.get("tables", {})))
+
+    def save(self, db_path: Path) -> None:
+        """Write the manifest to the database folder."""
+        db_path.mkdir(parents=True, exist_ok=True)
+        data = {"version": MANIFEST_VERSION, "templates_hash": self.templates_hash, "tables": self.tables}
+        write_if_changed(db_path / MANIFEST_FILENAME, [json.dumps(data, indent=2, sort_keys=True)])
+
+    def get(self, schema: str, table: str) -> str | None:
+        """Return the recorded fingerprint of a table, if any."""
+        return self.tables.get(f"{schema}.{table}")
+
+    def set(self, schema: str, table: str, fingerprint: str) -> None:
+        """Record the fingerprint of a table."""
+        self.tables[f"{schema}.{table}"] = fingerprint
@@ -0,0 +1,185 @@
+"""Pipelined table sync: prefetch, render and write stages connected by bounded queues."""
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from rich.progress import Progress, TaskID
+
+_DONE = object()
+
+
+class PipelineAborted(Exception):
+    """Raised inside a stage when another stage failed and the pipeline is shutting down."""
+
+
+class StageMeter:
+    """Counts the items that went through a pipeline stage and shows its throughput."""
+
+    def __init__(self, progress: Progress, label: str):
+        self.label = label
+        self.count = 0
+        self._lock = threading.Lock()
+        self._progress = progress
+        self._started = time.monotonic()
+        self._task: TaskID = progress.add_task(self._description(), total=0)
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second since the stage started."""
+        elapsed = time.monotonic() - self._started
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def expect(self, total: int) -> None:
+        """Set the number of items the stage will process."""
+        self._progress.update(self._task, total=total)
+
+    def advance(self) -> None:
+        """Record one processed item."""
+        with self._lock:
+            self.count += 1
+            description = self._description()
+        self._progress.update(self._task, advance=1, description=description)
+
+    def _description(self) -> str:
+        return f"    [dim]{self.label} · {self.throughput:.1f} tables/s[/dim]"
+
+
+class SyncPipeline:
+    """Overlaps warehouse queries, template rendering and disk writes.
+
+    Items submitted from the calling thread go through three stages:
+
+    1. `prepare` runs in a pool of `workers` threads and fetches metadata,
+       so the warehouse stays busy while earlier tables are rendered.
+    2. `render` runs in a single thread and turns prepared items into content.
+    3. `write` runs in a single thread and writes the content to disk; its
+       result is passed to `on_done`, in the same thread.
+
+    Stages are connected by queues holding at most `queue_size` items, so a
+    slow stage holds back the ones before it instead of buffering every table
+    in memory. If a stage raises, the pipeline stops and `finish()` re-raises
+    the first error.
+    """
+
+    def __init__(
+        self,
+        prepare: Callable[[Any], Any],
+        render: Callable[[Any], Any],
+        write: Callable[[Any], Any],
+        on_done: Callable[[Any, Any], None],
+        progress: Progress,
+        workers: int = 1,
+        queue_size: int = 8,
+    ):
+        self._prepare = prepare
+        self._render = render
+        self._write = write
+        self._on_done = on_done
+
+        self._render_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._write_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._abort = threading.Event()
+        self._errors: list[BaseException] = []
+        self._futures: list[Future] = []
+        self._submitted = 0
+
+        self.meters = {
+            "prefetch": StageMeter(progress, "prefetch"),
+            "render": StageMeter(progress, "render"),
+            "write": StageMeter(progress, "write"),
+        }
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nao-sync-prefetch")
+        self._render_thread = threading.Thread(target=self._run_render, name="nao-sync-render", daemon=True)
+        self._write_thread = threading.Thread(target=self._run_write, name="nao-sync-write", daemon=True)
+        self._render_thread.start()
+        self._write_thread.start()
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for the prepare stage. Ignored once the pipeline failed; `finish()` raises the error."""
+        if self._abort.is_set():
+            return
+        self._submitted += 1
+        for meter in self.meters.values():
+            meter.expect(self._submitted)
+        self._futures.append(self._executor.submit(self._run_prepare, item))
+
+    def finish(self) -> None:
+        """Wait for every submitted item to be written, then stop the stages."""
+        try:
+            for future in self._futures:
+                future.exception()
+            self._put(self._render_queue, _DONE)
+        except PipelineAborted:
+            pass
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._render_thread.join()
+            self._write_thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+    def close(self) -> None:
+        """Stop the pipeline without waiting for pending items (e.g. on error)."""
+        self._abort.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._render_thread.join()
+        self._write_thread.join()
+
+    def _fail(self, error: BaseException) -> None:
+        if not isinstance(error, PipelineAborted):
+            self._errors.append(error)
+        self._abort.set()
+
+    def _put(self, target: queue.Queue, value: Any) -> None:
+        while True:
+            if self._abort.is_set():
+                raise PipelineAborted()
+            try:
+                target.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, source: queue.Queue) -> Any:
+        while True:
+            if self._abort.is_set():
+                raise PipelineAborted()
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def _run_prepare(self, item: Any) -> None:
+        try:
+            prepared = self._prepare(item)
+            self.meters["prefetch"].advance()
+            self._put(self._render_queue, (item, prepared))
+        except BaseException as e:
+            self._fail(e)
+
+    def _run_render(self) -> None:
+        try:
+            while (entry := self._get(self._render_queue)) is not _DONE:
+                item, prepared = entry
+                rendered = self._render(prepared)
+                self.meters["render"].advance()
+                self._put(self._write_queue, (item, rendered))
+            self._put(self._write_queue, _DONE)
+        except BaseException as e:
+            self._fail(e)
+
+    def _run_write(self) -> None:
+        try:
+            while (entry := self._get(self._write_queue)) is not _DONE:
+                item, rendered = entry
+                result = self._write(rendered)
+                self.meters["write"].advance()
+                self._on_done(item, result)
+        except BaseException as e:
+            self._fail(e)
@@ -1,22 +1,257 @@
 """Database sync provider implementation."""
 
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from ibis import BaseBackend
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TaskID, TaskProgressColumn, TextColumn
 
 from nao_core.commands.sync.cleanup import DatabaseSyncState, cleanup_stale_databases, cleanup_stale_paths
+from nao_core.commands.sync.writer import write_if_changed
 from nao_core.config import AnyDatabaseConfig, NaoConfig
 from nao_core.config.databases.base import DatabaseConfig
-from nao_core.templates.engine import get_template_engine
+from nao_core.config.databases.catalog import TableMetadata, query_errors
+from nao_core.config.databases.context import DatabaseContext
+from nao_core.config.databases.profile import ProfileOptions
+from nao_core.config.databases.registry import connection_registry
+from nao_core.templates.engine import TemplateEngine, get_template_engine
 
 from ..base import SyncProvider, SyncResult
-from .context import DatabaseContext
+from .checkpoint import SyncCheckpoint, compute_sync_generation
+from .manifest import SyncManifest, compute_table_fingerprint, compute_templates_hash
+from .pipeline import SyncPipeline
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 TEMPLATE_PREFIX = "databases"
+PROFILE_TEMPLATE = "profile.md.j2"
+
+
+class WorkerConnections:
+    """Lazily leases one backend connection per worker thread.
+
+    Ibis backends are not safe to share across threads, so each worker of the
+    sync pool gets its own connection, leased from the connection registry on
+    first use and released once the database sync is over.
+    """
+
+    def __init__(self, db_config: DatabaseConfig):
+        self._db_config = db_config
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: list[BaseBackend] = []
+
+    def get(self) -> BaseBackend:
+        """Return the connection bound to the calling thread, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connection_registry.acquire(self._db_config)
+            self._local.conn = conn
+            with self._lock:
+                self._opened.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Release every connection leased by the workers back to the registry."""
+        with self._lock:
+            opened, self._opened = self._opened, []
+        for conn in opened:
+            connection_registry.release(conn)
+
+
+@dataclass
+class TableSyncOutcome:
+    """Result of syncing a single table."""
+
+    rendered: bool = True
+    """Whether the templates were rendered (False when skipped as unchanged)"""
+
+    fingerprint: str | None = None
+    """Fingerprint of the table, computed only for incremental syncs"""
+
+    cache_hits: int = 0
+    """Context method calls served from the per-table metadata cache"""
+
+    cache_misses: int = 0
+    """Context method calls that had to query the database"""
+
+    files_written: int = 0
+    """Output files created or rewritten"""
+
+    files_unchanged: int = 0
+    """Rendered output files whose content was already up to date"""
+
+    resumed: bool = False
+    """Whether the table was skipped because the resumed sync already rendered it"""
+
+
+@dataclass
+class PreparedTable:
+    """A table whose database context is ready to be rendered."""
+
+    schema: str
+    table: str
+    table_path: Path
+    ctx: Any
+    fingerprint: str | None = None
+    unchanged: bool = False
+    """Whether incremental sync found the table unchanged, so rendering can be skipped"""
+
+    def outcome(self, files_written: int = 0, files_unchanged: int = 0) -> TableSyncOutcome:
+        """Build the sync outcome of the table, including its context cache counters."""
+        return TableSyncOutcome(
+            rendered=not self.unchanged,
+            fingerprint=self.fingerprint,
+            cache_hits=getattr(self.ctx, "cache_hits", 0),
+            cache_misses=getattr(self.ctx, "cache_misses", 0),
+            files_written=files_written,
+            files_unchanged=files_unchanged,
+        )
+
+
+def list_database_templates(engine: TemplateEngine, db_config: DatabaseConfig) -> list[str]:
+    """Database templates rendered for a connection; profile.md is only written with profiling enabled."""
+    templates = engine.list_templates(TEMPLATE_PREFIX)
+    if not db_config.profile:
+        templates = [t for t in templates if Path(t).name != PROFILE_TEMPLATE]
+    return templates
+
+
+def _output_file(table_path: Path, template_name: str) -> Path:
+    # Derive output filename: "databases/columns.md.j2" → "columns.md"
+    return table_path / Path(template_name).stem  # "columns.md" (stem strips .j2)
+
+
+def prepare_table(
+    templates: list[str],
+    db_config: DatabaseConfig,
+    conn: BaseBackend,
+    schema: str,
+    table: str,
+    table_path: Path,
+    metadata: TableMetadata | None = None,
+    incremental: bool = False,
+    previous_fingerprint: str | None = None,
+    profile_options: ProfileOptions | None = None,
+) -> PreparedTable:
+    """Create the database context of a table and check whether it changed.
+
+    Every query of the context takes a query slot from the connection registry
+    while it runs. In incremental mode the table is fingerprinted, and marked unchanged when
+    the fingerprint matches the previous sync and all output files are still
+    on disk.
+    """
+    row_count_mode = db_config.row_count_mode
+    if row_count_mode == "estimate" and (metadata is None or metadata.row_count is None):
+        try:
+            with connection_registry.query_slot(db_config):
+                estimate = db_config.estimate_row_count(conn, schema, table)
+        except query_errors():
+            logger.debug("Could not estimate the row count of %s.%s", schema, table, exc_info=True)
+            estimate = None
+        if estimate is not None:
+            metadata = replace(metadata or TableMetadata(), row_count=estimate)
+
+    profile_options = profile_options or db_config.get_profile_options()
+
+    # Use custom context if database config provides one (e.g., for Redshift)
+    create_context = getattr(db_config, "create_context", None)
+    if create_context and callable(create_context):
+        ctx = create_context(
+            conn,
+            schema,
+            table,
+            metadata=metadata,
+            row_count_mode=row_count_mode,
+            preview_options=db_config.get_preview_options(),
+            profile_options=profile_options,
+        )
+    else:
+        ctx = DatabaseContext(
+            conn,
+            schema,
+            table,
+            metadata=metadata,
+            row_count_mode=row_count_mode,
+            preview_options=db_config.get_preview_options(),
+            profile_options=profile_options,
+        )
+
+    ctx.query_slot = partial(connection_registry.query_slot, db_config)
+
+    prepared = PreparedTable(schema=schema, table=table, table_path=table_path, ctx=ctx)
+    if incremental:
+        try:
+            prepared.fingerprint = compute_table_fingerprint(ctx, metadata, db_config.row_count_mode)
+        except query_errors():
+            logger.debug("Could not fingerprint %s.%s, syncing it again", schema, table, exc_info=True)
+            prepared.fingerprint = None
+
+        prepared.unchanged = bool(
+            prepared.fingerprint
+            and prepared.fingerprint == previous_fingerprint
+            and all(_output_file(table_path, t).exists() for t in templates)
+        )
+    return prepared
+
+
+def render_table(
+    engine: TemplateEngine,
+    templates: list[str],
+    db_config: DatabaseConfig,
+    conn: BaseBackend,
+    schema: str,
+    table: str,
+    table_path: Path,
+    metadata: TableMetadata | None = None,
+    incremental: bool = False,
+    previous_fingerprint: str | None = None,
+    profile_options: ProfileOptions | None = None,
+) -> TableSyncOutcome:
+    """Render every database template for a single table into its output folder.
+
+    Tables found unchanged by incremental sync are skipped (see `prepare_table`).
+    """
+    prepared = prepare_table(
+        templates,
+        db_config,
+        conn,
+        schema,
+        table,
+        table_path,
+        metadata=metadata,
+        incremental=incremental,
+        previous_fingerprint=previous_fingerprint,
+        profile_options=profile_options,
+    )
+    if prepared.unchanged:
+        return prepared.outcome()
+
+    table_path.mkdir(parents=True, exist_ok=True)
+
+    files_written = files_unchanged = 0
+    for template_name in templates:
+        output_file = _output_file(table_path, template_name)
+        try:
+            written = write_if_changed(
+                output_file, engine.stream(template_name, db=prepared.ctx, table_name=table, dataset=schema)
+            )
+        except Exception as e:
+            written = write_if_changed(output_file, [f"# {table}\n\nError generating content: {e}"])
+
+        if written:
+            files_written += 1
+        else:
+            files_unchanged += 1
+
+    return prepared.outcome(files_written, files_unchanged)
 
 
 def sync_database(
@@ -24,77 +259,290 @@ def sync_database(
     base_path: Path,
     progress: Progress,
     project_path: Path | None = None,
+    resume: bool = False,
 ) -> DatabaseSyncState:
-    """Sync a single database by rendering all database templates for each table."""
+    """Sync a single database by rendering all database templates for each table.
+
+    Schemas that no include/exclude pattern can match are skipped. Each other
+    schema is discovered first: its tables are listed (with the patterns pushed
+    down to the catalog query when the backend supports it), and column metadata
+    is bulk-loaded once per schema when the backend supports it. When the
+    connection allows more than one sync worker, schemas are discovered and
+    tables rendered in a thread pool where each worker uses its own connection;
+    otherwise everything runs on the calling thread's connection. Progress and
+    sync state are only ever updated from the calling thread. Every schema
+    discovery and every query of a table's context takes a query slot from the
+    connection registry, so `max_concurrent_queries` caps the queries in flight
+    on the connection, whichever stage runs them.
+
+    With `pipelined` enabled, tables go through a `SyncPipeline` instead:
+    worker threads prefetch the metadata of upcoming tables while a render
+    thread and a write thread process earlier ones, and sync state is updated
+    from the write thread.
+
+    With `incremental` enabled on the connection, table fingerprints are kept
+    in a manifest next to the synced schemas and unchanged tables are skipped.
+    Catalog statistics (row counts, modification times) are loaded per schema
+    for incremental syncs and for the `estimate` row count mode.
+
+    Completed tables are recorded in a checkpoint journal, removed once the
+    database is fully synced. With `resume`, tables recorded by an interrupted
+    sync of the same generation (same config and templates) are not rendered
+    again, but still count as synced so stale path cleanup sees all of them.
+    """
     engine = get_template_engine(project_path)
-    templates = engine.list_templates(TEMPLATE_PREFIX)
+    templates = list_database_templates(engine, db_config)
 
-    conn = db_config.connect()
     db_name = db_config.get_database_name()
     db_path = base_path / f"type={db_config.type}" / f"database={db_name}"
     state = DatabaseSyncState(db_path=db_path)
 
-    schemas = db_config.get_schemas(conn)
+    templates_hash = compute_templates_hash(engine, templates)
+    manifest: SyncManifest | None = None
+    previous_manifest: SyncManifest | None = None
+    if db_config.incremental:
+        manifest = SyncManifest(templates_hash=templates_hash)
+        previous_manifest = SyncManifest.load(db_path)
+        if previous_manifest and previous_manifest.templates_hash != templates_hash:
+            previous_manifest = None
+
+    checkpoint = SyncCheckpoint.open(db_path, compute_sync_generation(db_config, templates_hash), resume=resume)
+    # Shared by every table, so the profiling bytes budget covers the whole connection
+    profile_options = db_config.get_profile_options()
+    jobs = db_config.get_sync_concurrency()
+    worker_connections = WorkerConnections(db_config)
+    executor: ThreadPoolExecutor | None = None
+    pipeline: SyncPipeline | None = None
+
+    def discover_schema(conn: BaseBackend, schema: str) -> list[tuple[str, TableMetadata | None]]:
+        """List the tables of a schema to sync, with their bulk-loaded metadata and statistics."""
+        with connection_registry.query_slot(db_config):
+            try:
+                tables = db_config.list_tables(conn, schema)
+            except Exception:
+                return []
+
+            if not tables:
+                return []
+
+            try:
+                schema_metadata = db_config.load_schema_metadata(conn, schema) or {}
+            except query_errors():
+                logger.debug("Could not bulk-load the metadata of schema %s", schema, exc_info=True)
+                schema_metadata = {}
+
+            table_stats: dict[str, dict[str, Any]] = {}
+            if manifest is not None or db_config.row_count_mode == "estimate":
+                try:
+                    table_stats = db_config.get_table_stats(conn, schema)
+                except query_errors():
+                    logger.debug("Could not load the table statistics of schema %s", schema, exc_info=True)
+                    table_stats = {}
 
-    schema_task = progress.add_task(
-        f"[dim]{db_config.name}[/dim]",
-        total=len(schemas),
-    )
+        discovered = []
+        for table in tables:
+            metadata = schema_metadata.get(table)
+            if stats := table_stats.get(table):
+                metadata = replace(
+                    metadata or TableMetadata(),
+                    row_count=stats.get("row_count"),
+                    last_modified=stats.get("last_modified"),
+                    size_bytes=stats.get("size_bytes"),
+                )
+            discovered.append((table, metadata))
+        return discovered
+
+    def discover_schema_in_worker(schema: str) -> list[tuple[str, TableMetadata | None]]:
+        return discover_schema(worker_connections.get(), schema)
+
+    def sync_table(conn: BaseBackend, schema: str, table: str, metadata: TableMetadata | None) -> TableSyncOutcome:
+        return render_table(
+            engine,
+            templates,
+            db_config,
+            conn,
+            schema,
+            table,
+            db_path / f"schema={schema}" / f"table={table}",
+            metadata=metadata,
+            incremental=manifest is not None,
+            previous_fingerprint=previous_manifest.get(schema, table) if previous_manifest else None,
+            profile_options=profile_options,
+        )
 
-    for schema in schemas:
-        try:
-            all_tables = conn.list_tables(database=schema)
-        except Exception:
+    def sync_table_in_worker(schema: str, table: str, metadata: TableMetadata | None) -> TableSyncOutcome:
+        return sync_table(worker_connections.get(), schema, table, metadata)
+
+    # ── pipeline stages ──
+
+    def prefetch_stage(job: tuple[str, str, TableMetadata | None]) -> PreparedTable:
+        schema, table, metadata = job
+        prepared = prepare_table(
+            templates,
+            db_config,
+            worker_connections.get(),
+            schema,
+            table,
+            db_path / f"schema={schema}" / f"table={table}",
+            metadata=metadata,
+            incremental=manifest is not None,
+            previous_fingerprint=previous_manifest.get(schema, table) if previous_manifest else None,
+            profile_options=profile_options,
+        )
+        if not prepared.unchanged:
+            prepared.ctx.prefetch()
+        return prepared
+
+    def render_stage(prepared: PreparedTable) -> tuple[PreparedTable, list[tuple[Path, str]]]:
+        if prepared.unchanged:
+            return prepared, []
+
+        # Queries not covered by the prefetch run on the render thread's own connection
+        prepared.ctx.bind(worker_connections.get())
+        files = []
+        for template_name in templates:
+            try:
+                content = engine.render(
+                    template_name, db=prepared.ctx, table_name=prepared.table, dataset=prepared.schema
+                )
+            except Exception as e:
+                content = f"# {prepared.table}\n\nError generating content: {e}"
+            files.append((_output_file(prepared.table_path, template_name), content))
+        return prepared, files
+
+    def write_stage(rendered: tuple[PreparedTable, list[tuple[Path, str]]]) -> TableSyncOutcome:
+        prepared, files = rendered
+        if prepared.unchanged:
+            return prepared.outcome()
+
+        prepared.table_path.mkdir(parents=True, exist_ok=True)
+        written = sum(write_if_changed(path, [content]) for path, content in files)
+        return prepared.outcome(written, len(files) - written)
+
+    futures: dict[Future[TableSyncOutcome], tuple[str, str]] = {}
+    remaining_tables: dict[str, int] = {}
+    table_tasks: dict[str, TaskID] = {}
+    # Resumed tables complete on the calling thread while the pipeline's write thread completes others
+    state_lock = threading.Lock()
+
+    def complete_table(schema: str, table: str, outcome: TableSyncOutcome) -> None:
+        with state_lock:
+            state.add_table(schema, table, unchanged=not outcome.rendered, resumed=outcome.resumed)
+            state.cache_hits += outcome.cache_hits
+            state.cache_misses += outcome.cache_misses
+            state.files_written += outcome.files_written
+            state.files_unchanged += outcome.files_unchanged
+            if manifest is not None and outcome.fingerprint:
+                manifest.set(schema, table, outcome.fingerprint)
+            if not outcome.resumed:
+                checkpoint.record(schema, table, outcome.fingerprint)
+            remaining_tables[schema] -= 1
+            schema_done = remaining_tables[schema] == 0
+        progress.update(table_tasks[schema], advance=1)
+        if schema_done:
             progress.update(schema_task, advance=1)
-            continue
 
-        tables = [t for t in all_tables if db_config.matches_pattern(schema, t)]
+    def is_resumed(schema: str, table: str) -> bool:
+        table_path = db_path / f"schema={schema}" / f"table={table}"
+        return checkpoint.is_completed(schema, table) and all(_output_file(table_path, t).exists() for t in templates)
 
+    def start_schema(schema: str, tables: list[tuple[str, TableMetadata | None]]) -> None:
+        """Record a discovered schema and dispatch its tables (called from the calling thread)."""
         if not tables:
             progress.update(schema_task, advance=1)
-            continue
+            return
 
         schema_path = db_path / f"schema={schema}"
         schema_path.mkdir(parents=True, exist_ok=True)
         state.add_schema(schema)
 
-        table_task = progress.add_task(
+        table_tasks[schema] = progress.add_task(
             f"  [cyan]{schema}[/cyan]",
             total=len(tables),
         )
-
-        for table in tables:
-            table_path = schema_path / f"table={table}"
-            table_path.mkdir(parents=True, exist_ok=True)
-
-            # Use custom context if database config provides one (e.g., for Redshift)
-            create_context = getattr(db_config, "create_context", None)
-            if create_context and callable(create_context):
-                ctx = create_context(conn, schema, table)
+        remaining_tables[schema] = len(tables)
+
+        for table, metadata in tables:
+            if is_resumed(schema, table):
+                fingerprint = checkpoint.fingerprint(schema, table)
+                complete_table(schema, table, TableSyncOutcome(rendered=False, fingerprint=fingerprint, resumed=True))
+            elif pipeline is not None:
+                pipeline.submit((schema, table, metadata))
+            elif executor is not None:
+                future = executor.submit(sync_table_in_worker, schema, table, metadata)
+                futures[future] = (schema, table)
             else:
-                ctx = DatabaseContext(conn, schema, table)
-
-            for template_name in templates:
-                try:
-                    content = engine.render(template_name, db=ctx, table_name=table, dataset=schema)
-                except Exception as e:
-                    content = f"# {table}\n\nError generating content: {e}"
-
-                # Derive output filename: "databases/columns.md.j2" → "columns.md"
-                output_filename = Path(template_name).stem  # "columns.md" (stem strips .j2)
-                output_file = table_path / output_filename
-                output_file.write_text(content)
-
-            state.add_table(schema, table)
-            progress.update(table_task, advance=1)
+                complete_table(schema, table, sync_table(conn, schema, table, metadata))
+
+    conn = connection_registry.acquire(db_config)
+    try:
+        if db_config.pipelined and db_config.supports_worker_connections():
+            pipeline = SyncPipeline(
+                prepare=prefetch_stage,
+                render=render_stage,
+                write=write_stage,
+                on_done=lambda job, outcome: complete_table(job[0], job[1], outcome),
+                progress=progress,
+                workers=jobs,
+            )
+        if jobs > 1:
+            executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="nao-sync")
+
+        db_config.load_catalog(conn)
+        # Schemas that cannot contain a matching table are skipped without listing their tables
+        schemas = [schema for schema in db_config.get_schemas(conn) if db_config.schema_may_match(schema)]
+
+        schema_task = progress.add_task(
+            f"[dim]{db_config.name}[/dim]",
+            total=len(schemas),
+        )
 
-        progress.update(schema_task, advance=1)
+        if executor is not None and len(schemas) > 1:
+            # Discover schemas in parallel; table jobs are queued behind them on the same pool
+            discoveries = {executor.submit(discover_schema_in_worker, schema): schema for schema in schemas}
+            for future in as_completed(discoveries):
+                start_schema(discoveries[future], future.result())
+        else:
+            for schema in schemas:
+                start_schema(schema, discover_schema(conn, schema))
+
+        if pipeline is not None:
+            pipeline.finish()
+
+        for future in as_completed(futures):
+            schema, table = futures[future]
+            complete_table(schema, table, future.result())
+
+        if manifest is not None:
+            manifest.save(db_path)
+        checkpoint.complete()
+    finally:
+        checkpoint.close()
+        db_config.clear_catalog()
+        if pipeline is not None:
+            pipeline.close()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        worker_connections.close()
+        connection_registry.release(conn)
 
     return state
 
 
 class DatabaseSyncProvider(SyncProvider):
-    """Provider for syncing database schemas to markdown documentation."""
+    """Provider for syncing database schemas to markdown documentation.
+
+    Args:
+        max_parallel_connections: Number of database connections synced at the
+            same time. Connections are independent, so each one runs its own
+            `sync_database` in a separate thread.
+        resume: Continue interrupted syncs from their checkpoint journal
+            instead of rendering every table again.
+    """
+
+    def __init__(self, max_parallel_connections: int = 1, resume: bool = False):
+        self.max_parallel_connections = max_parallel_connections
+        self.resume = resume
 
     @property
     def name(self) -> str:
@@ -121,6 +569,12 @@ class DatabaseSyncProvider(SyncProvider):
 
         total_datasets = 0
         total_tables = 0
+        total_unchanged = 0
+        total_resumed = 0
+        total_cache_hits = 0
+        total_cache_misses = 0
+        total_files_written = 0
+        total_files_unchanged = 0
         total_removed = 0
         sync_states: list[DatabaseSyncState] = []
 
@@ -141,22 +595,32 @@ class DatabaseSyncProvider(SyncProvider):
             console=console,
             transient=False,
         ) as progress:
-            for db in items:
-                try:
-                    state = sync_database(db, output_path, progress, project_path)
-                    sync_states.append(state)
-                    total_datasets += state.schemas_synced
-                    total_tables += state.tables_synced
-                except Exception as e:
-                    console.print(f"[bold red]✗[/bold red] Failed to sync {db.name}: {e}")
+            for state in self._sync_databases(items, output_path, progress, project_path):
+                sync_states.append(state)
+                total_datasets += state.schemas_synced
+                total_tables += state.tables_synced
+                total_unchanged += state.tables_unchanged
+                total_resumed += state.tables_resumed
+                total_cache_hits += state.cache_hits
+                total_cache_misses += state.cache_misses
+                total_files_written += state.files_written
+                total_files_unchanged += state.files_unchanged
 
         for state in sync_states:
             removed = cleanup_stale_paths(state, verbose=True)
             total_removed += removed
 
         summary = f"{total_tables} tables across {total_datasets} datasets"
+        if total_unchanged > 0:
+            summary += f", {total_unchanged} unchanged"
+        if total_resumed > 0:
+            summary += f", {total_resumed} resumed"
+        if total_files_unchanged > 0:
+            summary += f", {total_files_written} files written, {total_files_unchanged} identical"
         if total_removed > 0:
             summary += f", {total_removed} stale removed"
+        if total_cache_hits + total_cache_misses > 0:
+            summary += f" (metadata cache: {total_cache_hits} hits, {total_cache_misses} misses)"
 
         return SyncResult(
             provider_name=self.name,
@@ -164,7 +628,34 @@ class DatabaseSyncProvider(SyncProvider):
             details={
                 "datasets": total_datasets,
                 "tables": total_tables,
+                "unchanged": total_unchanged,
+                "resumed": total_resumed,
+                "cache_hits": total_cache_hits,
+                "cache_misses": total_cache_misses,
+                "files_written": total_files_written,
+                "files_unchanged": total_files_unchanged,
                 "removed": total_removed,
             },
             summary=summary,
         )
+
+    def _sync_databases(
+        self, items: list[Any], output_path: Path, progress: Progress, project_path: Path | None
+    ) -> list[DatabaseSyncState]:
+        """Sync every database, several at a time when allowed. Failed databases are reported and skipped."""
+
+        def sync_one(db: Any) -> DatabaseSyncState | None:
+            try:
+                return sync_database(db, output_path, progress, project_path, resume=self.resume)
+            except Exception as e:
+                console.print(f"[bold red]✗[/bold red] Failed to sync {db.name}: {e}")
+                return None
+
+        workers = min(self.max_parallel_connections, len(items))
+        if workers <= 1:
+            states = [sync_one(db) for db in items]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nao-sync-db") as pool:
+                states = list(pool.map(sync_one, items))
+
+        return [state for state in states if state is not None]
@@ -0,0 +1,76 @@
+"""Atomic file writes that leave unchanged files untouched."""
+
+import hashlib
+import os
+import secrets
+import stat
+from collections.abc import Iterable
+from pathlib import Path
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _file_digest(path: Path) -> str | None:
+    """Return the SHA-256 of a file's content, or None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _create_temp_file(path: Path) -> tuple[int, Path]:
+    """Create a temporary file next to `path`, with the permissions a regular open() would give it.
+
+    Unlike `tempfile.mkstemp` (always 0600), the current umask applies, as it
+    did when synced files were written with `write_text()`.
+    """
+    while True:
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def write_if_changed(path: Path, chunks: Iterable[str]) -> bool:
+    """Stream text chunks to a file, replacing it atomically only if its content changed.
+
+    Chunks are written to a temporary file in the same directory while being
+    hashed. If the result matches the existing file, the temporary file is
+    discarded and the existing file (and its mtime) is left alone. Otherwise it
+    is moved into place with `os.replace`, so readers never see a partially
+    written file. A replaced file keeps its permissions.
+
+    Args:
+        path: Destination file
+        chunks: Text to write, e.g. from `TemplateEngine.stream()`
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    fd, tmp_path = _create_temp_file(path)
+    try:
+        digest = hashlib.sha256()
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                data = chunk.encode()
+                digest.update(data)
+                f.write(data)
+
+        if digest.hexdigest() == _file_digest(path):
+            tmp_path.unlink()
+            return False
+
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+        return True
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -2,11 +2,13 @@ from .base import NaoConfig
 from .databases import (
     AnyDatabaseConfig,
     BigQueryConfig,
+    ConnectionRegistry,
     DatabaseType,
     DatabricksConfig,
     DuckDBConfig,
     PostgresConfig,
     SnowflakeConfig,
+    connection_registry,
 )
 from .exceptions import InitError
 from .llm import LLMConfig, LLMProvider
@@ -21,6 +23,8 @@ __all__ = [
     "SnowflakeConfig",
     "PostgresConfig",
     "DatabaseType",
+    "ConnectionRegistry",
+    "connection_registry",
     "LLMConfig",
     "LLMProvider",
     "SlackConfig",
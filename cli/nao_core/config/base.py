@@ -203,14 +203,18 @@ class NaoConfig(BaseModel):
         return cls.model_validate(data)
 
     def get_connection(self, name: str) -> BaseBackend:
-        """Get an Ibis connection by database name."""
+        """Get a new Ibis connection by database name.
+
+        The connection is not pooled and belongs to the caller; use
+        `connection_registry.lease(db)` to share warm connections instead.
+        """
         for db in self.databases:
             if db.name == name:
                 return db.connect()
         raise ValueError(f"Database '{name}' not found in configuration")
 
     def get_all_connections(self) -> dict[str, BaseBackend]:
-        """Get all Ibis connections as a dict keyed by name."""
+        """Get new Ibis connections to all databases as a dict keyed by name."""
         return {db.name: db.connect() for db in self.databases}
 
     @classmethod
@@ -8,6 +8,7 @@ from .databricks import DatabricksConfig
 from .duckdb import DuckDBConfig
 from .postgres import PostgresConfig
 from .redshift import RedshiftConfig
+from .registry import ConnectionRegistry, connection_registry
 from .snowflake import SnowflakeConfig
 
 # =============================================================================
@@ -68,4 +69,6 @@ __all__ = [
     "SnowflakeConfig",
     "PostgresConfig",
     "RedshiftConfig",
+    "ConnectionRegistry",
+    "connection_registry",
 ]
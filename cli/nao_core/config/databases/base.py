@@ -1,12 +1,29 @@
 from __future__ import annotations
 
-import fnmatch
+import hashlib
+import logging
 from abc import ABC, abstractmethod
 from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar, Literal
 
 import questionary
 from ibis import BaseBackend
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .catalog import TableMetadata, fetch_rows, query_errors
+from .patterns import PatternMatcher, full_name_like_predicate, like_predicate
+from .preview import PreviewOptions
+from .profile import ProfileBudget, ProfileOptions
+from .registry import connection_registry
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_path(value: str, base: Path) -> str:
+    """Absolute form of a config file path, relative paths being resolved against `base`."""
+    path = Path(value).expanduser()
+    return str(path if path.is_absolute() else base / path)
 
 
 class DatabaseType(str, Enum):
@@ -29,6 +46,9 @@ class DatabaseConfig(BaseModel, ABC):
     """Base configuration for all database backends."""
 
     type: str  # Narrowed to Literal in each subclass for discriminated union
+    case_insensitive_patterns: ClassVar[bool] = False
+    """Whether include/exclude patterns ignore case, like the backend's identifiers"""
+
     name: str = Field(description="A friendly name for this connection")
 
     include: list[str] = Field(
@@ -39,6 +59,69 @@ class DatabaseConfig(BaseModel, ABC):
         default_factory=list,
         description="Glob patterns for schemas/tables to exclude (e.g., 'temp_*.*', '*.backup_*')",
     )
+    sync_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Number of tables synced in parallel, each worker using its own connection",
+    )
+    max_concurrent_queries: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of schemas/tables queried at the same time on this connection, "
+        "across all sync workers and connections sharing the same credentials",
+    )
+    pipelined: bool = Field(
+        default=False,
+        description="Overlap metadata queries, template rendering and file writes in separate stages",
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Only re-render tables whose columns, row count or last-modified time changed since the last sync",
+    )
+    row_count_mode: Literal["exact", "estimate", "off"] = Field(
+        default="exact",
+        description="How table row counts are computed: 'exact' runs COUNT(*), 'estimate' reads catalog statistics "
+        "(falling back to COUNT(*) when none are available), 'off' skips row counts",
+    )
+    preview_max_columns: int | None = Field(
+        default=None,
+        ge=1,
+        description="Only include the first N columns of each table in previews",
+    )
+    preview_max_cell_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Truncate preview values larger than this many bytes",
+    )
+    preview_sample_percent: float | None = Field(
+        default=None,
+        gt=0,
+        le=100,
+        description="Preview a TABLESAMPLE of this percentage of each table instead of its first rows, "
+        "on backends that support it",
+    )
+    profile: bool = Field(
+        default=False,
+        description="Compute column statistics (null ratio, distinct count, min/max, top values) for profile.md",
+    )
+    profile_sample_rows: int = Field(
+        default=10_000,
+        ge=1,
+        description="Only profile the first N rows of each table",
+    )
+    profile_top_k: int = Field(
+        default=5,
+        ge=1,
+        description="Number of most frequent values reported for low-cardinality columns",
+    )
+    profile_max_bytes: int | None = Field(
+        default=None,
+        ge=1,
+        description="Estimated bytes profiling may scan per sync of this connection; tables beyond it are not profiled",
+    )
+
+    _matcher: PatternMatcher | None = PrivateAttr(default=None)
+    _matcher_key: tuple[tuple[str, ...], tuple[str, ...]] | None = PrivateAttr(default=None)
 
     @classmethod
     @abstractmethod
@@ -51,6 +134,43 @@ class DatabaseConfig(BaseModel, ABC):
         """Create an Ibis connection for this database."""
         ...
 
+    def disconnect(self, conn: BaseBackend) -> None:
+        """Close a connection created by `connect()`, including any resources opened with it."""
+        conn.disconnect()
+
+    def resolve_paths(self, base: Path) -> None:
+        """Make the file paths of this config absolute, resolving relative ones against `base`.
+
+        Lets a process serving several projects load their configs without
+        changing its working directory. No-op for configs without file paths.
+        """
+
+    def cancel_query(self, conn: BaseBackend) -> bool:
+        """Interrupt the query running on a connection, called from another thread.
+
+        Returns False when the backend cannot cancel queries (the default); the
+        query then runs to completion.
+        """
+        return False
+
+    def connection_key(self) -> str:
+        """Hash of the fields that define the connection, used to pool connections.
+
+        Options shared by all backends (name, include/exclude patterns, sync
+        settings) do not change the connection and are left out.
+        """
+        shared_fields = set(DatabaseConfig.model_fields) - {"type"}
+        payload = self.model_dump_json(exclude=shared_fields)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def pattern_matcher(self) -> PatternMatcher:
+        """Return the include/exclude patterns compiled into a matcher, rebuilt when they change."""
+        key = (tuple(self.include), tuple(self.exclude))
+        if self._matcher is None or self._matcher_key != key:
+            self._matcher = PatternMatcher(self.include, self.exclude, case_insensitive=self.case_insensitive_patterns)
+            self._matcher_key = key
+        return self._matcher
+
     def matches_pattern(self, schema: str, table: str) -> bool:
         """Check if a schema.table matches the include/exclude patterns.
 
@@ -61,27 +181,76 @@ class DatabaseConfig(BaseModel, ABC):
         Returns:
             True if the table should be included, False if excluded
         """
-        full_name = f"{schema}.{table}"
+        return self.pattern_matcher().matches(schema, table)
+
+    def schema_may_match(self, schema: str) -> bool:
+        """Check whether any table of a schema could match the include/exclude patterns.
 
-        # If include patterns exist, table must match at least one
-        if self.include:
-            included = any(fnmatch.fnmatch(full_name, pattern) for pattern in self.include)
-            if not included:
-                return False
+        Used to skip schemas without listing their tables. May return True for a
+        schema none of whose tables match, but never False for one that has some.
+        """
+        return self.pattern_matcher().schema_may_match(schema)
 
-        # If exclude patterns exist, table must not match any
-        if self.exclude:
-            excluded = any(fnmatch.fnmatch(full_name, pattern) for pattern in self.exclude)
-            if excluded:
-                return False
+    def table_pattern_predicate(self, schema: str, table_column: str, dialect: str) -> str | None:
+        """SQL condition on a catalog view's table name column that pushes down the include/exclude patterns."""
+        return like_predicate(
+            schema,
+            table_column,
+            self.include,
+            self.exclude,
+            dialect,
+            case_insensitive=self.case_insensitive_patterns,
+        )
 
-        return True
+    def full_name_pattern_predicate(self, full_name: str, dialect: str) -> str | None:
+        """SQL condition on an expression evaluating to `schema.table` that pushes down the include/exclude patterns."""
+        return full_name_like_predicate(
+            full_name,
+            self.include,
+            self.exclude,
+            dialect,
+            case_insensitive=self.case_insensitive_patterns,
+        )
+
+    def tables_query(self, schema: str) -> str | None:
+        """Catalog query listing the names of the tables and views of a schema to sync.
+
+        Backends with catalog views filter the names server-side with
+        `table_pattern_predicate`. Returns None to list tables with Ibis instead.
+        """
+        return None
+
+    def list_tables(self, conn: BaseBackend, schema: str) -> list[str]:
+        """List the tables of a schema that match the include/exclude patterns.
+
+        Uses `tables_query` when the backend provides one, falling back to Ibis
+        `list_tables` if it fails. Names are always checked with `matches_pattern`,
+        since pushed-down predicates may let extra names through.
+        """
+        names: list[str] | None = None
+        if query := self.tables_query(schema):
+            try:
+                names = [row[0] for row in fetch_rows(conn, query)]
+            except query_errors():
+                logger.debug("tables_query failed for schema %s, listing tables with Ibis", schema, exc_info=True)
+                names = None
+        if names is None:
+            names = conn.list_tables(database=schema)
+        return [name for name in names if self.matches_pattern(schema, name)]
 
     @abstractmethod
     def get_database_name(self) -> str:
         """Get the database name for this database type."""
         ...
 
+    def get_sync_concurrency(self) -> int:
+        """Return how many worker threads sync tables in parallel for this connection."""
+        return self.sync_concurrency if self.supports_worker_connections() else 1
+
+    def supports_worker_connections(self) -> bool:
+        """Whether several connections opened from this config see the same data."""
+        return True
+
     def get_schemas(self, conn: BaseBackend) -> list[str]:
         """Return the list of schemas to sync. Override in subclasses for custom behavior."""
         list_databases = getattr(conn, "list_databases", None)
@@ -89,13 +258,67 @@ class DatabaseConfig(BaseModel, ABC):
             return list_databases()
         return []
 
+    def get_preview_options(self) -> PreviewOptions:
+        """Options used by database contexts to build table previews."""
+        return PreviewOptions(
+            max_columns=self.preview_max_columns,
+            max_cell_bytes=self.preview_max_cell_bytes,
+            sample_percent=self.preview_sample_percent,
+        )
+
+    def get_profile_options(self) -> ProfileOptions:
+        """Options used by database contexts to profile tables.
+
+        Each call starts a new `profile_max_bytes` budget: share the returned
+        options across the tables of a sync so the budget covers the connection.
+        """
+        return ProfileOptions(
+            enabled=self.profile,
+            sample_rows=self.profile_sample_rows,
+            top_k=self.profile_top_k,
+            budget=ProfileBudget(self.profile_max_bytes),
+        )
+
+    def load_catalog(self, conn: BaseBackend) -> None:
+        """Load catalog metadata for the whole database before its schemas are discovered.
+
+        Backends that can introspect a whole database in a few queries keep the
+        result and serve `list_tables`, `load_schema_metadata` and
+        `get_table_stats` from it until `clear_catalog()`. No-op by default.
+        """
+
+    def clear_catalog(self) -> None:
+        """Drop the metadata loaded by `load_catalog()`."""
+
+    def load_schema_metadata(self, conn: BaseBackend, schema: str) -> dict[str, TableMetadata] | None:
+        """Load column metadata for every table of a schema with a single catalog query.
+
+        Returns a dict keyed by table name, or None when the backend has no bulk
+        loader, in which case columns are introspected table by table.
+        """
+        return None
+
+    def get_table_stats(self, conn: BaseBackend, schema: str) -> dict[str, dict[str, Any]]:
+        """Return catalog statistics for every table of a schema, keyed by table name.
+
+        Each entry may contain `row_count`, `last_modified` and `size_bytes`, read from catalog
+        metadata in a single query without scanning tables. Used by incremental
+        sync to detect unchanged tables and by the `estimate` row count mode.
+        Backends without such metadata return an empty dict.
+        """
+        return {}
+
+    def estimate_row_count(self, conn: BaseBackend, schema: str, table: str) -> int | None:
+        """Estimate the row count of one table from its statistics, for backends without bulk statistics."""
+        return None
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to the database. Override in subclasses for custom behavior."""
         try:
-            conn = self.connect()
-            if list_databases := getattr(conn, "list_databases", None):
-                schemas = list_databases()
-                return True, f"Connected successfully ({len(schemas)} schemas found)"
-            return True, "Connected successfully"
+            with connection_registry.lease(self) as conn:
+                if list_databases := getattr(conn, "list_databases", None):
+                    schemas = list_databases()
+                    return True, f"Connected successfully ({len(schemas)} schemas found)"
+                return True, "Connected successfully"
         except Exception as e:
             return False, str(e)
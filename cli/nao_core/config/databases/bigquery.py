@@ -1,13 +1,140 @@
 import json
-from typing import Literal
+from pathlib import Path
+from typing import Any, Literal
 
 import ibis
 from ibis import BaseBackend
+from ibis.backends.sql.datatypes import BigQueryType
 from pydantic import Field, field_validator
 
 from nao_core.ui import ask_select, ask_text
 
-from .base import DatabaseConfig
+from .base import DatabaseConfig, resolve_path
+from .catalog import TableMetadata, build_schema_metadata, fetch_rows, memoized, quote_identifier
+from .context import DatabaseContext
+from .preview import PreviewOptions, arrow_to_rows, preview_table
+from .profile import ProfileOptions, profile_table, reserve_scan, skipped_profile
+from .registry import connection_registry
+
+# __TABLES__ type of native tables (2 is a view, 3 an external table)
+_NATIVE_TABLE_TYPE = 1
+
+
+def parse_option_string(value: str | None) -> str | None:
+    """Decode a string option of INFORMATION_SCHEMA.TABLE_OPTIONS, which is rendered as a quoted literal."""
+    if not value:
+        return None
+    try:
+        decoded = json.loads(value)
+    except ValueError:
+        return value.strip('"')
+    return decoded if isinstance(decoded, str) else value
+
+
+class BigQueryDatabaseContext(DatabaseContext):
+    """BigQuery-specific context that avoids billed query jobs.
+
+    Table metadata comes from the `tables.get` API, row counts of native
+    tables from that metadata, and previews of native tables from
+    `tabledata.list`. None of these run a query job, so they are not billed.
+    Views, external tables and sampled previews can only be read with a
+    query, and fall back to Ibis.
+    """
+
+    def __init__(
+        self,
+        conn: BaseBackend,
+        project_id: str,
+        schema: str,
+        table_name: str,
+        metadata: TableMetadata | None = None,
+        row_count_mode: str = "exact",
+        preview_options: PreviewOptions | None = None,
+        profile_options: ProfileOptions | None = None,
+    ):
+        super().__init__(conn, schema, table_name, metadata, row_count_mode, preview_options, profile_options)
+        self._project_id = project_id
+
+    @memoized
+    def _table_info(self) -> Any:
+        """Return the `google.cloud.bigquery.Table` of the table (a free metadata API call)."""
+        return self._conn.client.get_table(f"{self._project_id}.{self._schema}.{self._table_name}")  # type: ignore[attr-defined]
+
+    def _is_native(self) -> bool:
+        return self._table_info().table_type == "TABLE"
+
+    @memoized
+    def preview(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the first N rows as a list of JSON-safe dictionaries.
+
+        Native tables are read with `tabledata.list`, which returns rows without
+        running (and billing) a query. A `LIMIT` query would scan the previewed
+        columns in full.
+        """
+        options = self._preview_options
+        if options.sample_percent is not None or not self._is_native():
+            return preview_table(self.table, limit, options)
+
+        info = self._table_info()
+        fields = info.schema if options.max_columns is None else info.schema[: options.max_columns]
+        rows = self._conn.client.list_rows(info, selected_fields=fields, max_results=limit)  # type: ignore[attr-defined]
+        # Row-limited reads go through tabledata.list: the Storage Read API cannot stop after N rows
+        return arrow_to_rows(rows.to_arrow(create_bqstorage_client=False), options.max_cell_bytes)
+
+    @memoized
+    def row_count(self) -> int | None:
+        """Return the number of rows of the table, or None when row counts are turned off.
+
+        Native tables report their row count in their metadata, so no `COUNT(*)`
+        job is needed. Other tables are counted with a query.
+        """
+        if self._row_count_mode == "off":
+            return None
+        if self.row_count_is_estimate():
+            return int(self._metadata.row_count)  # type: ignore[union-attr, arg-type]
+        if self._is_native() and (num_rows := self._table_info().num_rows) is not None:
+            return int(num_rows)
+        return self.table.count().execute()
+
+    @memoized
+    def profile(self) -> dict[str, Any] | None:
+        """Return column statistics computed over the first `sample_rows` rows of the table.
+
+        Profiling runs query jobs, and BigQuery bills every byte of the columns a
+        query reads whatever its `LIMIT`. The bytes budget is therefore charged
+        the full size of the table: its stored size for native tables, or the
+        bytes a dry run of a full read would process for views and external tables.
+        """
+        options = self._profile_options
+        if not options.enabled:
+            return None
+
+        columns = self.columns()
+        scan_bytes = self._billed_scan_bytes() if options.budget is not None else None
+        if not reserve_scan(options, columns, scan_bytes=scan_bytes):
+            return skipped_profile("bytes budget exhausted")
+
+        return profile_table(self.table, columns, options)
+
+    def _billed_scan_bytes(self) -> int:
+        """Bytes billed by a query reading every column of the table."""
+        info = self._table_info()
+        if self._is_native() and info.num_bytes is not None:
+            return int(info.num_bytes)
+
+        from google.cloud import bigquery
+
+        table_ref = quote_identifier(f"{self._project_id}.{self._schema}.{self._table_name}", "bigquery")
+        job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+        job = self._conn.client.query(f"SELECT * FROM {table_ref}", job_config=job_config)  # type: ignore[attr-defined]
+        return int(job.total_bytes_processed or 0)
+
+    @memoized
+    def description(self) -> str | None:
+        """Return the table description, from the bulk-loaded metadata or the table's metadata."""
+        if self._metadata is not None and self._metadata.columns is not None:
+            return self._metadata.description
+        return self._table_info().description
 
 
 class BigQueryConfig(DatabaseConfig):
@@ -103,6 +230,11 @@ class BigQueryConfig(DatabaseConfig):
 
         return ibis.bigquery.connect(**kwargs)
 
+    def resolve_paths(self, base: Path) -> None:
+        """Resolve the service account file against `base`."""
+        if self.credentials_path:
+            self.credentials_path = resolve_path(self.credentials_path, base)
+
     def get_database_name(self) -> str:
         """Get the database name for BigQuery."""
         return self.project_id
@@ -113,16 +245,89 @@ class BigQueryConfig(DatabaseConfig):
         list_databases = getattr(conn, "list_databases", None)
         return list_databases() if list_databases else []
 
+    def tables_query(self, schema: str) -> str | None:
+        """List tables and views from the dataset's INFORMATION_SCHEMA.TABLES, filtered by the include/exclude patterns."""
+        tables_view = quote_identifier(f"{self.project_id}.{schema}.INFORMATION_SCHEMA.TABLES", "bigquery")
+        predicate = self.table_pattern_predicate(schema, "table_name", "bigquery")
+        return f"""
+            SELECT table_name
+            FROM {tables_view}
+            {f"WHERE {predicate}" if predicate else ""}
+        """
+
+    def load_schema_metadata(self, conn: BaseBackend, schema: str) -> dict[str, TableMetadata] | None:
+        """Load the columns of every matching table of a dataset, with their descriptions, from INFORMATION_SCHEMA.
+
+        Column descriptions come from COLUMN_FIELD_PATHS and table descriptions
+        from TABLE_OPTIONS, joined in the same query.
+        """
+
+        def view(name: str) -> str:
+            return quote_identifier(f"{self.project_id}.{schema}.INFORMATION_SCHEMA.{name}", "bigquery")
+
+        predicate = self.table_pattern_predicate(schema, "c.table_name", "bigquery")
+        query = f"""
+            SELECT c.table_name, c.column_name, c.data_type, c.is_nullable, p.description, o.option_value
+            FROM {view("COLUMNS")} c
+            LEFT JOIN {view("COLUMN_FIELD_PATHS")} p
+                ON p.table_name = c.table_name AND p.column_name = c.column_name AND p.field_path = c.column_name
+            LEFT JOIN {view("TABLE_OPTIONS")} o
+                ON o.table_name = c.table_name AND o.option_name = 'description'
+            {f"WHERE {predicate}" if predicate else ""}
+            ORDER BY c.table_name, c.ordinal_position
+        """
+        rows = (
+            (table_name, column_name, data_type, nullable, description, parse_option_string(option_value))
+            for table_name, column_name, data_type, nullable, description, option_value in fetch_rows(conn, query)
+        )
+        return build_schema_metadata(rows, BigQueryType)
+
+    def get_table_stats(self, conn: BaseBackend, schema: str) -> dict[str, dict[str, Any]]:
+        """Read row counts and modification times from the dataset's `__TABLES__` view (metadata only, not billed)."""
+        tables_view = quote_identifier(f"{self.project_id}.{schema}.__TABLES__", "bigquery")
+        query = f"SELECT table_id, type, row_count, size_bytes, last_modified_time FROM {tables_view}"
+        return {
+            table_id: {
+                # Views and external tables report 0 rows
+                "row_count": row_count if table_type == _NATIVE_TABLE_TYPE else None,
+                "size_bytes": size_bytes,
+                "last_modified": last_modified_time,
+            }
+            for table_id, table_type, row_count, size_bytes, last_modified_time in fetch_rows(conn, query)
+        }
+
+    def create_context(
+        self,
+        conn: BaseBackend,
+        schema: str,
+        table_name: str,
+        metadata: TableMetadata | None = None,
+        row_count_mode: str = "exact",
+        preview_options: PreviewOptions | None = None,
+        profile_options: ProfileOptions | None = None,
+    ) -> BigQueryDatabaseContext:
+        """Create a BigQuery-specific database context that reads metadata and previews without query jobs."""
+        return BigQueryDatabaseContext(
+            conn,
+            self.project_id,
+            schema,
+            table_name,
+            metadata=metadata,
+            row_count_mode=row_count_mode,
+            preview_options=preview_options,
+            profile_options=profile_options,
+        )
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to BigQuery."""
         try:
-            conn = self.connect()
-            if self.dataset_id:
-                tables = conn.list_tables()
-                return True, f"Connected successfully ({len(tables)} tables found)"
-            if list_databases := getattr(conn, "list_databases", None):
-                schemas = list_databases()
-                return True, f"Connected successfully ({len(schemas)} datasets found)"
-            return True, "Connected successfully"
+            with connection_registry.lease(self) as conn:
+                if self.dataset_id:
+                    tables = conn.list_tables()
+                    return True, f"Connected successfully ({len(tables)} tables found)"
+                if list_databases := getattr(conn, "list_databases", None):
+                    schemas = list_databases()
+                    return True, f"Connected successfully ({len(schemas)} datasets found)"
+                return True, "Connected successfully"
         except Exception as e:
             return False, str(e)
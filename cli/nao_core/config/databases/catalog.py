@@ -0,0 +1,222 @@
+"""Helpers for running catalog (metadata) queries against Ibis backends."""
+
+import functools
+import inspect
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import sqlglot as sg
+from ibis import BaseBackend
+from ibis.backends.sql.datatypes import SqlglotType
+from ibis.common.exceptions import IbisError
+
+# Base exception of each driver's errors. Drivers are imported by their Ibis
+# backend on first connection, so only the loaded ones are looked up.
+_DRIVER_ERRORS = {
+    "duckdb": "Error",
+    "psycopg": "Error",
+    "psycopg2": "Error",
+    "snowflake.connector.errors": "Error",
+    "databricks.sql.exc": "Error",
+    "google.api_core.exceptions": "GoogleAPIError",
+    "pyarrow": "ArrowException",
+}
+
+
+@dataclass
+class TableMetadata:
+    """Metadata of a single table, loaded in bulk for a whole schema."""
+
+    columns: list[dict[str, Any]] | None = None
+    """Column metadata in the same shape as `DatabaseContext.columns()`: name, type, nullable, description.
+    None when columns were not bulk-loaded"""
+
+    row_count: int | None = None
+    """Row count read from catalog statistics (may be approximate)"""
+
+    last_modified: Any = None
+    """Last modification time reported by the catalog"""
+
+    size_bytes: int | None = None
+    """Storage size reported by the catalog"""
+
+    description: str | None = None
+    """Table comment stored in the catalog"""
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+QuerySlot = Callable[[], AbstractContextManager[Any]]
+"""Factory of the context manager holding a query slot, e.g. `connection_registry.query_slot`"""
+
+
+@contextmanager
+def _query_slot(ctx: Any) -> Iterator[None]:
+    # Nested calls (e.g. profile() reading columns()) run in the slot of the outermost call
+    query_slot = getattr(ctx, "query_slot", None)
+    if query_slot is None or getattr(ctx, "_holds_query_slot", False):
+        yield
+        return
+    with query_slot():
+        ctx._holds_query_slot = True
+        try:
+            yield
+        finally:
+            ctx._holds_query_slot = False
+
+
+def memoized(method: F) -> F:
+    """Cache the result of a database context method per instance and arguments.
+
+    Templates call the same context methods several times (e.g. `db.description()`
+    in a condition and again to print it), and contexts call each other's methods
+    internally. With this decorator each distinct call reaches the warehouse at
+    most once per table. Calls with equivalent arguments (`preview()` and
+    `preview(limit=10)`) share an entry.
+
+    The instance must define `_memo` (dict), `cache_hits` and `cache_misses` (int).
+    When it also sets `query_slot`, calls that miss the cache run while holding
+    that slot, so every query of the context counts against the connection's
+    `max_concurrent_queries`. Exceptions are not cached.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = (method.__name__, tuple(bound.arguments.items())[1:])
+            hash(key)
+        except TypeError:
+            with _query_slot(self):
+                return method(self, *args, **kwargs)
+
+        if key in self._memo:
+            self.cache_hits += 1
+            return self._memo[key]
+
+        self.cache_misses += 1
+        with _query_slot(self):
+            result = method(self, *args, **kwargs)
+        self._memo[key] = result
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def quote_literal(value: str, dialect: str) -> str:
+    """Render a string literal for the given SQL dialect, escaping it properly."""
+    return sg.exp.Literal.string(value).sql(dialect=dialect)
+
+
+def quote_identifier(name: str, dialect: str) -> str:
+    """Render a quoted identifier for the given SQL dialect."""
+    return sg.to_identifier(name, quoted=True).sql(dialect=dialect)
+
+
+def fetch_rows(conn: BaseBackend, query: str, params: Sequence[Any] | None = None) -> list[tuple[Any, ...]]:
+    """Run a query through `raw_sql` and return its rows as plain tuples.
+
+    Backends return different objects from `raw_sql`: DB-API cursors (Postgres,
+    Snowflake, Databricks), the DuckDB connection itself, or a BigQuery
+    `RowIterator`. This normalizes all of them.
+
+    `params` are bound to the query's `%s` placeholders by the driver; only the
+    Postgres backend (also used for Redshift) forwards them.
+    """
+    if params is None:
+        result = conn.raw_sql(query)  # type: ignore[attr-defined]
+    else:
+        result = conn.raw_sql(query, params=params)  # type: ignore[attr-defined]
+
+    if not hasattr(result, "fetchall"):
+        return [tuple(row.values()) for row in result]
+
+    try:
+        return [tuple(row) for row in result.fetchall()]
+    finally:
+        # DuckDB returns its connection from raw_sql, which must stay open
+        if result is not getattr(conn, "con", None) and hasattr(result, "close"):
+            result.close()
+
+
+def query_errors() -> tuple[type[Exception], ...]:
+    """Exceptions raised by a failed query, caught where a fast path falls back to a slower one.
+
+    Covers the errors of the database drivers in use, Ibis and sqlglot errors,
+    operations a backend does not implement, and I/O errors (lost connections,
+    timeouts). Anything else is a bug and is left to propagate.
+    """
+    errors: list[type[Exception]] = [IbisError, sg.errors.SqlglotError, NotImplementedError, OSError]
+    for module_name, error_name in _DRIVER_ERRORS.items():
+        if (module := sys.modules.get(module_name)) is not None:
+            errors.append(getattr(module, error_name))
+    return tuple(errors)
+
+
+def format_ibis_type(dtype: Any) -> str:
+    """Convert an Ibis type to a human-readable string (e.g. !int32 -> int32 NOT NULL)."""
+    raw = str(dtype)
+    if raw.startswith("!"):
+        return f"{raw[1:]} NOT NULL"
+    return raw
+
+
+def format_column_type(raw_type: str, nullable: bool, type_mapper: type[SqlglotType]) -> str:
+    """Format a catalog type name the same way Ibis would report it for the column.
+
+    Falls back to the lowercased catalog type when Ibis cannot parse it.
+    """
+    try:
+        dtype = type_mapper.from_string(raw_type, nullable=nullable)
+    except query_errors():
+        dtype = None
+
+    if dtype is None or dtype.is_unknown():
+        formatted = raw_type.lower()
+        return formatted if nullable else f"{formatted} NOT NULL"
+    return format_ibis_type(dtype)
+
+
+def is_nullable(value: Any) -> bool:
+    """Interpret the many spellings of a catalog nullability flag (True, 'YES', 'Y', ...)."""
+    if isinstance(value, str):
+        return value.strip().upper() in ("YES", "Y", "TRUE")
+    return bool(value)
+
+
+def build_schema_metadata(
+    rows: Iterable[tuple[Any, ...]],
+    type_mapper: type[SqlglotType],
+) -> dict[str, TableMetadata]:
+    """Group catalog column rows into per-table metadata.
+
+    Args:
+        rows: `(table_name, column_name, data_type, is_nullable)` tuples, ordered
+            by table and column position, optionally followed by the column's
+            comment and the table's comment.
+        type_mapper: Ibis type mapper of the backend, used to parse `data_type`.
+
+    Returns:
+        Dict mapping table names to their metadata.
+    """
+    tables: dict[str, TableMetadata] = {}
+    for table_name, column_name, data_type, nullable, *comments in rows:
+        column_nullable = is_nullable(nullable)
+        metadata = tables.get(table_name)
+        if metadata is None:
+            table_comment = comments[1] if len(comments) > 1 else None
+            metadata = tables[table_name] = TableMetadata(columns=[], description=table_comment or None)
+        metadata.columns.append(  # type: ignore[union-attr]
+            {
+                "name": column_name,
+                "type": format_column_type(data_type, column_nullable, type_mapper),
+                "nullable": column_nullable,
+                "description": (comments[0] if comments else None) or None,
+            }
+        )
+    return tables
@@ -0,0 +1,150 @@
+"""Database context exposing methods available in templates during sync."""
+
+import logging
+from typing import Any
+
+from ibis import BaseBackend
+
+from .catalog import QuerySlot, TableMetadata, format_ibis_type, memoized, query_errors
+from .preview import PreviewOptions, preview_table
+from .profile import ProfileOptions, profile_table, reserve_scan, skipped_profile
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseContext:
+    """Context object passed to Jinja2 templates during database sync.
+
+    Exposes data-fetching methods that templates can call to retrieve
+    column metadata, row previews, table descriptions, etc.
+
+    When schema-level metadata was bulk-loaded beforehand, column information is
+    served from it instead of introspecting the table. Every data-fetching method
+    is memoized, so templates can call them as often as they like.
+    """
+
+    def __init__(
+        self,
+        conn: BaseBackend,
+        schema: str,
+        table_name: str,
+        metadata: TableMetadata | None = None,
+        row_count_mode: str = "exact",
+        preview_options: PreviewOptions | None = None,
+        profile_options: ProfileOptions | None = None,
+    ):
+        self._conn = conn
+        self._schema = schema
+        self._table_name = table_name
+        self._table_ref = None
+        self._metadata = metadata
+        self._row_count_mode = row_count_mode
+        self._preview_options = preview_options or PreviewOptions()
+        self._profile_options = profile_options or ProfileOptions()
+        self._memo: dict = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.query_slot: QuerySlot | None = None
+
+    @property
+    def table(self):
+        if self._table_ref is None:
+            self._table_ref = self._conn.table(self._table_name, database=self._schema)
+        return self._table_ref
+
+    @memoized
+    def columns(self) -> list[dict[str, Any]]:
+        """Return column metadata: name, type, nullable, description."""
+        if self._metadata is not None and self._metadata.columns is not None:
+            return [dict(col) for col in self._metadata.columns]
+
+        schema = self.table.schema()
+        return [
+            {
+                "name": name,
+                "type": self._format_type(dtype),
+                "nullable": dtype.nullable if hasattr(dtype, "nullable") else True,
+                "description": None,
+            }
+            for name, dtype in schema.items()
+        ]
+
+    @staticmethod
+    def _format_type(dtype) -> str:
+        """Convert Ibis type to a human-readable string (e.g. !int32 -> int32 NOT NULL)."""
+        return format_ibis_type(dtype)
+
+    @memoized
+    def preview(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the first N rows as a list of JSON-safe dictionaries.
+
+        The preview options can cap the number of columns, truncate large values
+        and sample the table instead of reading its first rows (see `preview_table`).
+        """
+        return preview_table(self.table, limit, self._preview_options)
+
+    @memoized
+    def row_count(self) -> int | None:
+        """Return the total number of rows in the table, or None when row counts are turned off.
+
+        In `estimate` mode the count comes from catalog statistics when available.
+        """
+        if self._row_count_mode == "off":
+            return None
+        if self.row_count_is_estimate():
+            return int(self._metadata.row_count)  # type: ignore[union-attr, arg-type]
+        return self.table.count().execute()
+
+    @memoized
+    def profile(self) -> dict[str, Any] | None:
+        """Return column statistics computed over the first `sample_rows` rows of the table.
+
+        Each column reports its null count and ratio, and depending on its type
+        an approximate distinct count, min/max and its most frequent values
+        (see `profile_table`).
+
+        Returns None when profiling is disabled. When scanning the table would
+        exceed the connection's bytes budget, returns a profile with `skipped`
+        set and no columns.
+        """
+        options = self._profile_options
+        if not options.enabled:
+            return None
+
+        columns = self.columns()
+        if not reserve_scan(options, columns, self._metadata.row_count if self._metadata else None):
+            return skipped_profile("bytes budget exhausted")
+
+        return profile_table(self.table, columns, options)
+
+    def row_count_is_estimate(self) -> bool:
+        """Whether `row_count()` comes from catalog statistics rather than an exact COUNT(*)."""
+        return (
+            self._row_count_mode == "estimate" and self._metadata is not None and self._metadata.row_count is not None
+        )
+
+    def prefetch(self) -> None:
+        """Run the metadata queries of the default templates ahead of rendering.
+
+        Results are memoized, so rendering afterwards does not wait on the
+        warehouse. Failures are left for the templates to report.
+        """
+        for method in (self.columns, self.row_count, self.preview, self.description, self.profile):
+            try:
+                method()
+            except query_errors():
+                logger.debug("Prefetching %s failed", method.__name__, exc_info=True)
+
+    def bind(self, conn: BaseBackend) -> None:
+        """Run further queries on another connection, e.g. once handed over to another thread."""
+        self._conn = conn
+        self._table_ref = None
+
+    def column_count(self) -> int:
+        """Return the number of columns in the table."""
+        return len(self.columns())
+
+    @memoized
+    def description(self) -> str | None:
+        """Return the table comment, when the bulk-loaded metadata has one."""
+        return self._metadata.description if self._metadata is not None else None
@@ -1,14 +1,22 @@
+import logging
 import os
-from typing import Literal
+import re
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
 import certifi
 import ibis
 from ibis import BaseBackend
-from pydantic import Field
+from ibis.backends.sql.datatypes import DatabricksType
+from pydantic import Field, PrivateAttr
 
 from nao_core.ui import ask_text
 
 from .base import DatabaseConfig
+from .catalog import TableMetadata, build_schema_metadata, fetch_rows, query_errors, quote_identifier, quote_literal
+from .registry import connection_registry
+
+logger = logging.getLogger(__name__)
 
 # Ensure Python uses certifi's CA bundle for SSL verification.
 # This fixes "certificate verify failed" errors when Python's default CA path is empty.
@@ -16,6 +24,17 @@ os.environ.setdefault("SSL_CERT_FILE", certifi.where())
 os.environ.setdefault("REQUESTS_CA_BUNDLE", certifi.where())
 
 
+@dataclass
+class _UnityCatalogSnapshot:
+    """Tables and columns of the synced catalogs, loaded from `system.information_schema`."""
+
+    tables: dict[str, dict[str, TableMetadata]] = field(default_factory=dict)
+    """Schema -> table -> column metadata and last-altered time"""
+
+    delta_tables: dict[str, list[str]] = field(default_factory=dict)
+    """Schema -> names of the Delta tables, which `DESCRIBE DETAIL` reports statistics for"""
+
+
 class DatabricksConfig(DatabaseConfig):
     """Databricks-specific configuration."""
 
@@ -24,11 +43,17 @@ class DatabricksConfig(DatabaseConfig):
     http_path: str = Field(description="HTTP path to the SQL warehouse or cluster")
     access_token: str = Field(description="Databricks personal access token")
     catalog: str | None = Field(default=None, description="Unity Catalog name (optional)")
+    catalogs: list[str] | None = Field(
+        default=None,
+        description="Unity Catalog catalogs to sync together; schemas are then named '<catalog>.<schema>' (optional)",
+    )
     schema_name: str | None = Field(
         default=None,
         description="Default schema (optional)",
     )
 
+    _snapshot: _UnityCatalogSnapshot | None = PrivateAttr(default=None)
+
     @classmethod
     def promptConfig(cls) -> "DatabricksConfig":
         """Interactively prompt the user for Databricks configuration."""
@@ -66,24 +91,207 @@ class DatabricksConfig(DatabaseConfig):
 
     def get_database_name(self) -> str:
         """Get the database name for Databricks."""
+        if self.catalogs and not self.catalog:
+            # Several catalogs are synced into one folder, named after the connection
+            return self.name
         return self.catalog or "main"
 
+    def _split_schema(self, schema: str) -> tuple[str | None, str]:
+        """Split a synced schema name into its catalog (None for the current one) and schema."""
+        if self.catalogs:
+            catalog, _, name = schema.partition(".")
+            return catalog, name
+        return self.catalog, schema
+
+    @staticmethod
+    def _catalog_sql(catalog: str | None) -> str:
+        return quote_literal(catalog, "databricks") if catalog else "current_catalog()"
+
     def get_schemas(self, conn: BaseBackend) -> list[str]:
+        if self._snapshot is not None:
+            return sorted(self._snapshot.tables)
+        if self.catalogs:
+            if self.schema_name:
+                return [f"{catalog}.{self.schema_name}" for catalog in self.catalogs]
+            return [
+                f"{catalog}.{schema}"
+                for catalog in self.catalogs
+                for schema in conn.list_databases(catalog=catalog)  # type: ignore[attr-defined]
+                if schema != "information_schema"
+            ]
         if self.schema_name:
             return [self.schema_name]
         list_databases = getattr(conn, "list_databases", None)
         return list_databases() if list_databases else []
 
+    def load_catalog(self, conn: BaseBackend) -> None:
+        """Load the tables and columns of every synced catalog from `system.information_schema`.
+
+        Each catalog takes one query on `tables` and one on `columns`, filtered
+        by the configured schema and the include/exclude patterns, instead of
+        listing and describing tables one by one. If the queries fail (e.g.
+        outside Unity Catalog), schemas are introspected one by one.
+        """
+        snapshot = _UnityCatalogSnapshot()
+        try:
+            for catalog in self.catalogs or [self.catalog]:
+                self._load_catalog_tables(conn, catalog, snapshot)
+        except query_errors():
+            logger.debug("Could not load the Unity Catalog snapshot, introspecting schemas one by one", exc_info=True)
+            self._snapshot = None
+            return
+        self._snapshot = snapshot
+
+    def _load_catalog_tables(self, conn: BaseBackend, catalog: str | None, snapshot: _UnityCatalogSnapshot) -> None:
+        if self.catalogs:
+            prefix = f"{catalog}."
+            full_name = "(table_catalog || '.' || table_schema || '.' || table_name)"
+        else:
+            prefix = ""
+            full_name = "(table_schema || '.' || table_name)"
+
+        conditions = [f"table_catalog = {self._catalog_sql(catalog)}", "table_schema <> 'information_schema'"]
+        if self.schema_name:
+            conditions.append(f"table_schema = {quote_literal(self.schema_name, 'databricks')}")
+        if predicate := self.full_name_pattern_predicate(full_name, "databricks"):
+            conditions.append(predicate)
+        where = " AND ".join(conditions)
+
+        tables_query = f"""
+            SELECT table_schema, table_name, comment, data_source_format, last_altered
+            FROM system.information_schema.tables
+            WHERE {where}
+        """
+        columns_query = f"""
+            SELECT table_schema, table_name, column_name, full_data_type, is_nullable, comment
+            FROM system.information_schema.columns
+            WHERE {where}
+            ORDER BY table_schema, table_name, ordinal_position
+        """
+
+        by_schema: dict[str, list[tuple[Any, ...]]] = {}
+        for schema, *column in fetch_rows(conn, columns_query):
+            by_schema.setdefault(schema, []).append(tuple(column))
+        columns = {schema: build_schema_metadata(rows, DatabricksType) for schema, rows in by_schema.items()}
+
+        for schema, table, comment, data_source_format, last_altered in fetch_rows(conn, tables_query):
+            metadata = columns.get(schema, {}).get(table) or TableMetadata()
+            metadata.description = comment or None
+            metadata.last_modified = last_altered
+            snapshot.tables.setdefault(prefix + schema, {})[table] = metadata
+            if data_source_format == "DELTA":
+                snapshot.delta_tables.setdefault(prefix + schema, []).append(table)
+
+    def clear_catalog(self) -> None:
+        self._snapshot = None
+
+    def list_tables(self, conn: BaseBackend, schema: str) -> list[str]:
+        """List tables from the catalog snapshot, or from `system.information_schema`."""
+        if self._snapshot is not None:
+            return [name for name in self._snapshot.tables.get(schema, {}) if self.matches_pattern(schema, name)]
+        return super().list_tables(conn, schema)
+
+    def tables_query(self, schema: str) -> str | None:
+        """List tables and views from the Unity Catalog `system.information_schema`, filtered by the include/exclude patterns."""
+        catalog, name = self._split_schema(schema)
+        predicate = self.table_pattern_predicate(schema, "table_name", "databricks")
+        return f"""
+            SELECT table_name
+            FROM system.information_schema.tables
+            WHERE table_catalog = {self._catalog_sql(catalog)}
+              AND table_schema = {quote_literal(name, "databricks")}
+              {f"AND {predicate}" if predicate else ""}
+        """
+
+    def load_schema_metadata(self, conn: BaseBackend, schema: str) -> dict[str, TableMetadata] | None:
+        """Load all columns of a schema and their comments from the catalog snapshot, or from `system.information_schema`."""
+        if self._snapshot is not None:
+            return self._snapshot.tables.get(schema, {})
+
+        catalog, name = self._split_schema(schema)
+        query = f"""
+            SELECT c.table_name, c.column_name, c.full_data_type, c.is_nullable, c.comment, t.comment
+            FROM system.information_schema.columns c
+            LEFT JOIN system.information_schema.tables t
+                ON t.table_catalog = c.table_catalog
+                AND t.table_schema = c.table_schema
+                AND t.table_name = c.table_name
+            WHERE c.table_catalog = {self._catalog_sql(catalog)}
+              AND c.table_schema = {quote_literal(name, "databricks")}
+            ORDER BY c.table_name, c.ordinal_position
+        """
+        return build_schema_metadata(fetch_rows(conn, query), DatabricksType)
+
+    def get_table_stats(self, conn: BaseBackend, schema: str) -> dict[str, dict[str, Any]]:
+        """Read the size and last commit time of each Delta table with `DESCRIBE DETAIL` (no table scan).
+
+        `DESCRIBE DETAIL` reads the Delta log only, so it is only run for
+        statistics; columns come from `system.information_schema`.
+        """
+        if self._snapshot is not None:
+            delta_tables = self._snapshot.delta_tables.get(schema, [])
+        else:
+            catalog, name = self._split_schema(schema)
+            query = f"""
+                SELECT table_name
+                FROM system.information_schema.tables
+                WHERE table_catalog = {self._catalog_sql(catalog)}
+                  AND table_schema = {quote_literal(name, "databricks")}
+                  AND data_source_format = 'DELTA'
+            """
+            delta_tables = [row[0] for row in fetch_rows(conn, query)]
+
+        stats = {}
+        for table in delta_tables:
+            if not self.matches_pattern(schema, table):
+                continue
+            try:
+                detail = _fetch_record(conn, f"DESCRIBE DETAIL {self._table_identifier(schema, table)}")
+            except query_errors():
+                logger.debug("DESCRIBE DETAIL failed for %s.%s", schema, table, exc_info=True)
+                continue
+            if detail is not None:
+                stats[table] = {"last_modified": detail.get("lastModified"), "size_bytes": detail.get("sizeInBytes")}
+        return stats
+
+    def _table_identifier(self, schema: str, table: str) -> str:
+        catalog, name = self._split_schema(schema)
+        parts = (catalog, name, table) if self.catalogs else (name, table)
+        return ".".join(quote_identifier(part, "databricks") for part in parts if part is not None)
+
+    def estimate_row_count(self, conn: BaseBackend, schema: str, table: str) -> int | None:
+        """Read the row count from the table statistics (populated by ANALYZE TABLE).
+
+        `DESCRIBE TABLE EXTENDED` reports them as e.g. "Statistics: 1024 bytes, 42 rows".
+        """
+        for row in fetch_rows(conn, f"DESCRIBE TABLE EXTENDED {self._table_identifier(schema, table)}"):
+            if row and row[0] == "Statistics":
+                match = re.search(r"(\d+) rows", str(row[1]))
+                return int(match.group(1)) if match else None
+        return None
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to Databricks."""
         try:
-            conn = self.connect()
-            if self.schema_name:
-                tables = conn.list_tables()
-                return True, f"Connected successfully ({len(tables)} tables found)"
-            if list_databases := getattr(conn, "list_databases", None):
-                schemas = list_databases()
-                return True, f"Connected successfully ({len(schemas)} schemas found)"
-            return True, "Connected successfully"
+            with connection_registry.lease(self) as conn:
+                if self.schema_name:
+                    tables = conn.list_tables()
+                    return True, f"Connected successfully ({len(tables)} tables found)"
+                if list_databases := getattr(conn, "list_databases", None):
+                    schemas = list_databases()
+                    return True, f"Connected successfully ({len(schemas)} schemas found)"
+                return True, "Connected successfully"
         except Exception as e:
             return False, str(e)
+
+
+def _fetch_record(conn: BaseBackend, query: str) -> dict[str, Any] | None:
+    """Run a query returning a single row, and return it keyed by column name."""
+    cursor = conn.raw_sql(query)  # type: ignore[attr-defined]
+    try:
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip((column[0] for column in cursor.description), row))
+    finally:
+        cursor.close()
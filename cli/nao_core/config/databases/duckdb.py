@@ -1,13 +1,131 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import ibis
 from ibis import BaseBackend
-from pydantic import Field
+from ibis.backends.sql.datatypes import DuckDBType
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from nao_core.ui import ask_text
 
-from .base import DatabaseConfig
+from .base import DatabaseConfig, resolve_path
+from .catalog import TableMetadata, build_schema_metadata, fetch_rows, quote_identifier, quote_literal
+from .registry import connection_registry
+
+FileFormat = Literal["parquet", "csv", "json"]
+
+# File extensions of each format, and the DuckDB function reading it
+_FILE_EXTENSIONS: dict[str, tuple[str, ...]] = {
+    "parquet": (".parquet",),
+    "csv": (".csv", ".tsv"),
+    "json": (".json", ".jsonl", ".ndjson"),
+}
+_FILE_READERS = {"parquet": "read_parquet", "csv": "read_csv", "json": "read_json"}
+
+
+class DuckDBFileSource(BaseModel):
+    """Directory of data files exposed as views by a DuckDB connection."""
+
+    path: str = Field(description="Directory containing Parquet, CSV or JSON files")
+    schema_name: str = Field(default="main", description="Schema the views are created in")
+    formats: list[FileFormat] = Field(
+        default_factory=lambda: ["parquet", "csv", "json"],
+        description="File formats to expose",
+    )
+
+
+@dataclass
+class FileView:
+    """A view over one data file, or over all files of a (possibly partitioned) subdirectory."""
+
+    schema: str
+    name: str
+    format: str
+    files: list[Path]
+    globs: list[str]
+    """Paths or glob patterns passed to the reader"""
+
+    def create_sql(self) -> str:
+        target = f"{quote_identifier(self.schema, 'duckdb')}.{quote_identifier(self.name, 'duckdb')}"
+        paths = ", ".join(quote_literal(glob, "duckdb") for glob in self.globs)
+        return f"CREATE OR REPLACE VIEW {target} AS SELECT * FROM {_FILE_READERS[self.format]}([{paths}])"
+
+
+def _file_format(path: Path, formats: list[FileFormat]) -> str | None:
+    suffix = path.suffix.lower()
+    return next((fmt for fmt in formats if suffix in _FILE_EXTENSIONS[fmt]), None)
+
+
+def _is_hidden(name: str) -> bool:
+    # Spark and Hive write markers such as _SUCCESS and .crc files next to the data
+    return name.startswith((".", "_"))
+
+
+def discover_file_views(source: DuckDBFileSource) -> list[FileView]:
+    """List the views exposing the files of a source directory.
+
+    Each data file at the top of the directory becomes a view named after the
+    file, and each subdirectory whose files all share a format becomes a single
+    view over all of them (e.g. a Hive-partitioned dataset, whose partition
+    columns DuckDB adds to the view). Only file names are read.
+    """
+    root = Path(source.path).expanduser()
+    views: dict[str, FileView] = {}
+    for entry in sorted(root.iterdir()):
+        if _is_hidden(entry.name):
+            continue
+        if entry.is_file():
+            if (fmt := _file_format(entry, source.formats)) is not None:
+                views.setdefault(entry.stem, FileView(source.schema_name, entry.stem, fmt, [entry], [str(entry)]))
+            continue
+
+        files = [
+            f
+            for f in sorted(entry.rglob("*"))
+            if f.is_file() and not any(_is_hidden(part) for part in f.relative_to(entry).parts)
+        ]
+        # Formats left out of the source still count, so a mixed directory is never partially exposed
+        by_format: dict[str, list[Path]] = {}
+        for f in files:
+            if (fmt := _file_format(f, list(_FILE_EXTENSIONS))) is not None:
+                by_format.setdefault(fmt, []).append(f)
+        if len(by_format) != 1 or next(iter(by_format)) not in source.formats:
+            continue
+
+        fmt, data_files = by_format.popitem()
+        suffixes = sorted({f.suffix for f in data_files})
+        globs = [str(entry / "**" / f"*{suffix}") for suffix in suffixes]
+        views.setdefault(entry.name, FileView(source.schema_name, entry.name, fmt, data_files, globs))
+    return list(views.values())
+
+
+def file_view_stats(conn: BaseBackend, views: list[FileView]) -> dict[str, dict[str, Any]]:
+    """Statistics of file views, read from file metadata only.
+
+    Sizes and last-modified times come from the file system. Row counts of
+    Parquet views are summed from the Parquet footers of their files with a
+    single `parquet_file_metadata` query; other formats would need a scan.
+    """
+    stats: dict[str, dict[str, Any]] = {}
+    for view in views:
+        file_stats = [f.stat() for f in view.files]
+        stats[view.name] = {
+            "row_count": None,
+            "size_bytes": sum(st.st_size for st in file_stats),
+            "last_modified": datetime.fromtimestamp(max(st.st_mtime for st in file_stats), tz=timezone.utc),
+        }
+
+    parquet_views = [view for view in views if view.format == "parquet"]
+    if parquet_views:
+        view_of_file = {str(f): view.name for view in parquet_views for f in view.files}
+        paths = ", ".join(quote_literal(path, "duckdb") for path in view_of_file)
+        query = f"SELECT file_name, num_rows FROM parquet_file_metadata([{paths}])"
+        for file_name, num_rows in fetch_rows(conn, query):
+            view_stats = stats[view_of_file[file_name]]
+            view_stats["row_count"] = (view_stats["row_count"] or 0) + num_rows
+    return stats
 
 
 class DuckDBConfig(DatabaseConfig):
@@ -15,6 +133,19 @@ class DuckDBConfig(DatabaseConfig):
 
     type: Literal["duckdb"] = "duckdb"
     path: str = Field(description="Path to the DuckDB database file", default=":memory:")
+    file_sources: list[DuckDBFileSource] = Field(
+        default_factory=list,
+        description="Directories of Parquet/CSV/JSON files to expose as views (requires an in-memory database)",
+    )
+
+    # Views created by the last connect(), reused to compute their statistics
+    _file_views: list[FileView] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def check_file_sources(self) -> "DuckDBConfig":
+        if self.file_sources and self.path != ":memory:":
+            raise ValueError("file_sources require an in-memory database (path: ':memory:')")
+        return self
 
     @classmethod
     def promptConfig(cls) -> "DuckDBConfig":
@@ -25,23 +156,93 @@ class DuckDBConfig(DatabaseConfig):
         return DuckDBConfig(name=name, path=path)
 
     def connect(self) -> BaseBackend:
-        """Create an Ibis DuckDB connection."""
-        return ibis.duckdb.connect(
+        """Create an Ibis DuckDB connection, with a view over each data file of the file sources."""
+        conn = ibis.duckdb.connect(
             database=self.path,
             read_only=False if self.path == ":memory:" else True,
         )
+        if self.file_sources:
+            views = self.discover_file_views()
+            for schema in sorted({view.schema for view in views}):
+                conn.raw_sql(f"CREATE SCHEMA IF NOT EXISTS {quote_identifier(schema, 'duckdb')}")
+            for view in views:
+                conn.raw_sql(view.create_sql())
+            self._file_views = views
+        return conn
+
+    def resolve_paths(self, base: Path) -> None:
+        """Resolve the database file and the file source directories against `base`."""
+        if self.path != ":memory:":
+            self.path = resolve_path(self.path, base)
+        for source in self.file_sources:
+            source.path = resolve_path(source.path, base)
+
+    def discover_file_views(self) -> list[FileView]:
+        """List the views exposing the files of every file source."""
+        return [view for source in self.file_sources for view in discover_file_views(source)]
 
     def get_database_name(self) -> str:
         """Get the database name for DuckDB."""
         if self.path == ":memory:":
-            return "memory"
+            # File sources are synced under the connection name
+            return self.name if self.file_sources else "memory"
         return Path(self.path).stem
 
+    def tables_query(self, schema: str) -> str | None:
+        """List tables and views from information_schema, filtered by the include/exclude patterns."""
+        predicate = self.table_pattern_predicate(schema, "table_name", "duckdb")
+        return f"""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_catalog = current_database()
+              AND table_schema = {quote_literal(schema, "duckdb")}
+              {f"AND {predicate}" if predicate else ""}
+        """
+
+    def load_schema_metadata(self, conn: BaseBackend, schema: str) -> dict[str, TableMetadata] | None:
+        """Load all columns of a schema, and the table and column comments, from `duckdb_columns()`."""
+        query = f"""
+            SELECT c.table_name, c.column_name, c.data_type, c.is_nullable, c.comment, t.comment
+            FROM duckdb_columns() c
+            LEFT JOIN (
+                SELECT database_name, schema_name, table_name, comment FROM duckdb_tables()
+                UNION ALL
+                SELECT database_name, schema_name, view_name, comment FROM duckdb_views()
+            ) t USING (database_name, schema_name, table_name)
+            WHERE c.database_name = current_database()
+              AND c.schema_name = {quote_literal(schema, "duckdb")}
+            ORDER BY c.table_name, c.column_index
+        """
+        return build_schema_metadata(fetch_rows(conn, query), DuckDBType)
+
+    def get_table_stats(self, conn: BaseBackend, schema: str) -> dict[str, dict[str, Any]]:
+        """Read row estimates from `duckdb_tables()`, and the statistics of file views from file metadata."""
+        query = f"""
+            SELECT table_name, estimated_size
+            FROM duckdb_tables()
+            WHERE database_name = current_database()
+              AND schema_name = {quote_literal(schema, "duckdb")}
+        """
+        stats = {table_name: {"row_count": row_count} for table_name, row_count in fetch_rows(conn, query)}
+        if self.file_sources:
+            views = self._file_views if self._file_views is not None else self.discover_file_views()
+            stats.update(file_view_stats(conn, [view for view in views if view.schema == schema]))
+        return stats
+
+    def cancel_query(self, conn: BaseBackend) -> bool:
+        """Interrupt the running query with `DuckDBPyConnection.interrupt()`."""
+        conn.con.interrupt()
+        return True
+
+    def supports_worker_connections(self) -> bool:
+        """In-memory databases cannot be shared across worker connections, unless they only hold file views."""
+        return self.path != ":memory:" or bool(self.file_sources)
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to DuckDB."""
         try:
-            conn = self.connect()
-            tables = conn.list_tables()
-            return True, f"Connected successfully ({len(tables)} tables found)"
+            with connection_registry.lease(self) as conn:
+                tables = conn.list_tables()
+                return True, f"Connected successfully ({len(tables)} tables found)"
         except Exception as e:
             return False, str(e)
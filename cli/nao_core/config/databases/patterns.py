@@ -0,0 +1,181 @@
+"""Compiled matching and SQL pushdown of include/exclude glob patterns."""
+
+import fnmatch
+import re
+
+from .catalog import quote_literal
+
+_WILDCARDS = "*?["
+_LIKE_ESCAPE = "\\"
+_END = ""  # Trie key marking the end of an include prefix
+
+
+def glob_to_like(pattern: str) -> str | None:
+    """Translate a glob pattern to an equivalent SQL LIKE pattern, or None if it cannot be translated.
+
+    `*` becomes `%` and `?` becomes `_`; literal `%`, `_` and `\\` are escaped
+    with a backslash (see `like_escape_clause`). Character classes (`[...]`) have
+    no LIKE equivalent.
+    """
+    if "[" in pattern:
+        return None
+
+    like = []
+    for char in pattern:
+        if char == "*":
+            like.append("%")
+        elif char == "?":
+            like.append("_")
+        elif char in ("%", "_", _LIKE_ESCAPE):
+            like.append(_LIKE_ESCAPE + char)
+        else:
+            like.append(char)
+    return "".join(like)
+
+
+def like_escape_clause(dialect: str) -> str:
+    """Return the clause declaring backslash as the LIKE escape character.
+
+    BigQuery has no ESCAPE clause but always treats backslash as the escape character.
+    """
+    if dialect == "bigquery":
+        return ""
+    return " ESCAPE " + quote_literal(_LIKE_ESCAPE, dialect)
+
+
+def literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for i, char in enumerate(pattern):
+        if char in _WILDCARDS:
+            return pattern[:i]
+    return pattern
+
+
+def like_predicate(
+    schema: str,
+    table_column: str,
+    include: list[str],
+    exclude: list[str],
+    dialect: str,
+    case_insensitive: bool = False,
+) -> str | None:
+    """Build a SQL condition matching the `schema.table` names allowed by the patterns.
+
+    The condition compares `'<schema>.' || <table_column>` with each pattern, the
+    same way `matches_pattern` compares the full name. Patterns that cannot be
+    translated (see `glob_to_like`) are left to `matches_pattern`: include
+    patterns are only pushed down when all of them can be translated, and
+    untranslatable exclude patterns are skipped, so the condition never rejects
+    an allowed table.
+
+    Returns None when there is nothing to filter.
+    """
+    full_name = f"({quote_literal(f'{schema}.', dialect)} || {table_column})"
+    return full_name_like_predicate(full_name, include, exclude, dialect, case_insensitive)
+
+
+def full_name_like_predicate(
+    full_name: str,
+    include: list[str],
+    exclude: list[str],
+    dialect: str,
+    case_insensitive: bool = False,
+) -> str | None:
+    """Same as `like_predicate`, for a SQL expression evaluating to the full `schema.table` name.
+
+    Used by catalog queries that span several schemas.
+    """
+    operator = "ILIKE" if case_insensitive else "LIKE"
+    escape = like_escape_clause(dialect)
+
+    def matches(like: str) -> str:
+        return f"{full_name} {operator} {quote_literal(like, dialect)}{escape}"
+
+    conditions = []
+    include_likes = [glob_to_like(p) for p in include]
+    if include_likes and all(like is not None for like in include_likes):
+        conditions.append("(" + " OR ".join(matches(like) for like in include_likes if like is not None) + ")")
+
+    exclude_likes = [like for like in (glob_to_like(p) for p in exclude) if like is not None]
+    conditions.extend(f"NOT ({matches(like)})" for like in exclude_likes)
+
+    return " AND ".join(conditions) if conditions else None
+
+
+class PatternMatcher:
+    """Include/exclude glob patterns compiled once for a database config.
+
+    Each side is compiled into a single regex (an alternation of the patterns
+    translated by `fnmatch.translate`), so checking a table is one regex match
+    per side instead of one `fnmatch` call per pattern. Case-insensitive
+    matchers fold the patterns once, and each name once per check.
+
+    The literal prefixes of the include patterns (the part before the first
+    wildcard) are stored in a trie, used by `schema_may_match` to rule out
+    whole schemas.
+    """
+
+    def __init__(self, include: list[str], exclude: list[str], case_insensitive: bool = False):
+        self.case_insensitive = case_insensitive
+        if case_insensitive:
+            include = [p.lower() for p in include]
+            exclude = [p.lower() for p in exclude]
+
+        self._include = _compile(include)
+        self._exclude = _compile(exclude)
+        # Exclude patterns of the form "<schema glob>.*" cover every table of the matching schemas
+        self._excluded_schemas = _compile([p[:-2] for p in exclude if p.endswith(".*")])
+
+        self._prefixes: dict | None = None
+        if include:
+            self._prefixes = {}
+            for pattern in include:
+                node = self._prefixes
+                for char in literal_prefix(pattern):
+                    node = node.setdefault(char, {})
+                node[_END] = {}
+
+    def matches(self, schema: str, table: str) -> bool:
+        """Check if a schema.table is included and not excluded."""
+        full_name = f"{schema}.{table}"
+        if self.case_insensitive:
+            full_name = full_name.lower()
+
+        if self._include is not None and not self._include.match(full_name):
+            return False
+        return self._exclude is None or not self._exclude.match(full_name)
+
+    def schema_may_match(self, schema: str) -> bool:
+        """Whether any table of a schema could be matched.
+
+        A schema is ruled out when no include pattern's literal prefix is
+        compatible with `<schema>.` (e.g. `analytics.*` rules out `sales`), or
+        when an exclude pattern of the form `<schema glob>.*` matches it. May
+        return True for a schema none of whose tables match, never False for
+        one that has some.
+        """
+        if self.case_insensitive:
+            schema = schema.lower()
+
+        if self._excluded_schemas is not None and self._excluded_schemas.match(schema):
+            return False
+        if self._prefixes is None:
+            return True
+
+        # Walk "<schema>." down the trie: a prefix ending on the way, or the
+        # walk ending inside the trie, means some include pattern fits
+        node = self._prefixes
+        for char in f"{schema}.":
+            if _END in node:
+                return True
+            child = node.get(char)
+            if child is None:
+                return False
+            node = child
+        return True
+
+
+def _compile(patterns: list[str]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
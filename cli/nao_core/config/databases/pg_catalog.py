@@ -0,0 +1,201 @@
+"""Bulk catalog introspection shared by the Postgres family (Postgres, Redshift)."""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from ibis import BaseBackend
+from ibis.backends.sql.datatypes import PostgresType
+
+from .catalog import TableMetadata, fetch_rows, format_column_type, is_nullable, query_errors
+
+logger = logging.getLogger(__name__)
+
+_POSTGRES_SCHEMA_QUERY = """
+    SELECT
+        c.relname,
+        td.description,
+        CASE WHEN c.relkind = 'v' OR c.reltuples < 0 THEN NULL ELSE c.reltuples::bigint END,
+        a.attname,
+        format_type(a.atttypid, a.atttypmod),
+        NOT a.attnotnull,
+        cd.description
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_catalog.pg_attribute a
+        ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    LEFT JOIN pg_catalog.pg_description td
+        ON td.objoid = c.oid AND td.classoid = 'pg_catalog.pg_class'::regclass AND td.objsubid = 0
+    LEFT JOIN pg_catalog.pg_description cd
+        ON cd.objoid = c.oid AND cd.classoid = 'pg_catalog.pg_class'::regclass AND cd.objsubid = a.attnum
+    WHERE n.nspname = %s
+      AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+      {table_filter}
+    ORDER BY c.relname, a.attnum
+"""
+
+_REDSHIFT_SCHEMA_QUERY = """
+    SELECT
+        c.table_name,
+        t.remarks,
+        c.column_name,
+        c.data_type,
+        c.is_nullable,
+        c.character_maximum_length,
+        c.numeric_precision,
+        c.numeric_scale,
+        c.remarks
+    FROM svv_columns c
+    LEFT JOIN svv_tables t ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+    WHERE c.table_schema = %s
+      {table_filter}
+    ORDER BY c.table_name, c.ordinal_position
+"""
+
+_REDSHIFT_ROW_ESTIMATES_QUERY = """
+    SELECT "table", tbl_rows
+    FROM svv_table_info
+    WHERE "schema" = %s
+"""
+
+_REDSHIFT_TYPES = {
+    "integer": "int32",
+    "bigint": "int64",
+    "smallint": "int16",
+    "boolean": "boolean",
+    "real": "float32",
+    "double precision": "float64",
+    "character varying": "string",
+    "character": "string",
+    "text": "string",
+    "date": "date",
+    "timestamp without time zone": "timestamp",
+    "timestamp with time zone": "timestamp",
+}
+
+
+def load_postgres_schema(conn: BaseBackend, schema: str, table: str | None = None) -> dict[str, TableMetadata]:
+    """Load the relations of a schema from pg_catalog with a single parameterized query.
+
+    Each table gets its columns (types rendered by `format_type`), its comment
+    and its columns' comments (`pg_description`), and the planner's row
+    estimate (`pg_class.reltuples`, refreshed by VACUUM/ANALYZE). Pass `table`
+    to load a single relation.
+    """
+    params: list[Any] = [schema]
+    table_filter = ""
+    if table is not None:
+        table_filter = "AND c.relname = %s"
+        params.append(table)
+
+    rows = fetch_rows(conn, _POSTGRES_SCHEMA_QUERY.format(table_filter=table_filter), params)
+    return group_relations(
+        (
+            table_name,
+            table_comment,
+            row_estimate,
+            column_name,
+            None if column_name is None else format_column_type(column_type, nullable, PostgresType),
+            nullable,
+            column_comment,
+        )
+        for table_name, table_comment, row_estimate, column_name, column_type, nullable, column_comment in rows
+    )
+
+
+def load_redshift_schema(conn: BaseBackend, schema: str, table: str | None = None) -> dict[str, TableMetadata]:
+    """Load the relations of a schema from Redshift's `svv_columns` and `svv_tables`.
+
+    Unlike `information_schema`, the `svv_` views also cover late-binding views
+    and external (Spectrum) tables. Row estimates come from `svv_table_info`
+    when a whole schema is loaded; they are left out if it cannot be read.
+    Redshift runs system views on the leader node and `svv_table_info` on the
+    compute nodes, so they cannot be joined in a single query.
+    """
+    params: list[Any] = [schema]
+    table_filter = ""
+    if table is not None:
+        table_filter = "AND c.table_name = %s"
+        params.append(table)
+
+    rows = fetch_rows(conn, _REDSHIFT_SCHEMA_QUERY.format(table_filter=table_filter), params)
+    tables = group_relations(
+        (
+            table_name,
+            table_comment,
+            None,
+            column_name,
+            format_redshift_type(data_type, is_nullable(nullable), char_length, num_precision, num_scale),
+            is_nullable(nullable),
+            column_comment,
+        )
+        for (
+            table_name,
+            table_comment,
+            column_name,
+            data_type,
+            nullable,
+            char_length,
+            num_precision,
+            num_scale,
+            column_comment,
+        ) in rows
+    )
+
+    if table is None:
+        try:
+            estimates = load_redshift_row_estimates(conn, schema)
+        except query_errors():
+            logger.debug("Could not read row estimates of schema %s from svv_table_info", schema, exc_info=True)
+            estimates = {}
+        for table_name, row_count in estimates.items():
+            if table_name in tables:
+                tables[table_name].row_count = row_count
+    return tables
+
+
+def load_redshift_row_estimates(conn: BaseBackend, schema: str) -> dict[str, int | None]:
+    """Read row estimates from `svv_table_info` (includes rows not yet vacuumed)."""
+    return dict(fetch_rows(conn, _REDSHIFT_ROW_ESTIMATES_QUERY, [schema]))
+
+
+def format_redshift_type(
+    data_type: str,
+    nullable: bool,
+    char_length: int | None,
+    num_precision: int | None,
+    num_scale: int | None,
+) -> str:
+    """Convert a Redshift SQL type to the Ibis-like format of the other backends."""
+    ibis_type = _REDSHIFT_TYPES.get(data_type, "string")
+    return ibis_type if nullable else f"{ibis_type} NOT NULL"
+
+
+def group_relations(rows: Iterable[tuple[Any, ...]]) -> dict[str, TableMetadata]:
+    """Group catalog rows into per-table metadata.
+
+    Args:
+        rows: `(table_name, table_comment, row_estimate, column_name, column_type,
+            nullable, column_comment)` tuples, ordered by table and column
+            position, with a formatted `column_type`. Relations without columns
+            come as a single row whose `column_name` is None.
+    """
+    tables: dict[str, TableMetadata] = {}
+    for table_name, table_comment, row_estimate, column_name, column_type, nullable, column_comment in rows:
+        metadata = tables.get(table_name)
+        if metadata is None:
+            metadata = tables[table_name] = TableMetadata(
+                columns=[],
+                row_count=None if row_estimate is None else int(row_estimate),
+                description=table_comment or None,
+            )
+        if column_name is not None:
+            metadata.columns.append(  # type: ignore[union-attr]
+                {
+                    "name": column_name,
+                    "type": column_type,
+                    "nullable": bool(nullable),
+                    "description": column_comment or None,
+                }
+            )
+    return tables
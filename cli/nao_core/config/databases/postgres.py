@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Literal
 
 import ibis
 from ibis import BaseBackend
@@ -8,6 +8,9 @@ from nao_core.config.exceptions import InitError
 from nao_core.ui import ask_text
 
 from .base import DatabaseConfig
+from .catalog import TableMetadata, fetch_rows, quote_literal
+from .pg_catalog import load_postgres_schema
+from .registry import connection_registry
 
 
 class PostgresConfig(DatabaseConfig):
@@ -64,6 +67,11 @@ class PostgresConfig(DatabaseConfig):
             **kwargs,
         )
 
+    def cancel_query(self, conn: BaseBackend) -> bool:
+        """Send a cancel request for the running query to the server."""
+        conn.con.cancel()
+        return True
+
     def get_database_name(self) -> str:
         """Get the database name for Postgres."""
         return self.database
@@ -78,16 +86,43 @@ class PostgresConfig(DatabaseConfig):
             return [s for s in schemas if s not in ("pg_catalog", "information_schema") and not s.startswith("pg_")]
         return []
 
+    def tables_query(self, schema: str) -> str | None:
+        """List tables, views and foreign tables from pg_catalog, filtered by the include/exclude patterns."""
+        predicate = self.table_pattern_predicate(schema, "c.relname", "postgres")
+        return f"""
+            SELECT c.relname
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = {quote_literal(schema, "postgres")}
+              AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+              {f"AND {predicate}" if predicate else ""}
+        """
+
+    def load_schema_metadata(self, conn: BaseBackend, schema: str) -> dict[str, TableMetadata] | None:
+        """Load the columns, comments and row estimates of every table of a schema with one pg_catalog query."""
+        return load_postgres_schema(conn, schema)
+
+    def get_table_stats(self, conn: BaseBackend, schema: str) -> dict[str, dict[str, Any]]:
+        """Read planner row estimates (`pg_class.reltuples`), refreshed by VACUUM/ANALYZE."""
+        query = """
+            SELECT c.relname, CASE WHEN c.reltuples < 0 THEN NULL ELSE c.reltuples::bigint END
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+              AND c.relkind IN ('r', 'p', 'm', 'f')
+        """
+        return {table_name: {"row_count": row_count} for table_name, row_count in fetch_rows(conn, query, [schema])}
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to PostgreSQL."""
         try:
-            conn = self.connect()
-            if self.schema_name:
-                tables = conn.list_tables()
-                return True, f"Connected successfully ({len(tables)} tables found)"
-            if list_databases := getattr(conn, "list_databases", None):
-                schemas = list_databases()
-                return True, f"Connected successfully ({len(schemas)} schemas found)"
-            return True, "Connected successfully"
+            with connection_registry.lease(self) as conn:
+                if self.schema_name:
+                    tables = conn.list_tables()
+                    return True, f"Connected successfully ({len(tables)} tables found)"
+                if list_databases := getattr(conn, "list_databases", None):
+                    schemas = list_databases()
+                    return True, f"Connected successfully ({len(schemas)} schemas found)"
+                return True, "Connected successfully"
         except Exception as e:
             return False, str(e)
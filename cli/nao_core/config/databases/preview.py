@@ -0,0 +1,129 @@
+"""Helpers for fetching table previews and turning their rows into JSON-safe values."""
+
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+
+from .catalog import query_errors
+
+logger = logging.getLogger(__name__)
+
+TRUNCATION_MARKER = "…"
+
+
+@dataclass(frozen=True)
+class PreviewOptions:
+    """Options controlling how table previews are fetched and rendered."""
+
+    max_columns: int | None = None
+    """Only preview the first N columns of the table"""
+
+    max_cell_bytes: int | None = None
+    """Truncate values whose UTF-8 (or JSON) representation exceeds this many bytes"""
+
+    sample_percent: float | None = None
+    """Preview a TABLESAMPLE of this percentage of the table instead of its first rows"""
+
+
+def json_safe_value(value: Any) -> Any:
+    """Convert a value to something `json.dumps` can serialize, recursing into nested values."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): json_safe_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe_value(v) for v in value]
+    return str(value)
+
+
+def truncate_cell(value: Any, max_bytes: int) -> Any:
+    """Truncate a JSON-safe value whose size exceeds `max_bytes`.
+
+    Strings are cut on a UTF-8 boundary; nested values are replaced by their
+    truncated JSON representation.
+    """
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, (list, dict)):
+        text = json.dumps(value, default=str)
+    else:
+        return value
+
+    encoded = text.encode()
+    if len(encoded) <= max_bytes:
+        return value
+    return encoded[:max_bytes].decode(errors="ignore") + TRUNCATION_MARKER
+
+
+def _is_json_native(arrow_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_boolean(arrow_type)
+        or pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_null(arrow_type)
+    )
+
+
+def arrow_to_rows(table: pa.Table, max_cell_bytes: int | None = None) -> list[dict[str, Any]]:
+    """Convert an Arrow table to a list of JSON-safe row dicts.
+
+    Values are converted column by column, so columns of plain types (numbers,
+    strings, booleans) are copied without inspecting each value.
+    """
+    columns: dict[str, list[Any]] = {}
+    for name, column in zip(table.column_names, table.columns):
+        values = column.to_pylist()
+        if not _is_json_native(column.type):
+            values = [json_safe_value(v) for v in values]
+        if max_cell_bytes is not None:
+            values = [truncate_cell(v, max_cell_bytes) for v in values]
+        columns[name] = values
+
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def tuples_to_rows(
+    names: Sequence[str], rows: Iterable[Sequence[Any]], max_cell_bytes: int | None = None
+) -> list[dict[str, Any]]:
+    """Convert DB-API result tuples to a list of JSON-safe row dicts."""
+    result = []
+    for row in rows:
+        row_dict = {}
+        for i, name in enumerate(names):
+            value = json_safe_value(row[i] if i < len(row) else None)
+            row_dict[name] = truncate_cell(value, max_cell_bytes) if max_cell_bytes is not None else value
+        result.append(row_dict)
+    return result
+
+
+def preview_table(table: Any, limit: int, options: PreviewOptions) -> list[dict[str, Any]]:
+    """Fetch the first `limit` rows of an Ibis table as JSON-safe dictionaries.
+
+    Rows are fetched as Arrow data and converted column by column. The options
+    can cap the number of columns, truncate large values and sample the table
+    (TABLESAMPLE) instead of reading its first rows.
+    """
+    expr = table
+    if options.max_columns is not None and len(expr.columns) > options.max_columns:
+        expr = expr.select(*expr.columns[: options.max_columns])
+
+    result = None
+    if options.sample_percent is not None:
+        try:
+            sampled = expr.sample(options.sample_percent / 100, method="block")
+            result = sampled.limit(limit).to_pyarrow()
+        except query_errors():
+            logger.debug("Sampled preview failed, reading the first rows instead", exc_info=True)
+            result = None
+    # Block samples of small tables can be empty: read the first rows instead
+    if result is None or result.num_rows == 0:
+        result = expr.limit(limit).to_pyarrow()
+
+    return arrow_to_rows(result, options.max_cell_bytes)
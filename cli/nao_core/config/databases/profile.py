@@ -0,0 +1,245 @@
+"""Column profiling shared by the database contexts."""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import ibis
+
+from .catalog import query_errors
+from .preview import json_safe_value, truncate_cell
+
+logger = logging.getLogger(__name__)
+
+MAX_VALUE_BYTES = 128
+"""Min/max and top values longer than this are truncated in profiles"""
+
+TOP_VALUES_MAX_DISTINCT = 1000
+"""Top values are only computed for columns with at most this many distinct values in the sample,
+and whose values repeat (at most one distinct value for two non-null rows)"""
+
+# Rough width in bytes of a value of each kind of column, used to estimate scanned bytes
+_TYPE_WIDTHS = {
+    "boolean": 1,
+    "int8": 1,
+    "int16": 2,
+    "int32": 4,
+    "int64": 8,
+    "uint8": 1,
+    "uint16": 2,
+    "uint32": 4,
+    "uint64": 8,
+    "float32": 4,
+    "float64": 8,
+    "date": 4,
+    "time": 8,
+    "timestamp": 8,
+    "decimal": 16,
+    "string": 32,
+}
+_DEFAULT_WIDTH = 64
+
+
+class ProfileBudget:
+    """Bytes a database sync may scan to profile tables, shared by all of its tables.
+
+    Bytes are estimated before each scan (see `estimate_scan_bytes`), and a table
+    is only profiled if its estimate fits in what is left. Thread-safe, since
+    sync workers profile tables concurrently.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self, nbytes: int) -> bool:
+        """Reserve `nbytes` of the budget. Returns False, reserving nothing, if they do not fit."""
+        with self._lock:
+            if self.max_bytes is not None and self.spent + nbytes > self.max_bytes:
+                return False
+            self.spent += nbytes
+            return True
+
+
+@dataclass(frozen=True)
+class ProfileOptions:
+    """Options controlling how `profile()` scans tables."""
+
+    enabled: bool = False
+    """Whether tables are profiled at all"""
+
+    sample_rows: int = 10_000
+    """Only profile the first N rows of each table"""
+
+    top_k: int = 5
+    """Number of most frequent values reported per column"""
+
+    budget: ProfileBudget | None = None
+    """Bytes budget shared by the tables of a database sync; unlimited when None"""
+
+
+def column_kind(column_type: str) -> str:
+    """Return the base kind of a formatted column type (e.g. "decimal(10, 2) NOT NULL" -> "decimal")."""
+    return column_type.removesuffix(" NOT NULL").split("(")[0].split("<")[0].strip().lower()
+
+
+def has_distinct_count(column_type: str) -> bool:
+    """Whether distinct counts make sense for a column type (scalar types only)."""
+    return column_kind(column_type) in _TYPE_WIDTHS
+
+
+def has_min_max(column_type: str) -> bool:
+    """Whether min/max make sense for a column type (numbers, dates and strings)."""
+    kind = column_kind(column_type)
+    return kind in _TYPE_WIDTHS and kind != "boolean"
+
+
+def has_top_values(column_type: str) -> bool:
+    """Whether a column type is worth reporting frequent values for (categories, flags, codes)."""
+    kind = column_kind(column_type)
+    return kind in ("string", "boolean") or kind.startswith(("int", "uint"))
+
+
+def estimate_scan_bytes(columns: list[dict[str, Any]], rows: int) -> int:
+    """Estimate how many bytes profiling `rows` rows of a table reads."""
+    row_width = sum(_TYPE_WIDTHS.get(column_kind(col["type"]), _DEFAULT_WIDTH) for col in columns)
+    return row_width * rows
+
+
+def reserve_scan(
+    options: ProfileOptions,
+    columns: list[dict[str, Any]],
+    row_count: int | None = None,
+    scan_bytes: int | None = None,
+) -> bool:
+    """Charge the estimated cost of profiling a table to the budget. Returns False if it does not fit.
+
+    The scan covers `sample_rows` rows, or the table's row count when it is
+    known to be smaller. `scan_bytes` replaces the estimate when the backend
+    knows what the scan will read, e.g. warehouses billing whole columns.
+    """
+    if options.budget is None:
+        return True
+    if scan_bytes is None:
+        rows = options.sample_rows if row_count is None else min(options.sample_rows, row_count)
+        scan_bytes = estimate_scan_bytes(columns, rows)
+    return options.budget.try_spend(scan_bytes)
+
+
+def skipped_profile(reason: str) -> dict[str, Any]:
+    """Profile returned when a table was not scanned."""
+    return {"skipped": reason, "rows_scanned": 0, "sampled": False, "columns": []}
+
+
+def build_profile(columns: list[dict[str, Any]], aggregates: dict[str, Any], sample_rows: int) -> dict[str, Any]:
+    """Shape the result of a profiling query into the dict returned by `profile()`.
+
+    Args:
+        columns: Columns of the table, as returned by `columns()`
+        aggregates: Values of the profiling query: `rows` (rows scanned), and per
+            column index i, `c{i}_non_null`, `c{i}_distinct`, `c{i}_min` and `c{i}_max`
+            (the last three only for types that support them)
+        sample_rows: Maximum number of rows the query scanned
+    """
+    rows_scanned = int(aggregates.get("rows") or 0)
+    profiles = []
+    for i, column in enumerate(columns):
+        non_null = int(aggregates.get(f"c{i}_non_null") or 0)
+        null_count = rows_scanned - non_null
+        distinct = aggregates.get(f"c{i}_distinct")
+        if distinct is not None:
+            # Approximate counts can overshoot on small samples
+            distinct = min(int(distinct), non_null)
+        profiles.append(
+            {
+                "name": column["name"],
+                "type": column["type"],
+                "null_count": null_count,
+                "null_ratio": null_count / rows_scanned if rows_scanned else 0.0,
+                "distinct_count": distinct,
+                "min": _profile_value(aggregates.get(f"c{i}_min")),
+                "max": _profile_value(aggregates.get(f"c{i}_max")),
+                "top_values": [],
+            }
+        )
+    return {"skipped": None, "rows_scanned": rows_scanned, "sampled": rows_scanned >= sample_rows, "columns": profiles}
+
+
+def top_value_columns(profile: dict[str, Any]) -> list[int]:
+    """Indexes of the profiled columns whose most frequent values are worth fetching.
+
+    Only low-cardinality columns qualify: listing the top values of an id column
+    would just show arbitrary values seen once.
+    """
+    candidates = []
+    for i, column in enumerate(profile["columns"]):
+        distinct = column["distinct_count"]
+        non_null = profile["rows_scanned"] - column["null_count"]
+        if (
+            has_top_values(column["type"])
+            and distinct
+            and distinct <= TOP_VALUES_MAX_DISTINCT
+            and distinct * 2 <= non_null
+        ):
+            candidates.append(i)
+    return candidates
+
+
+def add_top_values(profile: dict[str, Any], rows: list[tuple[Any, ...]], top_k: int) -> None:
+    """Attach `(column_index, value, count)` rows to the profiled columns, most frequent first."""
+    by_column: dict[int, list[tuple[Any, int]]] = {}
+    for column_index, value, count in rows:
+        by_column.setdefault(int(column_index), []).append((value, int(count)))
+
+    for column_index, values in by_column.items():
+        # Break ties by value so re-syncs render the same order
+        values.sort(key=lambda item: (-item[1], str(item[0])))
+        profile["columns"][column_index]["top_values"] = [
+            {"value": _profile_value(value), "count": count} for value, count in values[:top_k]
+        ]
+
+
+def _profile_value(value: Any) -> Any:
+    return truncate_cell(json_safe_value(value), MAX_VALUE_BYTES)
+
+
+def profile_table(table: Any, columns: list[dict[str, Any]], options: ProfileOptions) -> dict[str, Any]:
+    """Profile the first `sample_rows` rows of an Ibis table.
+
+    All statistics come from a single aggregate query; frequent values take a
+    second query covering every low-cardinality column at once. The caller is
+    responsible for checking `options.enabled` and the bytes budget.
+    """
+    sample = table.limit(options.sample_rows)
+    metrics = {"rows": sample.count()}
+    for i, col in enumerate(columns):
+        column = sample[col["name"]]
+        metrics[f"c{i}_non_null"] = column.count()
+        if has_distinct_count(col["type"]):
+            metrics[f"c{i}_distinct"] = column.approx_nunique()
+        if has_min_max(col["type"]):
+            metrics[f"c{i}_min"] = column.min()
+            metrics[f"c{i}_max"] = column.max()
+    aggregates = sample.aggregate(**metrics).to_pyarrow().to_pylist()[0]
+    profile = build_profile(columns, aggregates, options.sample_rows)
+
+    if candidates := top_value_columns(profile):
+        parts = []
+        for i in candidates:
+            column = sample[columns[i]["name"]]
+            counts = (
+                sample.filter(column.notnull())
+                .group_by(value=column.cast("string"))
+                .aggregate(count=lambda t: t.count())
+                .order_by(ibis.desc("count"))
+                .limit(options.top_k)
+            )
+            parts.append(counts.select(column_index=ibis.literal(i), value="value", count="count"))
+        try:
+            top_values = ibis.union(*parts).to_pyarrow()
+            add_top_values(profile, list(zip(*top_values.to_pydict().values())), options.top_k)
+        except query_errors():
+            logger.debug("Top values query failed, profiling without them", exc_info=True)
+    return profile
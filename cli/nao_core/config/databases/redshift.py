@@ -1,139 +1,156 @@
+import logging
 from pathlib import Path
 from typing import Any, Literal
 
 import ibis
 from ibis import BaseBackend
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from sshtunnel import SSHTunnelForwarder
 
 from nao_core.config.exceptions import InitError
 from nao_core.ui import ask_confirm, ask_text
 
-from .base import DatabaseConfig
-
-
-class RedshiftDatabaseContext:
+from .base import DatabaseConfig, resolve_path
+from .catalog import (
+    TableMetadata,
+    fetch_rows,
+    memoized,
+    query_errors,
+    quote_identifier,
+    quote_literal,
+)
+from .context import DatabaseContext
+from .pg_catalog import load_redshift_schema
+from .preview import PreviewOptions, tuples_to_rows
+from .profile import (
+    ProfileOptions,
+    add_top_values,
+    build_profile,
+    has_distinct_count,
+    has_min_max,
+    reserve_scan,
+    skipped_profile,
+    top_value_columns,
+)
+from .registry import connection_registry
+
+logger = logging.getLogger(__name__)
+
+
+class RedshiftDatabaseContext(DatabaseContext):
     """Redshift-specific context that bypasses Ibis's problematic pg_enum queries."""
 
-    def __init__(self, conn: BaseBackend, schema: str, table_name: str):
-        self._conn = conn
-        self._schema = schema
-        self._table_name = table_name
-        self._table_ref = None
-
-    @property
-    def table(self):
-        if self._table_ref is None:
-            self._table_ref = self._conn.table(self._table_name, database=self._schema)
-        return self._table_ref
+    @memoized
+    def _table_metadata(self) -> TableMetadata | None:
+        """Return the bulk-loaded metadata of the table, or load it from the `svv_` catalog views."""
+        if self._metadata is not None and self._metadata.columns is not None:
+            return self._metadata
+        return load_redshift_schema(self._conn, self._schema, self._table_name).get(self._table_name)
 
+    @memoized
     def columns(self) -> list[dict[str, Any]]:
-        """Return column metadata by querying information_schema directly."""
-        query = f"""
-            SELECT 
-                column_name,
-                data_type,
-                is_nullable,
-                character_maximum_length,
-                numeric_precision,
-                numeric_scale
-            FROM information_schema.columns
-            WHERE table_schema = '{self._schema}'
-              AND table_name = '{self._table_name}'
-            ORDER BY ordinal_position
-        """
-        result = self._conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
-
-        columns = []
-        for row in result:
-            col_name = row[0]
-            data_type = row[1]
-            is_nullable = row[2] == "YES"
-            char_length = row[3]
-            num_precision = row[4]
-            num_scale = row[5]
-
-            # Map SQL types to Ibis-like type strings
-            formatted_type = self._format_redshift_type(data_type, is_nullable, char_length, num_precision, num_scale)
-
-            columns.append(
-                {
-                    "name": col_name,
-                    "type": formatted_type,
-                    "nullable": is_nullable,
-                    "description": None,
-                }
-            )
+        """Return column metadata from the bulk-loaded schema metadata, or by querying `svv_columns`."""
+        metadata = self._table_metadata()
+        if metadata is None or metadata.columns is None:
+            return []
+        return [dict(col) for col in metadata.columns]
 
-        return columns
-
-    @staticmethod
-    def _format_redshift_type(
-        data_type: str,
-        is_nullable: bool,
-        char_length: int | None,
-        num_precision: int | None,
-        num_scale: int | None,
-    ) -> str:
-        """Convert Redshift SQL type to Ibis-like format."""
-        # Map common Redshift types to Ibis types
-        type_map = {
-            "integer": "int32",
-            "bigint": "int64",
-            "smallint": "int16",
-            "boolean": "boolean",
-            "real": "float32",
-            "double precision": "float64",
-            "character varying": "string",
-            "character": "string",
-            "text": "string",
-            "date": "date",
-            "timestamp without time zone": "timestamp",
-            "timestamp with time zone": "timestamp",
-        }
-
-        ibis_type = type_map.get(data_type, "string")
+    @memoized
+    def preview(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the first N rows as a list of JSON-safe dictionaries.
 
-        if not is_nullable:
-            return f"{ibis_type} NOT NULL"
-        return ibis_type
+        Redshift has no TABLESAMPLE, so `sample_percent` is ignored here.
+        """
+        options = self._preview_options
+        col_names = [col["name"] for col in self.columns()]
+        if options.max_columns is not None:
+            col_names = col_names[: options.max_columns]
 
-    def preview(self, limit: int = 10) -> list[dict[str, Any]]:
-        """Return the first N rows as a list of dictionaries."""
         # Use raw SQL to avoid Ibis's pg_enum queries
-        query = f'SELECT * FROM "{self._schema}"."{self._table_name}" LIMIT {limit}'
-        result = self._conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
+        select_list = ", ".join(quote_identifier(name, "postgres") for name in col_names) or "*"
+        table_ref = f"{quote_identifier(self._schema, 'postgres')}.{quote_identifier(self._table_name, 'postgres')}"
+        result = fetch_rows(self._conn, f"SELECT {select_list} FROM {table_ref} LIMIT {int(limit)}")
+        return tuples_to_rows(col_names, result, options.max_cell_bytes)
 
-        # Get column names from the columns metadata
-        columns = self.columns()
-        col_names = [col["name"] for col in columns]
-
-        rows = []
-        for row in result:
-            row_dict = {}
-            for i, col_name in enumerate(col_names):
-                val = row[i] if i < len(row) else None
-                if val is not None and not isinstance(val, (str, int, float, bool, list, dict)):
-                    row_dict[col_name] = str(val)
-                else:
-                    row_dict[col_name] = val
-            rows.append(row_dict)
-        return rows
-
-    def row_count(self) -> int:
-        """Return the total number of rows in the table."""
+    @memoized
+    def row_count(self) -> int | None:
+        """Return the total number of rows in the table, or None when row counts are turned off.
+
+        In `estimate` mode the count comes from catalog statistics when available.
+        """
+        if self._row_count_mode == "off":
+            return None
+        if self.row_count_is_estimate():
+            return int(self._metadata.row_count)  # type: ignore[union-attr, arg-type]
         # Use raw SQL to avoid Ibis's pg_enum queries
-        query = f'SELECT COUNT(*) FROM "{self._schema}"."{self._table_name}"'
-        result = self._conn.raw_sql(query).fetchone()  # type: ignore[union-attr]
-        return result[0] if result else 0
+        table_ref = f"{quote_identifier(self._schema, 'postgres')}.{quote_identifier(self._table_name, 'postgres')}"
+        rows = fetch_rows(self._conn, f"SELECT COUNT(*) FROM {table_ref}")
+        return rows[0][0] if rows else 0
 
-    def column_count(self) -> int:
-        """Return the number of columns in the table."""
-        return len(self.columns())
+    @memoized
+    def profile(self) -> dict[str, Any] | None:
+        """Return column statistics computed over the first `sample_rows` rows of the table.
 
+        Same as `DatabaseContext.profile()`, with raw SQL: distinct counts use
+        Redshift's HyperLogLog `APPROXIMATE COUNT(DISTINCT ...)`.
+        """
+        options = self._profile_options
+        if not options.enabled:
+            return None
+
+        columns = self.columns()
+        if not reserve_scan(options, columns, self._metadata.row_count if self._metadata else None):
+            return skipped_profile("bytes budget exhausted")
+
+        table_ref = f"{quote_identifier(self._schema, 'postgres')}.{quote_identifier(self._table_name, 'postgres')}"
+        sample = f"(SELECT * FROM {table_ref} LIMIT {int(options.sample_rows)}) AS sample"
+
+        metrics = {"rows": "COUNT(*)"}
+        for i, col in enumerate(columns):
+            name = quote_identifier(col["name"], "postgres")
+            metrics[f"c{i}_non_null"] = f"COUNT({name})"
+            if has_distinct_count(col["type"]):
+                metrics[f"c{i}_distinct"] = f"APPROXIMATE COUNT(DISTINCT {name})"
+            if has_min_max(col["type"]):
+                metrics[f"c{i}_min"] = f"MIN({name})"
+                metrics[f"c{i}_max"] = f"MAX({name})"
+        row = fetch_rows(self._conn, f"SELECT {', '.join(metrics.values())} FROM {sample}")[0]
+        profile = build_profile(columns, dict(zip(metrics, row)), options.sample_rows)
+
+        if candidates := top_value_columns(profile):
+            parts = []
+            for i in candidates:
+                name = quote_identifier(columns[i]["name"], "postgres")
+                # Redshift cannot cast booleans to text
+                value = (
+                    f"CASE WHEN {name} THEN 'true' ELSE 'false' END"
+                    if columns[i]["type"].startswith("boolean")
+                    else f"CAST({name} AS VARCHAR)"
+                )
+                parts.append(
+                    f"SELECT {i} AS column_index, {value} AS value, COUNT(*) AS n "
+                    f"FROM {sample} WHERE {name} IS NOT NULL GROUP BY 2"
+                )
+            query = f"""
+                SELECT column_index, value, n
+                FROM (
+                    SELECT column_index, value, n,
+                           ROW_NUMBER() OVER (PARTITION BY column_index ORDER BY n DESC) AS rn
+                    FROM ({" UNION ALL ".join(parts)}) AS counts
+                ) AS ranked
+                WHERE rn <= {int(options.top_k)}
+            """
+            try:
+                add_top_values(profile, fetch_rows(self._conn, query), options.top_k)
+            except query_errors():
+                logger.debug("Top values query failed, profiling without them", exc_info=True)
+        return profile
+
+    @memoized
     def description(self) -> str | None:
-        """Return the table description if available."""
-        return None
+        """Return the table comment, if any."""
+        metadata = self._table_metadata()
+        return metadata.description if metadata is not None else None
 
 
 class RedshiftSSHTunnelConfig(BaseModel):
@@ -159,6 +176,9 @@ class RedshiftConfig(DatabaseConfig):
     sslmode: str = Field(default="require", description="SSL mode for the connection")
     ssh_tunnel: RedshiftSSHTunnelConfig | None = Field(default=None, description="SSH tunnel configuration (optional)")
 
+    # SSH tunnels opened by connect(), keyed by id() of their connection
+    _tunnels: dict[int, SSHTunnelForwarder] = PrivateAttr(default_factory=dict)
+
     @classmethod
     def promptConfig(cls) -> "RedshiftConfig":
         """Interactively prompt the user for Redshift configuration."""
@@ -233,6 +253,8 @@ class RedshiftConfig(DatabaseConfig):
             # Use tunnel's local bind address
             connect_host = "127.0.0.1"
             connect_port = tunnel.local_bind_port
+        else:
+            tunnel = None
 
         kwargs: dict = {
             "host": connect_host,
@@ -247,9 +269,37 @@ class RedshiftConfig(DatabaseConfig):
         if self.schema_name:
             kwargs["schema"] = self.schema_name
 
-        return ibis.postgres.connect(
-            **kwargs,
-        )
+        try:
+            conn = ibis.postgres.connect(
+                **kwargs,
+            )
+        except Exception:
+            if tunnel is not None:
+                tunnel.stop()
+            raise
+
+        if tunnel is not None:
+            self._tunnels[id(conn)] = tunnel
+        return conn
+
+    def disconnect(self, conn: BaseBackend) -> None:
+        """Close the connection and stop the SSH tunnel opened for it, if any."""
+        try:
+            conn.disconnect()
+        finally:
+            tunnel = self._tunnels.pop(id(conn), None)
+            if tunnel is not None:
+                tunnel.stop()
+
+    def cancel_query(self, conn: BaseBackend) -> bool:
+        """Send a cancel request for the running query to the server."""
+        conn.con.cancel()
+        return True
+
+    def resolve_paths(self, base: Path) -> None:
+        """Resolve the SSH private key of the tunnel against `base`."""
+        if self.ssh_tunnel:
+            self.ssh_tunnel.ssh_private_key_path = resolve_path(self.ssh_tunnel.ssh_private_key_path, base)
 
     def get_database_name(self) -> str:
         """Get the database name for Redshift."""
@@ -262,30 +312,64 @@ class RedshiftConfig(DatabaseConfig):
         schemas = list_databases() if list_databases else []
         return schemas + ["public"]
 
-    def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> RedshiftDatabaseContext:
+    def tables_query(self, schema: str) -> str | None:
+        """List tables and views from information_schema, filtered by the include/exclude patterns."""
+        predicate = self.table_pattern_predicate(schema, "table_name", "redshift")
+        return f"""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = {quote_literal(schema, "redshift")}
+              {f"AND {predicate}" if predicate else ""}
+        """
+
+    def load_schema_metadata(self, conn: BaseBackend, schema: str) -> dict[str, TableMetadata] | None:
+        """Load the columns, comments and row estimates of every table of a schema from the `svv_` catalog views.
+
+        The row estimates of `svv_table_info` are part of this metadata, so
+        `get_table_stats` is not overridden: it would read them a second time.
+        """
+        return load_redshift_schema(conn, schema)
+
+    def create_context(
+        self,
+        conn: BaseBackend,
+        schema: str,
+        table_name: str,
+        metadata: TableMetadata | None = None,
+        row_count_mode: str = "exact",
+        preview_options: PreviewOptions | None = None,
+        profile_options: ProfileOptions | None = None,
+    ) -> RedshiftDatabaseContext:
         """Create a Redshift-specific database context that avoids pg_enum queries."""
-        return RedshiftDatabaseContext(conn, schema, table_name)
+        return RedshiftDatabaseContext(
+            conn,
+            schema,
+            table_name,
+            metadata=metadata,
+            row_count_mode=row_count_mode,
+            preview_options=preview_options,
+            profile_options=profile_options,
+        )
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to Redshift."""
         try:
-            conn = self.connect()
-
-            if self.schema_name:
-                tables = conn.list_tables(database=self.schema_name)
-                return True, f"Connected successfully ({len(tables)} tables found)"
-
-            if self.database:
-                if list_databases := getattr(conn, "list_databases", None):
-                    schemas = list_databases() + ["public"]
-                else:
-                    schemas = ["public"]
-
-                tables = []
-                for schema in schemas:
-                    tables.extend(conn.list_tables(database=schema))
-                return True, f"Connected successfully ({len(tables)} tables found)"
-
-            return True, "Connected successfully"
+            with connection_registry.lease(self) as conn:
+                if self.schema_name:
+                    tables = conn.list_tables(database=self.schema_name)
+                    return True, f"Connected successfully ({len(tables)} tables found)"
+
+                if self.database:
+                    if list_databases := getattr(conn, "list_databases", None):
+                        schemas = list_databases() + ["public"]
+                    else:
+                        schemas = ["public"]
+
+                    tables = []
+                    for schema in schemas:
+                        tables.extend(conn.list_tables(database=schema))
+                    return True, f"Connected successfully ({len(tables)} tables found)"
+
+                return True, "Connected successfully"
         except Exception as e:
             return False, str(e)
@@ -0,0 +1,202 @@
+"""Process-wide registry of warm database connections."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ibis import BaseBackend
+
+from .catalog import fetch_rows, query_errors
+
+if TYPE_CHECKING:
+    from .base import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledConnection:
+    conn: BaseBackend
+    config: DatabaseConfig
+    last_used: float
+
+
+class ConnectionRegistry:
+    """Keeps connections open across sync workers, debug checks and SQL requests.
+
+    Connections are pooled per connection key (a hash of the config's
+    connection fields, see `DatabaseConfig.connection_key()`), so configs that
+    only differ by sync options share their connections. A connection is
+    leased to a single caller at a time, since Ibis backends are not safe to
+    share across threads, and goes back to the idle pool when released.
+
+    Idle connections are closed after `idle_timeout` seconds and checked with
+    a `SELECT 1` before reuse when they sat idle for more than
+    `health_check_after` seconds. All connections are closed at exit.
+
+    The registry also hands out query slots (`query_slot()`), which cap how
+    many units of work run against a connection at the same time when its
+    config sets `max_concurrent_queries`.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, health_check_after: float = 30.0):
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self._lock = threading.Lock()
+        self._idle: dict[str, list[_PooledConnection]] = {}
+        self._leased: dict[int, tuple[str, _PooledConnection]] = {}
+        self._query_slots: dict[str, tuple[int, threading.BoundedSemaphore]] = {}
+
+    def acquire(self, config: DatabaseConfig) -> BaseBackend:
+        """Lease a connection for `config`, reusing an idle one when possible."""
+        key = config.connection_key()
+        self.evict_idle()
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                pooled = idle.pop() if idle else None
+            if pooled is None:
+                break
+
+            if time.monotonic() - pooled.last_used > self.health_check_after and not self._is_healthy(pooled.conn):
+                self._disconnect(pooled)
+                continue
+
+            with self._lock:
+                self._leased[id(pooled.conn)] = (key, pooled)
+            return pooled.conn
+
+        pooled = _PooledConnection(conn=config.connect(), config=config, last_used=time.monotonic())
+        with self._lock:
+            self._leased[id(pooled.conn)] = (key, pooled)
+        return pooled.conn
+
+    def release(self, conn: BaseBackend, discard: bool = False) -> None:
+        """Return a leased connection to the idle pool, or close it when `discard` is set."""
+        with self._lock:
+            entry = self._leased.pop(id(conn), None)
+            if entry is not None and not discard:
+                key, pooled = entry
+                pooled.last_used = time.monotonic()
+                self._idle.setdefault(key, []).append(pooled)
+
+        if entry is None:
+            return
+        if discard:
+            self._disconnect(entry[1])
+
+    @contextmanager
+    def lease(self, config: DatabaseConfig) -> Iterator[BaseBackend]:
+        """Context manager leasing a connection; it is discarded if the block raises."""
+        conn = self.acquire(config)
+        try:
+            yield conn
+        except BaseException:
+            self.release(conn, discard=True)
+            raise
+        self.release(conn)
+
+    @contextmanager
+    def query_slot(self, config: DatabaseConfig) -> Iterator[None]:
+        """Block until fewer than `max_concurrent_queries` slots of the connection are in use.
+
+        Slots are shared by every config with the same connection key, across
+        threads and databases. Without `max_concurrent_queries` this is a no-op.
+        """
+        limit = config.max_concurrent_queries
+        if limit is None:
+            yield
+            return
+
+        key = config.connection_key()
+        with self._lock:
+            current = self._query_slots.get(key)
+            if current is None or current[0] != limit:
+                current = (limit, threading.BoundedSemaphore(limit))
+                self._query_slots[key] = current
+        semaphore = current[1]
+
+        with semaphore:
+            yield
+
+    def evict_idle(self) -> int:
+        """Close connections idle for longer than `idle_timeout`. Returns how many were closed."""
+        deadline = time.monotonic() - self.idle_timeout
+        expired: list[_PooledConnection] = []
+        with self._lock:
+            for key, idle in list(self._idle.items()):
+                expired.extend(p for p in idle if p.last_used < deadline)
+                idle[:] = [p for p in idle if p.last_used >= deadline]
+                if not idle:
+                    del self._idle[key]
+
+        for pooled in expired:
+            self._disconnect(pooled)
+        return len(expired)
+
+    def close(self, config: DatabaseConfig | None = None) -> None:
+        """Close the connections of one config, or every connection when no config is given.
+
+        Leased connections are closed too; their holders must not use them afterwards.
+        """
+        key = config.connection_key() if config is not None else None
+        to_close: list[_PooledConnection] = []
+        with self._lock:
+            for idle_key in [k for k in self._idle if key is None or k == key]:
+                to_close.extend(self._idle.pop(idle_key))
+            for conn_id, (leased_key, pooled) in list(self._leased.items()):
+                if key is None or leased_key == key:
+                    to_close.append(pooled)
+                    del self._leased[conn_id]
+
+        for pooled in to_close:
+            self._disconnect(pooled)
+
+    def close_idle(self, config: DatabaseConfig) -> int:
+        """Close the idle connections of a config, leaving leased ones to their holders.
+
+        Used when a config is replaced: its connections in use keep working and
+        are evicted once they sat idle for `idle_timeout`. Returns how many were closed.
+        """
+        with self._lock:
+            to_close = self._idle.pop(config.connection_key(), [])
+
+        for pooled in to_close:
+            self._disconnect(pooled)
+        return len(to_close)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of idle and leased connections."""
+        with self._lock:
+            return {
+                "idle": sum(len(idle) for idle in self._idle.values()),
+                "leased": len(self._leased),
+            }
+
+    @staticmethod
+    def _is_healthy(conn: BaseBackend) -> bool:
+        try:
+            fetch_rows(conn, "SELECT 1")
+            return True
+        except query_errors():
+            logger.debug("Idle connection failed its health check", exc_info=True)
+            return False
+
+    @staticmethod
+    def _disconnect(pooled: _PooledConnection) -> None:
+        try:
+            pooled.config.disconnect(pooled.conn)
+        except query_errors():
+            logger.debug("Failed to close a connection of %s", pooled.config.name, exc_info=True)
+
+
+connection_registry = ConnectionRegistry()
+atexit.register(connection_registry.close)
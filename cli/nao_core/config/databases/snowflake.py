@@ -1,22 +1,137 @@
+import json
+import logging
 import os
-from typing import Literal
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar, Literal
 
 import ibis
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from ibis import BaseBackend
-from pydantic import Field
+from ibis.backends.sql.datatypes import SnowflakeType
+from pydantic import Field, PrivateAttr
 
 from nao_core.config.exceptions import InitError
 from nao_core.ui import UI, ask_confirm, ask_text
 
-from .base import DatabaseConfig
+from .base import DatabaseConfig, resolve_path
+from .catalog import TableMetadata, build_schema_metadata, fetch_rows, query_errors, quote_identifier, quote_literal
+from .registry import connection_registry
+
+logger = logging.getLogger(__name__)
+
+SHOW_RESULT_LIMIT = 10_000
+"""SHOW commands return at most this many rows; longer listings are truncated"""
+
+# Last modification time of a SHOW TABLES row. The column name varies between
+# Snowflake releases, and reading it through OBJECT_CONSTRUCT(*) yields NULL
+# rather than an error when it is missing (`get_table_stats` then reads
+# information_schema.tables instead)
+_SHOW_LAST_ALTERED = (
+    'TRY_TO_TIMESTAMP_LTZ(COALESCE(OBJECT_CONSTRUCT(*):"last_altered", OBJECT_CONSTRUCT(*):"changed_on")::STRING)'
+)
+
+# SHOW commands listing the relations synced by nao, and the columns read from their output
+_SHOW_RELATIONS = {
+    "TABLES": f'"schema_name", "name", "comment", "rows", "bytes", {_SHOW_LAST_ALTERED}',
+    "VIEWS": '"schema_name", "name", "comment", NULL, NULL, NULL',
+    "EXTERNAL TABLES": '"schema_name", "name", "comment", NULL, NULL, NULL',
+}
+
+# Type names of SHOW COLUMNS that differ from information_schema.columns
+_SHOW_TYPE_NAMES = {"REAL": "FLOAT"}
+
+
+@dataclass
+class _CatalogSnapshot:
+    """Tables and columns of a database, listed with SHOW commands."""
+
+    tables: dict[str, dict[str, dict[str, Any]]] | None
+    """Schema -> table -> comment and catalog statistics. None when the listing failed or was truncated"""
+
+    columns: dict[str, dict[str, TableMetadata]] | None
+    """Schema -> table -> column metadata. None when the listing failed or was truncated"""
+
+
+def _show(conn: BaseBackend, command: str, projection: str) -> list[tuple[Any, ...]] | None:
+    """Run a SHOW command and read the given columns of its output with RESULT_SCAN.
+
+    SHOW commands only read metadata, so they run without resuming the warehouse.
+    Returns None when the output hit `SHOW_RESULT_LIMIT` and may be truncated.
+    """
+    cursor = conn.raw_sql(command)  # type: ignore[attr-defined]
+    if hasattr(cursor, "close"):
+        cursor.close()
+    rows = fetch_rows(conn, f"SELECT {projection} FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))")
+    return rows if len(rows) < SHOW_RESULT_LIMIT else None
+
+
+def show_tables(conn: BaseBackend, scope: str) -> dict[str, dict[str, dict[str, Any]]] | None:
+    """List the tables, views and external tables `IN <scope>`, grouped by schema.
+
+    Each relation maps to its `description` (comment); tables also carry the
+    `row_count`, `size_bytes` and `last_modified` reported by SHOW TABLES.
+    Returns None when a listing was truncated.
+    """
+    tables: dict[str, dict[str, dict[str, Any]]] = {}
+    for relation, projection in _SHOW_RELATIONS.items():
+        rows = _show(conn, f"SHOW {relation} IN {scope}", projection)
+        if rows is None:
+            return None
+        for schema, name, comment, row_count, size_bytes, last_altered in rows:
+            if schema == "INFORMATION_SCHEMA":
+                continue
+            info: dict[str, Any] = {"description": comment or None}
+            if row_count is not None:
+                info.update(row_count=row_count, size_bytes=size_bytes, last_modified=last_altered)
+            tables.setdefault(schema, {})[name] = info
+    return tables
+
+
+def show_columns(conn: BaseBackend, scope: str) -> dict[str, dict[str, TableMetadata]] | None:
+    """List the columns of every table `IN <scope>` with SHOW COLUMNS, grouped by schema.
+
+    Columns carry their comment. Returns None when the listing was truncated.
+    """
+    projection = '"schema_name", "table_name", "column_name", "data_type", "comment"'
+    rows = _show(conn, f"SHOW COLUMNS IN {scope}", projection)
+    if rows is None:
+        return None
+
+    by_schema: dict[str, list[tuple[Any, ...]]] = {}
+    for schema, table, column, data_type, comment in rows:
+        if schema != "INFORMATION_SCHEMA":
+            by_schema.setdefault(schema, []).append((table, column, *parse_show_type(data_type), comment))
+    return {schema: build_schema_metadata(rows, SnowflakeType) for schema, rows in by_schema.items()}
+
+
+def attach_table_comments(columns: dict[str, TableMetadata], tables: dict[str, dict[str, Any]]) -> None:
+    """Set the description of each table's metadata from the comments listed by `show_tables`."""
+    for name, metadata in columns.items():
+        if name in tables:
+            metadata.description = tables[name].get("description")
+
+
+def parse_show_type(data_type: str) -> tuple[str, bool]:
+    """Convert the JSON `data_type` of SHOW COLUMNS to an information_schema type name and nullability.
+
+    e.g. '{"type":"FIXED","precision":38,"scale":0,"nullable":true}' -> ("NUMBER(38,0)", True)
+    """
+    spec = json.loads(data_type)
+    kind = spec.get("type", "")
+    if kind == "FIXED":
+        type_name = f"NUMBER({spec.get('precision', 38)},{spec.get('scale', 0)})"
+    else:
+        type_name = _SHOW_TYPE_NAMES.get(kind, kind)
+    return type_name, bool(spec.get("nullable", True))
 
 
 class SnowflakeConfig(DatabaseConfig):
     """Snowflake-specific configuration."""
 
     type: Literal["snowflake"] = "snowflake"
+    case_insensitive_patterns: ClassVar[bool] = True  # Snowflake identifier matching is case-insensitive
     username: str = Field(description="Snowflake username")
     account_id: str = Field(description="Snowflake account identifier (e.g., 'xy12345.us-east-1')")
     password: str | None = Field(default=None, description="Snowflake password")
@@ -39,6 +154,8 @@ class SnowflakeConfig(DatabaseConfig):
         description="Authentication method (e.g., 'externalbrowser' for SSO)",
     )
 
+    _catalog: _CatalogSnapshot | None = PrivateAttr(default=None)
+
     @classmethod
     def promptConfig(cls) -> "SnowflakeConfig":
         """Interactively prompt the user for Snowflake configuration."""
@@ -115,53 +232,173 @@ class SnowflakeConfig(DatabaseConfig):
 
         return ibis.snowflake.connect(**kwargs, create_object_udfs=False)
 
+    def resolve_paths(self, base: Path) -> None:
+        """Resolve the private key file against `base`."""
+        if self.private_key_path:
+            self.private_key_path = resolve_path(self.private_key_path, base)
+
     def get_database_name(self) -> str:
         """Get the database name for Snowflake."""
         return self.database
 
-    def matches_pattern(self, schema: str, table: str) -> bool:
-        """Check if a schema.table matches the include/exclude patterns.
-
-        Snowflake identifier matching is case-insensitive.
-        """
-        from fnmatch import fnmatch
-
-        full_name = f"{schema}.{table}"
-        full_name_lower = full_name.lower()
-
-        # If include patterns exist, table must match at least one
-        if self.include:
-            included = any(fnmatch(full_name_lower, pattern.lower()) for pattern in self.include)
-            if not included:
-                return False
-
-        # If exclude patterns exist, table must not match any
-        if self.exclude:
-            excluded = any(fnmatch(full_name_lower, pattern.lower()) for pattern in self.exclude)
-            if excluded:
-                return False
-
-        return True
-
     def get_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             # Snowflake schema names are case-insensitive but stored as uppercase
             return [self.schema_name.upper()]
+        if self._catalog is not None and self._catalog.tables is not None:
+            return sorted(self._catalog.tables)
         list_databases = getattr(conn, "list_databases", None)
         schemas = list_databases() if list_databases else []
         # Filter out INFORMATION_SCHEMA which contains system tables
         return [s for s in schemas if s != "INFORMATION_SCHEMA"]
 
+    def load_catalog(self, conn: BaseBackend) -> None:
+        """List every table and column of the database with SHOW commands.
+
+        SHOW TABLES/VIEWS/EXTERNAL TABLES and SHOW COLUMNS `IN DATABASE` (or in
+        the configured schema) cover the whole database in a handful of
+        metadata-only queries, whatever its number of tables. A listing that
+        fails or hits `SHOW_RESULT_LIMIT` is left out, and the schemas it
+        covers are then listed one by one.
+        """
+        scope = f"SCHEMA {quote_identifier(self.schema_name.upper(), 'snowflake')}" if self.schema_name else "DATABASE"
+        try:
+            tables = show_tables(conn, scope)
+        except query_errors():
+            logger.debug("SHOW TABLES IN %s failed, listing schemas one by one", scope, exc_info=True)
+            tables = None
+        try:
+            columns = show_columns(conn, scope)
+        except query_errors():
+            logger.debug("SHOW COLUMNS IN %s failed, listing schemas one by one", scope, exc_info=True)
+            columns = None
+        if tables is not None and columns is not None:
+            for schema, schema_columns in columns.items():
+                attach_table_comments(schema_columns, tables.get(schema, {}))
+        self._catalog = _CatalogSnapshot(tables=tables, columns=columns)
+
+    def clear_catalog(self) -> None:
+        self._catalog = None
+
+    def _schema_tables(self, conn: BaseBackend, schema: str) -> dict[str, dict[str, Any]] | None:
+        """Tables of a schema from the catalog snapshot, or from SHOW commands on the schema alone."""
+        if self._catalog is not None and self._catalog.tables is not None:
+            return self._catalog.tables.get(schema, {})
+        try:
+            tables = show_tables(conn, f"SCHEMA {quote_identifier(schema, 'snowflake')}")
+        except query_errors():
+            logger.debug("SHOW TABLES failed for schema %s, using information_schema", schema, exc_info=True)
+            return None
+        return None if tables is None else tables.get(schema, {})
+
+    def list_tables(self, conn: BaseBackend, schema: str) -> list[str]:
+        """List tables with SHOW commands, falling back to information_schema."""
+        tables = self._schema_tables(conn, schema)
+        if tables is None:
+            return super().list_tables(conn, schema)
+        return [name for name in tables if self.matches_pattern(schema, name)]
+
+    def tables_query(self, schema: str) -> str | None:
+        """List tables and views from information_schema, filtered by the include/exclude patterns."""
+        predicate = self.table_pattern_predicate(schema, "table_name", "snowflake")
+        return f"""
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = {quote_literal(schema, "snowflake")}
+              {f"AND {predicate}" if predicate else ""}
+        """
+
+    def load_schema_metadata(self, conn: BaseBackend, schema: str) -> dict[str, TableMetadata] | None:
+        """Load all columns of a schema and their comments with SHOW COLUMNS, falling back to information_schema."""
+        if self._catalog is not None and self._catalog.columns is not None:
+            return self._catalog.columns.get(schema, {})
+        try:
+            columns = show_columns(conn, f"SCHEMA {quote_identifier(schema, 'snowflake')}")
+        except query_errors():
+            logger.debug("SHOW COLUMNS failed for schema %s, using information_schema", schema, exc_info=True)
+            columns = None
+        if columns is not None:
+            schema_columns = columns.get(schema, {})
+            if (tables := self._schema_tables(conn, schema)) is not None:
+                attach_table_comments(schema_columns, tables)
+            return schema_columns
+
+        query = f"""
+            SELECT
+                c.table_name,
+                c.column_name,
+                CASE
+                    WHEN c.data_type = 'NUMBER' AND c.numeric_precision IS NOT NULL
+                        THEN 'NUMBER(' || c.numeric_precision || ',' || c.numeric_scale || ')'
+                    ELSE c.data_type
+                END,
+                c.is_nullable,
+                c.comment,
+                t.comment
+            FROM information_schema.columns c
+            LEFT JOIN information_schema.tables t
+                ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+            WHERE c.table_schema = {quote_literal(schema, "snowflake")}
+            ORDER BY c.table_name, c.ordinal_position
+        """
+        return build_schema_metadata(fetch_rows(conn, query), SnowflakeType)
+
+    def get_table_stats(self, conn: BaseBackend, schema: str) -> dict[str, dict[str, Any]]:
+        """Read row counts, sizes and modification times from SHOW TABLES, falling back to information_schema.
+
+        Neither reads the tables themselves.
+        """
+        tables = self._schema_tables(conn, schema)
+        if tables is not None:
+            stats = {
+                name: {
+                    "row_count": info["row_count"],
+                    "size_bytes": info["size_bytes"],
+                    "last_modified": info["last_modified"],
+                }
+                for name, info in tables.items()
+                if "row_count" in info
+            }
+            if any(table["last_modified"] is None for table in stats.values()):
+                # The SHOW TABLES output of some accounts has no modification time
+                for name, last_altered in self._last_altered(conn, schema).items():
+                    if name in stats and stats[name]["last_modified"] is None:
+                        stats[name]["last_modified"] = last_altered
+            return stats
+
+        query = f"""
+            SELECT table_name, row_count, last_altered
+            FROM information_schema.tables
+            WHERE table_schema = {quote_literal(schema, "snowflake")}
+        """
+        return {
+            table_name: {"row_count": row_count, "last_modified": last_altered}
+            for table_name, row_count, last_altered in fetch_rows(conn, query)
+        }
+
+    def _last_altered(self, conn: BaseBackend, schema: str) -> dict[str, Any]:
+        """Read the modification time of every table of a schema from information_schema."""
+        query = f"""
+            SELECT table_name, last_altered
+            FROM information_schema.tables
+            WHERE table_schema = {quote_literal(schema, "snowflake")}
+        """
+        try:
+            return dict(fetch_rows(conn, query))
+        except query_errors():
+            logger.debug("Could not read the modification times of schema %s", schema, exc_info=True)
+            return {}
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to Snowflake."""
         try:
-            conn = self.connect()
-            if self.schema_name:
-                tables = conn.list_tables()
-                return True, f"Connected successfully ({len(tables)} tables found)"
-            if list_databases := getattr(conn, "list_databases", None):
-                schemas = list_databases()
-                return True, f"Connected successfully ({len(schemas)} schemas found)"
-            return True, "Connected successfully"
+            with connection_registry.lease(self) as conn:
+                if self.schema_name:
+                    tables = conn.list_tables()
+                    return True, f"Connected successfully ({len(tables)} tables found)"
+                if list_databases := getattr(conn, "list_databases", None):
+                    schemas = list_databases()
+                    return True, f"Connected successfully ({len(schemas)} schemas found)"
+                return True, "Connected successfully"
         except Exception as e:
             return False, str(e)
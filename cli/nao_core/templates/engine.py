@@ -1,5 +1,6 @@
 """Template engine for rendering Jinja2 templates with user overrides."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -84,6 +85,32 @@ class TemplateEngine:
         template = self.env.get_template(template_name)
         return template.render(**context)
 
+    def stream(self, template_name: str, **context: Any) -> Iterator[str]:
+        """Render a template piece by piece, without building the whole output in memory.
+
+        Args:
+            template_name: Name of the template file (e.g., 'databases/preview.md.j2')
+            **context: Variables to pass to the template
+
+        Returns:
+            Iterator over chunks of the rendered template
+        """
+        template = self.env.get_template(template_name)
+        return template.generate(**context)
+
+    def get_source(self, template_name: str) -> str:
+        """Return the raw source of a template, honoring user overrides.
+
+        Args:
+            template_name: Name of the template file (e.g., 'databases/preview.md.j2')
+
+        Returns:
+            The template source code
+        """
+        assert self.env.loader is not None
+        source, _, _ = self.env.loader.get_source(self.env, template_name)
+        return source
+
     def has_template(self, template_name: str) -> bool:
         """Check if a template exists.
 
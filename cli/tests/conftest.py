@@ -0,0 +1,10 @@
+import pytest
+
+from nao_core.config.databases.registry import connection_registry
+
+
+@pytest.fixture(autouse=True)
+def close_pooled_connections():
+    """Close connections pooled by a test so the next one starts from a fresh registry."""
+    yield
+    connection_registry.close()
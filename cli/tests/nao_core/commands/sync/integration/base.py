@@ -7,12 +7,16 @@ that inherits from `BaseSyncIntegrationTests` to get all shared assertions for f
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from rich.progress import Progress
 
+from nao_core.commands.sync.providers.databases import provider as provider_module
+from nao_core.commands.sync.providers.databases.checkpoint import CHECKPOINT_FILENAME
 from nao_core.commands.sync.providers.databases.provider import sync_database
 
 
@@ -156,6 +160,33 @@ class BaseSyncIntegrationTests:
 
         assert rows == spec.orders_preview_rows
 
+    def test_preview_options_cap_columns_and_truncate_cells(self, tmp_path_factory, db_config, spec):
+        """Preview options should limit the columns and truncate long values."""
+        config = db_config.model_copy(update={"preview_max_columns": 2, "preview_max_cell_bytes": 3})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_preview_options")
+        with Progress(transient=True) as progress:
+            sync_database(config, output, progress)
+
+        content = self._read_table_file(output, config, spec, spec.users_table, "preview.md")
+        rows = self._parse_preview_rows(content)
+        assert len(rows) == 3
+        for row in rows:
+            assert len(row) == 2
+            assert all(not isinstance(v, str) or len(v.encode()) <= 3 + len("…".encode()) for v in row.values())
+
+    def test_preview_sample_covers_whole_table(self, tmp_path_factory, db_config, spec):
+        """A 100% TABLESAMPLE preview should return every row of a small table."""
+        config = db_config.model_copy(update={"preview_sample_percent": 100})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_preview_sample")
+        with Progress(transient=True) as progress:
+            sync_database(config, output, progress)
+
+        content = self._read_table_file(output, config, spec, spec.users_table, "preview.md")
+        rows = sorted(self._parse_preview_rows(content), key=lambda r: r[spec.row_id_key])
+        assert rows == sorted(spec.users_preview_rows, key=lambda r: r[spec.row_id_key])
+
     # ── sync state ───────────────────────────────────────────────────
 
     def test_sync_state_tracks_schemas_and_tables(self, synced, spec):
@@ -167,6 +198,13 @@ class BaseSyncIntegrationTests:
         assert spec.users_table in state.synced_tables[spec.primary_schema]
         assert spec.orders_table in state.synced_tables[spec.primary_schema]
 
+    def test_sync_state_counts_metadata_cache_hits(self, synced):
+        state, _, _ = synced
+
+        # description.md.j2 calls db.description() twice and column_count() reuses columns()
+        assert state.cache_misses > 0
+        assert state.cache_hits > 0
+
     # ── include / exclude filters ────────────────────────────────────
 
     def test_include_filter(self, tmp_path_factory, db_config, spec):
@@ -197,6 +235,198 @@ class BaseSyncIntegrationTests:
         assert not (base / f"table={spec.orders_table}").exists()
         assert state.tables_synced == 1
 
+    # ── parallel sync ────────────────────────────────────────────────
+
+    def test_parallel_sync_matches_serial(self, synced, tmp_path_factory, db_config, spec):
+        """Syncing with several workers should produce the same files as a serial sync."""
+        _, serial_output, _ = synced
+        config = db_config.model_copy(update={"sync_concurrency": 4})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_parallel")
+        with Progress(transient=True) as progress:
+            state = sync_database(config, output, progress)
+
+        assert state.schemas_synced == 1
+        assert state.tables_synced == 2
+
+        for table in (spec.users_table, spec.orders_table):
+            for filename in ("columns.md", "description.md"):
+                parallel = self._read_table_file(output, config, spec, table, filename)
+                serial = self._read_table_file(serial_output, config, spec, table, filename)
+                assert parallel == serial
+
+    # ── atomic writes ────────────────────────────────────────────────
+
+    def test_resync_leaves_identical_files_untouched(self, tmp_path_factory, db_config, spec):
+        """Re-syncing unchanged tables should not rewrite their files."""
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_resync")
+        with Progress(transient=True) as progress:
+            first = sync_database(db_config, output, progress)
+        assert first.files_written == 6
+        assert first.files_unchanged == 0
+
+        columns_file = self._base_path(output, db_config, spec) / f"table={spec.users_table}" / "columns.md"
+        os.utime(columns_file, (1_000_000, 1_000_000))
+
+        with Progress(transient=True) as progress:
+            second = sync_database(db_config, output, progress)
+
+        # columns.md and description.md are stable; preview row order may vary by backend
+        assert second.files_unchanged >= 4
+        assert second.files_unchanged + second.files_written == 6
+        assert columns_file.stat().st_mtime == 1_000_000
+
+    def test_pipelined_sync_matches_serial(self, synced, tmp_path_factory, db_config, spec):
+        """The pipelined mode should produce the same files as a serial sync."""
+        _, serial_output, _ = synced
+        config = db_config.model_copy(update={"pipelined": True, "sync_concurrency": 2})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_pipelined")
+        with Progress(transient=True) as progress:
+            state = sync_database(config, output, progress)
+
+        assert state.tables_synced == 2
+        assert state.files_written == 6
+
+        for table in (spec.users_table, spec.orders_table):
+            for filename in ("columns.md", "description.md"):
+                pipelined = self._read_table_file(output, config, spec, table, filename)
+                serial = self._read_table_file(serial_output, config, spec, table, filename)
+                assert pipelined == serial
+
+    # ── incremental sync ─────────────────────────────────────────────
+
+    def test_incremental_sync_skips_unchanged_tables(self, tmp_path_factory, db_config, spec):
+        """A second incremental sync should leave unchanged tables alone."""
+        config = db_config.model_copy(update={"incremental": True})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_incremental")
+        with Progress(transient=True) as progress:
+            first = sync_database(config, output, progress)
+        assert first.tables_unchanged == 0
+
+        removed = self._base_path(output, config, spec) / f"table={spec.orders_table}" / "preview.md"
+        removed.unlink()
+
+        with Progress(transient=True) as progress:
+            second = sync_database(config, output, progress)
+
+        assert second.tables_synced == 2
+        assert second.tables_unchanged == 1
+        assert removed.exists()
+
+    # ── resumable sync ───────────────────────────────────────────────
+
+    def test_resume_skips_tables_rendered_before_interruption(self, tmp_path_factory, db_config, spec):
+        """Resuming an interrupted sync should only render the tables it did not finish."""
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_resume")
+        real_render_table = provider_module.render_table
+        calls = []
+
+        def interrupt_after_first_table(*args, **kwargs):
+            calls.append(args)
+            if len(calls) > 1:
+                raise ConnectionError("connection lost")
+            return real_render_table(*args, **kwargs)
+
+        with Progress(transient=True) as progress:
+            with patch.object(provider_module, "render_table", side_effect=interrupt_after_first_table):
+                with pytest.raises(ConnectionError):
+                    sync_database(db_config, output, progress)
+
+        journal = output / f"type={db_config.type}" / f"database={db_config.get_database_name()}" / CHECKPOINT_FILENAME
+        assert journal.exists()
+
+        with Progress(transient=True) as progress:
+            state = sync_database(db_config, output, progress, resume=True)
+
+        assert state.tables_synced == 2
+        assert state.tables_resumed == 1
+        assert state.files_written == 3
+        assert not journal.exists()
+
+    def test_resume_with_different_jobs(self, tmp_path_factory, db_config, spec):
+        """A sync interrupted with one --jobs value should resume with another."""
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_resume_jobs")
+        real_render_table = provider_module.render_table
+        calls = []
+
+        def interrupt_after_first_table(*args, **kwargs):
+            calls.append(args)
+            if len(calls) > 1:
+                raise ConnectionError("connection lost")
+            return real_render_table(*args, **kwargs)
+
+        with Progress(transient=True) as progress:
+            with patch.object(provider_module, "render_table", side_effect=interrupt_after_first_table):
+                with pytest.raises(ConnectionError):
+                    sync_database(db_config, output, progress)
+
+        rerun_config = db_config.model_copy(update={"sync_concurrency": 4})
+        with Progress(transient=True) as progress:
+            state = sync_database(rerun_config, output, progress, resume=True)
+
+        assert state.tables_synced == 2
+        assert state.tables_resumed == 1
+
+    # ── profiling ────────────────────────────────────────────────────
+
+    def test_profile_md_not_written_by_default(self, synced, spec):
+        _, output, config = synced
+        table_dir = self._base_path(output, config, spec) / f"table={spec.users_table}"
+
+        assert not (table_dir / "profile.md").exists()
+
+    def test_profile_md_reports_column_statistics(self, tmp_path_factory, db_config, spec):
+        config = db_config.model_copy(update={"profile": True})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_profile")
+        with Progress(transient=True) as progress:
+            sync_database(config, output, progress)
+
+        content = self._read_table_file(output, config, spec, spec.users_table, "profile.md")
+        assert "Computed over 3 rows" in content
+        for column in spec.users_preview_rows[0]:
+            assert f"### {column} (" in content
+        # One of the three users has no email
+        assert "- Nulls: 1 (33.3%)" in content
+
+    def test_profile_budget_skips_tables(self, tmp_path_factory, db_config, spec):
+        config = db_config.model_copy(update={"profile": True, "profile_max_bytes": 1})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_profile_budget")
+        with Progress(transient=True) as progress:
+            sync_database(config, output, progress)
+
+        content = self._read_table_file(output, config, spec, spec.users_table, "profile.md")
+        assert "Profile not computed: bytes budget exhausted" in content
+
+    # ── row count modes ──────────────────────────────────────────────
+
+    def test_row_count_mode_off(self, tmp_path_factory, db_config, spec):
+        """With row counts turned off, description.md should not show a count."""
+        config = db_config.model_copy(update={"row_count_mode": "off"})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_row_count_off")
+        with Progress(transient=True) as progress:
+            sync_database(config, output, progress)
+
+        content = self._read_table_file(output, config, spec, spec.users_table, "description.md")
+        assert "| **Row Count** | _Not computed_ |" in content
+        assert "| **Column Count** | 4 |" in content
+
+    def test_row_count_mode_estimate(self, tmp_path_factory, db_config, spec):
+        """Estimated counts come from statistics, or fall back to an exact count."""
+        config = db_config.model_copy(update={"row_count_mode": "estimate"})
+
+        output = tmp_path_factory.mktemp(f"{spec.db_type}_row_count_estimate")
+        with Progress(transient=True) as progress:
+            state = sync_database(config, output, progress)
+
+        assert state.tables_synced == 2
+        content = self._read_table_file(output, config, spec, spec.users_table, "description.md")
+        assert "| **Row Count** | 3 |" in content or "(estimated) |" in content
+
     # ── multi-schema sync ────────────────────────────────────────────
 
     def test_sync_all_schemas(self, tmp_path_factory, db_config, spec):
@@ -88,3 +88,24 @@ def spec():
 
 class TestDuckDBSyncIntegration(BaseSyncIntegrationTests):
     """Verify the sync pipeline produces correct output against a local DuckDB database."""
+
+    def test_table_stats_use_estimated_size(self, db_config):
+        conn = db_config.connect()
+        try:
+            stats = db_config.get_table_stats(conn, "main")
+        finally:
+            conn.disconnect()
+
+        assert stats["users"]["row_count"] == 3
+        assert stats["orders"]["row_count"] == 2
+
+    def test_list_tables_pushes_patterns_down(self, db_config):
+        config = db_config.model_copy(update={"include": ["main.*"], "exclude": ["main.ord?rs"]})
+        conn = config.connect()
+        try:
+            assert config.list_tables(conn, "main") == ["users"]
+        finally:
+            conn.disconnect()
+
+        assert config.schema_may_match("main")
+        assert not config.schema_may_match("other")
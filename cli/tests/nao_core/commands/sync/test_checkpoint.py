@@ -0,0 +1,85 @@
+"""Unit tests for the resumable sync checkpoint journal."""
+
+from pathlib import Path
+
+from nao_core.commands.sync.providers.databases.checkpoint import (
+    CHECKPOINT_FILENAME,
+    SyncCheckpoint,
+    compute_sync_generation,
+)
+from nao_core.config.databases.duckdb import DuckDBConfig
+
+
+class TestSyncCheckpoint:
+    def test_resume_loads_recorded_tables(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint.open(tmp_path, "gen1")
+        checkpoint.record("main", "users", "fp1")
+        checkpoint.record("main", "orders")
+        checkpoint.close()
+
+        resumed = SyncCheckpoint.open(tmp_path, "gen1", resume=True)
+        resumed.close()
+
+        assert resumed.is_completed("main", "users")
+        assert resumed.is_completed("main", "orders")
+        assert resumed.fingerprint("main", "users") == "fp1"
+        assert not resumed.is_completed("main", "events")
+
+    def test_without_resume_starts_over(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint.open(tmp_path, "gen1")
+        checkpoint.record("main", "users")
+        checkpoint.close()
+
+        fresh = SyncCheckpoint.open(tmp_path, "gen1")
+        fresh.close()
+
+        assert fresh.completed == {}
+        assert len((tmp_path / CHECKPOINT_FILENAME).read_text().splitlines()) == 1
+
+    def test_other_generation_is_not_resumed(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint.open(tmp_path, "gen1")
+        checkpoint.record("main", "users")
+        checkpoint.close()
+
+        resumed = SyncCheckpoint.open(tmp_path, "gen2", resume=True)
+        resumed.close()
+
+        assert resumed.completed == {}
+
+    def test_partial_last_line_is_ignored(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint.open(tmp_path, "gen1")
+        checkpoint.record("main", "users")
+        checkpoint.close()
+        with (tmp_path / CHECKPOINT_FILENAME).open("a") as f:
+            f.write('{"schema": "main", "tab')
+
+        resumed = SyncCheckpoint.open(tmp_path, "gen1", resume=True)
+        resumed.record("main", "orders")
+        resumed.close()
+
+        again = SyncCheckpoint.open(tmp_path, "gen1", resume=True)
+        again.close()
+        assert set(again.completed) == {("main", "users"), ("main", "orders")}
+
+    def test_complete_removes_journal(self, tmp_path: Path):
+        checkpoint = SyncCheckpoint.open(tmp_path, "gen1")
+        checkpoint.record("main", "users")
+        checkpoint.complete()
+
+        assert not (tmp_path / CHECKPOINT_FILENAME).exists()
+
+
+class TestSyncGeneration:
+    def test_config_change_changes_generation(self):
+        config = DuckDBConfig(name="test", path="db.duckdb")
+        filtered = config.model_copy(update={"include": ["main.*"]})
+
+        assert compute_sync_generation(config, "t") == compute_sync_generation(config, "t")
+        assert compute_sync_generation(config, "t") != compute_sync_generation(filtered, "t")
+        assert compute_sync_generation(config, "t") != compute_sync_generation(config, "u")
+
+    def test_execution_settings_keep_generation(self):
+        config = DuckDBConfig(name="test", path="db.duckdb")
+        rerun = config.model_copy(update={"sync_concurrency": 8, "pipelined": True, "max_concurrent_queries": 2})
+
+        assert compute_sync_generation(config, "t") == compute_sync_generation(rerun, "t")
@@ -1,10 +1,17 @@
 """Unit tests for DatabaseContext."""
 
+from contextlib import contextmanager
 from unittest.mock import MagicMock
 
-import pandas as pd
+import ibis
+import pyarrow as pa
+import pytest
+from ibis.common.exceptions import IbisError
 
-from nao_core.commands.sync.providers.databases.context import DatabaseContext
+from nao_core.config.databases.catalog import TableMetadata
+from nao_core.config.databases.context import DatabaseContext
+from nao_core.config.databases.preview import PreviewOptions
+from nao_core.config.databases.profile import ProfileBudget, ProfileOptions
 
 
 class TestDatabaseContext:
@@ -34,8 +41,7 @@ class TestDatabaseContext:
 
     def test_preview_returns_rows(self):
         ctx, mock_table = self._make_context()
-        df = pd.DataFrame({"id": [1, 2], "name": ["Alice", "Bob"]})
-        mock_table.limit.return_value.execute.return_value = df
+        mock_table.limit.return_value.to_pyarrow.return_value = pa.table({"id": [1, 2], "name": ["Alice", "Bob"]})
 
         rows = ctx.preview(limit=2)
 
@@ -57,6 +63,10 @@ class TestDatabaseContext:
         ctx, _ = self._make_context()
         assert ctx.description() is None
 
+    def test_description_comes_from_metadata(self):
+        ctx = DatabaseContext(MagicMock(), "main", "users", metadata=TableMetadata(description="All users"))
+        assert ctx.description() == "All users"
+
     def test_table_is_lazily_loaded(self):
         mock_conn = MagicMock()
         ctx = DatabaseContext(mock_conn, "schema", "table")
@@ -72,3 +82,222 @@ class TestDatabaseContext:
         _ = ctx.table
         _ = ctx.table
         mock_conn.table.assert_called_once()
+
+    def test_columns_served_from_bulk_metadata(self):
+        mock_conn = MagicMock()
+        metadata = TableMetadata(
+            columns=[{"name": "id", "type": "int64 NOT NULL", "nullable": False, "description": None}]
+        )
+        ctx = DatabaseContext(mock_conn, "schema", "table", metadata=metadata)
+
+        assert ctx.columns() == metadata.columns
+        assert ctx.column_count() == 1
+        mock_conn.table.assert_not_called()
+
+    def test_metadata_calls_are_memoized(self):
+        ctx, mock_table = self._make_context()
+        mock_table.count.return_value.execute.return_value = 42
+
+        assert ctx.row_count() == 42
+        assert ctx.row_count() == 42
+        ctx.columns()
+        ctx.column_count()
+
+        mock_table.count.assert_called_once()
+        mock_table.schema.assert_called_once()
+        assert ctx.cache_misses == 2
+        assert ctx.cache_hits == 2
+
+    def test_preview_default_and_explicit_limit_share_cache_entry(self):
+        ctx, mock_table = self._make_context()
+        mock_table.limit.return_value.to_pyarrow.return_value = pa.table({"id": [1]})
+
+        ctx.preview()
+        ctx.preview(limit=10)
+        ctx.preview(5)
+
+        assert mock_table.limit.call_count == 2
+        assert ctx.cache_hits == 1
+
+    def test_failed_calls_are_not_cached(self):
+        ctx, mock_table = self._make_context()
+        mock_table.count.return_value.execute.side_effect = [RuntimeError("boom"), 7]
+
+        with pytest.raises(RuntimeError):
+            ctx.row_count()
+
+        assert ctx.row_count() == 7
+
+    def test_estimate_mode_reads_row_count_from_statistics(self):
+        mock_conn = MagicMock()
+        ctx = DatabaseContext(
+            mock_conn, "schema", "table", metadata=TableMetadata(row_count=1234), row_count_mode="estimate"
+        )
+
+        assert ctx.row_count() == 1234
+        assert ctx.row_count_is_estimate() is True
+        mock_conn.table.assert_not_called()
+
+    def test_estimate_mode_falls_back_to_exact_count(self):
+        ctx, mock_table = self._make_context()
+        ctx._row_count_mode = "estimate"
+        mock_table.count.return_value.execute.return_value = 3
+
+        assert ctx.row_count() == 3
+        assert ctx.row_count_is_estimate() is False
+
+    def test_exact_mode_ignores_statistics(self):
+        ctx, mock_table = self._make_context()
+        ctx._metadata = TableMetadata(row_count=1234)
+        mock_table.count.return_value.execute.return_value = 3
+
+        assert ctx.row_count() == 3
+        assert ctx.row_count_is_estimate() is False
+
+    def test_off_mode_skips_row_count(self):
+        ctx, mock_table = self._make_context()
+        ctx._row_count_mode = "off"
+
+        assert ctx.row_count() is None
+        mock_table.count.assert_not_called()
+
+    def test_preview_caps_columns(self):
+        ctx, mock_table = self._make_context()
+        ctx._preview_options = PreviewOptions(max_columns=1)
+        mock_table.columns = ("id", "name")
+        capped = mock_table.select.return_value
+        capped.columns = ("id",)
+        capped.limit.return_value.to_pyarrow.return_value = pa.table({"id": [1]})
+
+        assert ctx.preview() == [{"id": 1}]
+        mock_table.select.assert_called_once_with("id")
+
+    def test_preview_uses_table_sample(self):
+        ctx, mock_table = self._make_context()
+        ctx._preview_options = PreviewOptions(sample_percent=5)
+        sampled = mock_table.sample.return_value
+        sampled.limit.return_value.to_pyarrow.return_value = pa.table({"id": [7]})
+
+        assert ctx.preview() == [{"id": 7}]
+        mock_table.sample.assert_called_once_with(0.05, method="block")
+        mock_table.limit.assert_not_called()
+
+    def test_preview_falls_back_when_sampling_fails(self):
+        ctx, mock_table = self._make_context()
+        ctx._preview_options = PreviewOptions(sample_percent=5)
+        mock_table.sample.side_effect = NotImplementedError
+        mock_table.limit.return_value.to_pyarrow.return_value = pa.table({"id": [1]})
+
+        assert ctx.preview() == [{"id": 1}]
+
+    def test_prefetch_memoizes_default_calls_and_ignores_failures(self):
+        ctx, mock_table = self._make_context()
+        mock_table.count.return_value.execute.return_value = 3
+        mock_table.limit.return_value.to_pyarrow.side_effect = IbisError("boom")
+
+        ctx.prefetch()
+
+        assert ctx.row_count() == 3
+        mock_table.count.assert_called_once()
+
+    def test_bind_switches_connection(self):
+        ctx, _ = self._make_context()
+        _ = ctx.table
+        other_conn = MagicMock()
+
+        ctx.bind(other_conn)
+        _ = ctx.table
+
+        other_conn.table.assert_called_once_with("my_table", database="my_schema")
+
+    @staticmethod
+    def _query_slot(held: list[bool]):
+        @contextmanager
+        def query_slot():
+            assert not held, "query slot taken twice"
+            held.append(True)
+            yield
+            held.pop()
+
+        return query_slot
+
+    def test_queries_hold_the_query_slot(self):
+        ctx, mock_table = self._make_context()
+        held: list[bool] = []
+        ctx.query_slot = self._query_slot(held)
+        mock_table.count.return_value.execute.side_effect = lambda: len(held)
+
+        assert ctx.row_count() == 1
+        assert held == []
+
+    def test_nested_calls_take_the_query_slot_once(self):
+        ctx, _ = self._make_context()
+        held: list[bool] = []
+        ctx.query_slot = self._query_slot(held)
+        ctx._profile_options = ProfileOptions(enabled=True, sample_rows=0)
+
+        # profile() reads columns() while holding the slot
+        ctx.profile()
+
+        assert held == []
+        assert ctx.cache_misses == 2
+
+    def test_profile_disabled_by_default(self):
+        ctx, mock_table = self._make_context()
+
+        assert ctx.profile() is None
+        mock_table.limit.assert_not_called()
+
+    def test_profile_skipped_when_budget_exhausted(self):
+        mock_conn = MagicMock()
+        metadata = TableMetadata(columns=[{"name": "id", "type": "int64", "nullable": False, "description": None}])
+        options = ProfileOptions(enabled=True, sample_rows=100, budget=ProfileBudget(max_bytes=100))
+        ctx = DatabaseContext(mock_conn, "my_schema", "my_table", metadata=metadata, profile_options=options)
+
+        profile = ctx.profile()
+
+        assert profile is not None
+        assert profile["skipped"] == "bytes budget exhausted"
+        mock_conn.table.assert_not_called()
+
+
+class TestDatabaseContextProfile:
+    @pytest.fixture
+    def conn(self):
+        conn = ibis.duckdb.connect()
+        conn.raw_sql("""
+            CREATE TABLE events AS
+            SELECT
+                i AS id,
+                CASE WHEN i % 4 = 0 THEN NULL ELSE ['web', 'ios', 'android'][i % 3 + 1] END AS platform,
+                i * 0.5 AS amount
+            FROM range(40) AS r(i)
+        """)
+        yield conn
+        conn.disconnect()
+
+    def test_profile_computes_column_statistics(self, conn):
+        ctx = DatabaseContext(conn, "main", "events", profile_options=ProfileOptions(enabled=True, top_k=2))
+
+        profile = ctx.profile()
+
+        assert profile is not None
+        assert profile["rows_scanned"] == 40
+        assert profile["sampled"] is False
+        columns = {col["name"]: col for col in profile["columns"]}
+        assert columns["id"]["min"] == 0
+        assert columns["id"]["max"] == 39
+        assert columns["id"]["top_values"] == []
+        assert columns["platform"]["null_count"] == 10
+        assert columns["platform"]["null_ratio"] == 0.25
+        assert columns["platform"]["distinct_count"] == 3
+        assert [top["count"] for top in columns["platform"]["top_values"]] == [10, 10]
+
+    def test_profile_stops_at_sample_rows(self, conn):
+        ctx = DatabaseContext(conn, "main", "events", profile_options=ProfileOptions(enabled=True, sample_rows=10))
+
+        profile = ctx.profile()
+
+        assert profile is not None
+        assert profile["rows_scanned"] == 10
+        assert profile["sampled"] is True
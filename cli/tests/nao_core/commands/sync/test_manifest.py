@@ -0,0 +1,118 @@
+"""Unit tests for the incremental sync manifest."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from nao_core.commands.sync.providers.databases.manifest import (
+    MANIFEST_FILENAME,
+    SyncManifest,
+    compute_table_fingerprint,
+    compute_templates_hash,
+)
+from nao_core.config.databases.catalog import TableMetadata
+from nao_core.templates.engine import TemplateEngine
+
+
+def _make_context(columns, row_count=10):
+    ctx = MagicMock()
+    ctx.columns.return_value = [{"name": name, "type": dtype} for name, dtype in columns]
+    ctx.row_count.return_value = row_count
+    return ctx
+
+
+class TestSyncManifest:
+    def test_save_and_load_roundtrip(self, tmp_path: Path):
+        manifest = SyncManifest(templates_hash="abc")
+        manifest.set("public", "users", "fp1")
+        manifest.save(tmp_path)
+
+        loaded = SyncManifest.load(tmp_path)
+
+        assert loaded is not None
+        assert loaded.templates_hash == "abc"
+        assert loaded.get("public", "users") == "fp1"
+        assert loaded.get("public", "orders") is None
+
+    def test_load_returns_none_when_missing(self, tmp_path: Path):
+        assert SyncManifest.load(tmp_path) is None
+
+    def test_load_returns_none_when_corrupted(self, tmp_path: Path):
+        (tmp_path / MANIFEST_FILENAME).write_text("{not json")
+
+        assert SyncManifest.load(tmp_path) is None
+
+    def test_load_returns_none_for_other_version(self, tmp_path: Path):
+        (tmp_path / MANIFEST_FILENAME).write_text('{"version": 999, "templates_hash": "abc", "tables": {}}')
+
+        assert SyncManifest.load(tmp_path) is None
+
+
+class TestTableFingerprint:
+    def test_same_metadata_gives_same_fingerprint(self):
+        first = compute_table_fingerprint(_make_context([("id", "int64")]), None)
+        second = compute_table_fingerprint(_make_context([("id", "int64")]), None)
+
+        assert first == second
+
+    def test_column_type_change_changes_fingerprint(self):
+        before = compute_table_fingerprint(_make_context([("id", "int64")]), None)
+        after = compute_table_fingerprint(_make_context([("id", "string")]), None)
+
+        assert before != after
+
+    def test_row_count_change_changes_fingerprint(self):
+        before = compute_table_fingerprint(_make_context([("id", "int64")], row_count=1), None)
+        after = compute_table_fingerprint(_make_context([("id", "int64")], row_count=2), None)
+
+        assert before != after
+
+    def test_uses_catalog_row_count_without_querying_table(self):
+        ctx = _make_context([("id", "int64")])
+
+        compute_table_fingerprint(ctx, TableMetadata(row_count=5, last_modified="2024-01-01"))
+
+        ctx.row_count.assert_not_called()
+
+    def test_last_modified_alone_does_not_count_rows(self):
+        ctx = _make_context([("id", "int64")])
+
+        compute_table_fingerprint(ctx, TableMetadata(last_modified="2024-01-01"))
+
+        ctx.row_count.assert_not_called()
+
+    def test_missing_stats_only_count_rows_in_exact_mode(self):
+        ctx = _make_context([("id", "int64")])
+
+        compute_table_fingerprint(ctx, None, row_count_mode="estimate")
+        compute_table_fingerprint(ctx, None, row_count_mode="off")
+
+        ctx.row_count.assert_not_called()
+
+    def test_last_modified_change_changes_fingerprint(self):
+        ctx = _make_context([("id", "int64")])
+
+        before = compute_table_fingerprint(ctx, TableMetadata(row_count=5, last_modified="2024-01-01"))
+        after = compute_table_fingerprint(ctx, TableMetadata(row_count=5, last_modified="2024-01-02"))
+
+        assert before != after
+
+    def test_size_change_changes_fingerprint(self):
+        ctx = _make_context([("id", "int64")])
+
+        without_size = compute_table_fingerprint(ctx, TableMetadata(row_count=5))
+        before = compute_table_fingerprint(ctx, TableMetadata(row_count=5, size_bytes=1024))
+        after = compute_table_fingerprint(ctx, TableMetadata(row_count=5, size_bytes=2048))
+
+        assert len({without_size, before, after}) == 3
+
+
+class TestTemplatesHash:
+    def test_user_override_changes_hash(self, tmp_path: Path):
+        templates = ["databases/columns.md.j2"]
+        default_hash = compute_templates_hash(TemplateEngine(), templates)
+
+        override_dir = tmp_path / "templates" / "databases"
+        override_dir.mkdir(parents=True)
+        (override_dir / "columns.md.j2").write_text("custom")
+
+        assert compute_templates_hash(TemplateEngine(tmp_path), templates) != default_hash
@@ -0,0 +1,64 @@
+"""Unit tests for the pipelined table sync."""
+
+import threading
+
+import pytest
+from rich.progress import Progress
+
+from nao_core.commands.sync.providers.databases.pipeline import SyncPipeline
+
+
+def _make_pipeline(progress, done, **overrides):
+    stages = {
+        "prepare": lambda item: item * 10,
+        "render": lambda value: value + 1,
+        "write": lambda value: str(value),
+        "on_done": lambda item, result: done.append((item, result, threading.current_thread().name)),
+    }
+    stages.update(overrides)
+    return SyncPipeline(progress=progress, workers=3, queue_size=2, **stages)
+
+
+def test_every_item_goes_through_all_stages():
+    done = []
+    with Progress(transient=True) as progress:
+        pipeline = _make_pipeline(progress, done)
+        for item in range(20):
+            pipeline.submit(item)
+        pipeline.finish()
+
+    assert sorted(item for item, _, _ in done) == list(range(20))
+    assert all(result == str(item * 10 + 1) for item, result, _ in done)
+    assert {thread for _, _, thread in done} == {"nao-sync-write"}
+    assert {name: meter.count for name, meter in pipeline.meters.items()} == {
+        "prefetch": 20,
+        "render": 20,
+        "write": 20,
+    }
+
+
+def test_stage_error_is_raised_by_finish():
+    def render(value):
+        if value == 50:
+            raise RuntimeError("render failed")
+        return value
+
+    done = []
+    with Progress(transient=True) as progress:
+        pipeline = _make_pipeline(progress, done, render=render)
+        for item in range(20):
+            pipeline.submit(item)
+
+        with pytest.raises(RuntimeError, match="render failed"):
+            pipeline.finish()
+
+    assert len(done) < 20
+
+
+def test_finish_without_items():
+    done = []
+    with Progress(transient=True) as progress:
+        pipeline = _make_pipeline(progress, done)
+        pipeline.finish()
+
+    assert done == []
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from nao_core.commands.sync import sync
-from nao_core.commands.sync.providers import ProviderSelection, SyncProvider, SyncResult
+from nao_core.commands.sync.providers import DatabaseSyncProvider, ProviderSelection, SyncProvider, SyncResult
 
 
 def _make_provider(
@@ -146,3 +146,75 @@ class TestSyncCommand:
         calls = [str(call) for call in mock_console.print.call_args_list]
         # Should show "Sync Failed" status
         assert any("Sync Failed" in call for call in calls)
+
+    def test_sync_jobs_overrides_database_concurrency(self, create_config):
+        create_config(
+            "project_name: test-project\n"
+            "databases:\n"
+            "  - name: local\n"
+            "    type: duckdb\n"
+            "    path: ':memory:'\n"
+            "    sync_concurrency: 2\n"
+        )
+        selection = _make_provider()
+        selection.provider.get_items.side_effect = lambda config: config.databases
+
+        with patch("nao_core.commands.sync.console"):
+            sync(jobs=8, _providers=[selection])
+
+        items = selection.provider.sync.call_args[0][0]
+        assert items[0].sync_concurrency == 8
+
+    def test_sync_exits_when_jobs_is_invalid(self, create_config):
+        create_config()
+        selection = _make_provider()
+
+        with patch("nao_core.commands.sync.console"):
+            with pytest.raises(SystemExit) as exc_info:
+                sync(jobs=0, _providers=[selection])
+
+        assert exc_info.value.code == 1
+        selection.provider.sync.assert_not_called()
+
+    def test_sync_parallel_connections_configures_database_provider(self, create_config):
+        create_config(
+            "project_name: test-project\ndatabases:\n  - name: local\n    type: duckdb\n    path: ':memory:'\n"
+        )
+        selection = ProviderSelection(DatabaseSyncProvider())
+
+        with patch("nao_core.commands.sync.console"):
+            with (
+                patch.object(DatabaseSyncProvider, "pre_sync"),
+                patch.object(DatabaseSyncProvider, "sync", return_value=SyncResult("Databases", 0)) as mock_sync,
+            ):
+                sync(parallel_connections=3, _providers=[selection])
+
+        mock_sync.assert_called_once()
+        assert selection.provider.max_parallel_connections == 3
+
+    def test_sync_resume_configures_database_provider(self, create_config):
+        create_config(
+            "project_name: test-project\ndatabases:\n  - name: local\n    type: duckdb\n    path: ':memory:'\n"
+        )
+        selection = ProviderSelection(DatabaseSyncProvider(max_parallel_connections=2))
+
+        with patch("nao_core.commands.sync.console"):
+            with (
+                patch.object(DatabaseSyncProvider, "pre_sync"),
+                patch.object(DatabaseSyncProvider, "sync", return_value=SyncResult("Databases", 0)),
+            ):
+                sync(resume=True, _providers=[selection])
+
+        assert selection.provider.resume is True
+        assert selection.provider.max_parallel_connections == 2
+
+    def test_sync_exits_when_parallel_connections_is_invalid(self, create_config):
+        create_config()
+        selection = _make_provider()
+
+        with patch("nao_core.commands.sync.console"):
+            with pytest.raises(SystemExit) as exc_info:
+                sync(parallel_connections=0, _providers=[selection])
+
+        assert exc_info.value.code == 1
+        selection.provider.sync.assert_not_called()
@@ -0,0 +1,71 @@
+"""Unit tests for atomic sync file writes."""
+
+import os
+
+import pytest
+
+from nao_core.commands.sync.writer import write_if_changed
+
+
+def _leftover_temp_files(directory):
+    return [p for p in directory.iterdir() if p.name.endswith(".tmp")]
+
+
+def test_writes_new_file(tmp_path):
+    path = tmp_path / "columns.md"
+
+    assert write_if_changed(path, ["# users", "\n"]) is True
+    assert path.read_text() == "# users\n"
+    assert _leftover_temp_files(tmp_path) == []
+
+
+def test_new_file_gets_regular_permissions(tmp_path):
+    path = tmp_path / "columns.md"
+    reference = tmp_path / "reference.md"
+    reference.write_text("")
+
+    write_if_changed(path, ["# users\n"])
+
+    assert os.stat(path).st_mode & 0o777 == os.stat(reference).st_mode & 0o777
+
+
+def test_replaced_file_keeps_its_permissions(tmp_path):
+    path = tmp_path / "columns.md"
+    path.write_text("# old\n")
+    path.chmod(0o640)
+
+    assert write_if_changed(path, ["# new\n"]) is True
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+def test_identical_content_leaves_file_untouched(tmp_path):
+    path = tmp_path / "columns.md"
+    path.write_text("# users\n")
+    os.utime(path, (1_000_000, 1_000_000))
+
+    assert write_if_changed(path, ["# users\n"]) is False
+    assert path.stat().st_mtime == 1_000_000
+    assert _leftover_temp_files(tmp_path) == []
+
+
+def test_changed_content_replaces_file(tmp_path):
+    path = tmp_path / "columns.md"
+    path.write_text("# old\n")
+
+    assert write_if_changed(path, ["# new\n"]) is True
+    assert path.read_text() == "# new\n"
+
+
+def test_failed_render_keeps_previous_file(tmp_path):
+    path = tmp_path / "columns.md"
+    path.write_text("# old\n")
+
+    def chunks():
+        yield "# partial"
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        write_if_changed(path, chunks())
+
+    assert path.read_text() == "# old\n"
+    assert _leftover_temp_files(tmp_path) == []
@@ -0,0 +1,128 @@
+"""Unit tests for the BigQuery database context."""
+
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+from google.cloud import bigquery
+
+from nao_core.config.databases.bigquery import BigQueryConfig, BigQueryDatabaseContext, parse_option_string
+from nao_core.config.databases.catalog import TableMetadata
+from nao_core.config.databases.preview import PreviewOptions
+from nao_core.config.databases.profile import ProfileBudget, ProfileOptions
+
+SCHEMA = [
+    bigquery.SchemaField("id", "INT64", mode="REQUIRED"),
+    bigquery.SchemaField("name", "STRING"),
+    bigquery.SchemaField("payload", "STRING"),
+]
+
+
+def _make_context(table_type: str = "TABLE", num_rows: int | None = 42, **kwargs) -> BigQueryDatabaseContext:
+    conn = MagicMock()
+    info = MagicMock(table_type=table_type, num_rows=num_rows, schema=SCHEMA)
+    conn.client.get_table.return_value = info
+    conn.client.list_rows.return_value.to_arrow.return_value = pa.table(
+        {"id": [1, 2], "name": ["a", "b"], "payload": ["x" * 50, None]}
+    )
+    return BigQueryDatabaseContext(conn, "proj", "dataset", "orders", **kwargs)
+
+
+class TestBigQueryDatabaseContext:
+    def test_row_count_of_native_table_reads_metadata(self):
+        ctx = _make_context()
+
+        assert ctx.row_count() == 42
+        ctx._conn.client.get_table.assert_called_once_with("proj.dataset.orders")
+        ctx._conn.table.assert_not_called()
+
+    def test_row_count_of_view_runs_a_query(self):
+        ctx = _make_context(table_type="VIEW", num_rows=None)
+        ctx._conn.table.return_value.count.return_value.execute.return_value = 7
+
+        assert ctx.row_count() == 7
+
+    def test_row_count_estimate_uses_bulk_stats(self):
+        ctx = _make_context(metadata=TableMetadata(row_count=40), row_count_mode="estimate")
+
+        assert ctx.row_count() == 40
+        assert ctx.row_count_is_estimate()
+        ctx._conn.client.get_table.assert_not_called()
+
+    def test_row_count_off(self):
+        assert _make_context(row_count_mode="off").row_count() is None
+
+    def test_preview_of_native_table_uses_tabledata_list(self):
+        ctx = _make_context(preview_options=PreviewOptions(max_columns=2, max_cell_bytes=10))
+
+        rows = ctx.preview(limit=5)
+
+        client = ctx._conn.client
+        client.list_rows.assert_called_once_with(
+            client.get_table.return_value, selected_fields=SCHEMA[:2], max_results=5
+        )
+        assert rows[0] == {"id": 1, "name": "a", "payload": "x" * 10 + "…"}
+        ctx._conn.table.assert_not_called()
+
+    def test_preview_of_view_runs_a_query(self):
+        ctx = _make_context(table_type="VIEW")
+        expr = ctx._conn.table.return_value
+        expr.columns = ["id"]
+        expr.limit.return_value.to_pyarrow.return_value = pa.table({"id": [1]})
+
+        assert ctx.preview() == [{"id": 1}]
+        ctx._conn.client.list_rows.assert_not_called()
+
+    def test_table_metadata_is_fetched_once(self):
+        ctx = _make_context()
+        ctx.prefetch()
+        ctx.row_count()
+        ctx.preview()
+
+        ctx._conn.client.get_table.assert_called_once()
+
+    def test_description_comes_from_bulk_metadata(self):
+        ctx = _make_context(metadata=TableMetadata(columns=[], description="Customer orders"))
+
+        assert ctx.description() == "Customer orders"
+        ctx._conn.client.get_table.assert_not_called()
+
+    def test_description_falls_back_to_table_metadata(self):
+        ctx = _make_context()
+        ctx._conn.client.get_table.return_value.description = "From the API"
+
+        assert ctx.description() == "From the API"
+
+    def test_profile_charges_the_full_table_size_to_the_budget(self):
+        """BigQuery bills whole columns whatever the LIMIT, so the sample size does not lower the charge."""
+        budget = ProfileBudget(max_bytes=10_000_000)
+        ctx = _make_context(profile_options=ProfileOptions(enabled=True, sample_rows=10, budget=budget))
+        ctx._conn.client.get_table.return_value.num_bytes = 50_000_000
+
+        profile = ctx.profile()
+
+        assert profile["skipped"] == "bytes budget exhausted"
+        assert budget.spent == 0
+        ctx._conn.client.query.assert_not_called()
+
+    def test_profile_of_view_charges_a_dry_run_estimate(self):
+        budget = ProfileBudget(max_bytes=1_000)
+        ctx = _make_context(table_type="VIEW", profile_options=ProfileOptions(enabled=True, budget=budget))
+        ctx._conn.client.query.return_value.total_bytes_processed = 5_000
+
+        assert ctx.profile()["skipped"] == "bytes budget exhausted"
+        job_config = ctx._conn.client.query.call_args.kwargs["job_config"]
+        assert job_config.dry_run
+        assert ctx._conn.client.query.call_args.args[0] == "SELECT * FROM `proj.dataset.orders`"
+
+
+def test_config_creates_bigquery_context():
+    config = BigQueryConfig(name="bq", project_id="proj")
+    ctx = config.create_context(MagicMock(), "dataset", "orders", row_count_mode="estimate")
+
+    assert isinstance(ctx, BigQueryDatabaseContext)
+    assert ctx._project_id == "proj"
+
+
+def test_parse_option_string():
+    assert parse_option_string('"Orders \\"placed\\" online"') == 'Orders "placed" online'
+    assert parse_option_string(None) is None
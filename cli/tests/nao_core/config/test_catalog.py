@@ -0,0 +1,103 @@
+"""Unit tests for catalog metadata helpers."""
+
+import ibis
+from ibis.backends.sql.datatypes import DuckDBType, SnowflakeType
+
+from nao_core.config.databases.catalog import (
+    build_schema_metadata,
+    fetch_rows,
+    format_column_type,
+    is_nullable,
+    quote_literal,
+)
+from nao_core.config.databases.duckdb import DuckDBConfig
+
+
+def test_format_column_type_matches_ibis_format():
+    assert format_column_type("INTEGER", False, DuckDBType) == "int32 NOT NULL"
+    assert format_column_type("VARCHAR", True, DuckDBType) == "string"
+    assert format_column_type("NUMBER(38,0)", True, SnowflakeType) == "int64"
+
+
+def test_format_column_type_falls_back_to_raw_type():
+    assert format_column_type("SOME_UNKNOWN_TYPE<x", False, DuckDBType) == "some_unknown_type<x NOT NULL"
+
+
+def test_is_nullable_spellings():
+    assert is_nullable("YES") is True
+    assert is_nullable("NO") is False
+    assert is_nullable(True) is True
+    assert is_nullable(False) is False
+
+
+def test_build_schema_metadata_groups_rows_by_table():
+    rows = [
+        ("orders", "id", "INTEGER", "NO"),
+        ("orders", "amount", "DOUBLE", "YES"),
+        ("users", "name", "VARCHAR", "YES"),
+    ]
+
+    tables = build_schema_metadata(rows, DuckDBType)
+
+    assert list(tables) == ["orders", "users"]
+    assert tables["orders"].columns == [
+        {"name": "id", "type": "int32 NOT NULL", "nullable": False, "description": None},
+        {"name": "amount", "type": "float64", "nullable": True, "description": None},
+    ]
+
+
+def test_quote_literal_escapes_quotes():
+    assert quote_literal("it's", "postgres") == "'it''s'"
+
+
+def test_fetch_rows_keeps_duckdb_connection_open():
+    conn = ibis.duckdb.connect()
+
+    assert fetch_rows(conn, "SELECT 1, 'a'") == [(1, "a")]
+    assert fetch_rows(conn, "SELECT 2") == [(2,)]
+
+
+def test_duckdb_bulk_metadata_matches_table_schema(tmp_path):
+    db_path = tmp_path / "test.duckdb"
+    conn = ibis.duckdb.connect(str(db_path))
+    conn.raw_sql("CREATE TABLE users (id INTEGER NOT NULL, name VARCHAR, score DECIMAL(10, 2))")
+    conn.raw_sql("CREATE TABLE empty_table (flag BOOLEAN)")
+    conn.disconnect()
+
+    config = DuckDBConfig(name="test", path=str(db_path))
+    conn = config.connect()
+    tables = config.load_schema_metadata(conn, "main")
+
+    assert tables is not None
+    assert set(tables) == {"users", "empty_table"}
+    ibis_schema = conn.table("users").schema()
+    assert [col["name"] for col in tables["users"].columns] == list(ibis_schema.names)
+    assert [col["type"] for col in tables["users"].columns] == ["int32 NOT NULL", "string", "decimal(10, 2)"]
+
+
+def test_build_schema_metadata_reads_optional_comments():
+    rows = [
+        ("orders", "id", "INTEGER", "NO", "Order id", "Customer orders"),
+        ("orders", "amount", "DOUBLE", "YES", "", "Customer orders"),
+    ]
+
+    tables = build_schema_metadata(rows, DuckDBType)
+
+    assert tables["orders"].description == "Customer orders"
+    assert [col["description"] for col in tables["orders"].columns] == ["Order id", None]
+
+
+def test_duckdb_bulk_metadata_includes_comments(tmp_path):
+    conn = ibis.duckdb.connect()
+    conn.raw_sql("CREATE TABLE users (id INTEGER, name VARCHAR)")
+    conn.raw_sql("COMMENT ON TABLE users IS 'Application users'")
+    conn.raw_sql("COMMENT ON COLUMN users.id IS 'Primary key'")
+    conn.raw_sql("CREATE VIEW active_users AS SELECT id FROM users")
+    conn.raw_sql("COMMENT ON VIEW active_users IS 'Users seen this month'")
+
+    tables = DuckDBConfig(name="test", path=":memory:").load_schema_metadata(conn, "main")
+
+    assert tables is not None
+    assert tables["users"].description == "Application users"
+    assert [col["description"] for col in tables["users"].columns] == ["Primary key", None]
+    assert tables["active_users"].description == "Users seen this month"
@@ -0,0 +1,143 @@
+"""Unit tests for the Databricks Unity Catalog bulk introspection."""
+
+from datetime import datetime
+
+import pytest
+from databricks.sql.exc import ServerOperationError
+
+from nao_core.config.databases.databricks import DatabricksConfig
+
+MODIFIED = datetime(2024, 1, 1)
+
+TABLES = {
+    "main": [
+        ("sales", "orders", "Customer orders", "DELTA", MODIFIED),
+        ("sales", "orders_view", None, None, MODIFIED),
+        ("staging", "raw_orders", None, "DELTA", MODIFIED),
+    ],
+    "dev": [("sales", "orders", None, "DELTA", MODIFIED)],
+}
+
+COLUMNS = {
+    "main": [
+        ("sales", "orders", "id", "bigint", "NO", "Order id"),
+        ("sales", "orders", "amount", "decimal(10,2)", "YES", None),
+        ("sales", "orders_view", "id", "bigint", "YES", None),
+        ("staging", "raw_orders", "payload", "string", "YES", None),
+    ],
+    "dev": [("sales", "orders", "id", "bigint", "NO", None)],
+}
+
+
+class FakeCursor:
+    def __init__(self, rows, description=None):
+        self.rows = rows
+        self.description = description
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def close(self):
+        pass
+
+
+class FakeDatabricksConnection:
+    """Answers system.information_schema and DESCRIBE DETAIL queries, and records them."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.queries: list[str] = []
+
+    def raw_sql(self, query: str):
+        self.queries.append(query)
+        if self.fail:
+            raise ServerOperationError("system.information_schema is not available")
+        if query.startswith("DESCRIBE DETAIL"):
+            return FakeCursor([("delta", MODIFIED, 2048)], [("format",), ("lastModified",), ("sizeInBytes",)])
+
+        catalog = "dev" if "'dev'" in query else "main"
+        if "information_schema.columns" in query:
+            if "SELECT table_schema" in query:
+                return FakeCursor(COLUMNS[catalog])
+            return FakeCursor([(*row[1:], None) for row in COLUMNS[catalog]])
+        return FakeCursor(TABLES[catalog])
+
+
+def _config(**kwargs) -> DatabricksConfig:
+    return DatabricksConfig(
+        name="dbx", server_hostname="host", http_path="/sql/1.0/warehouses/x", access_token="token", **kwargs
+    )
+
+
+def test_load_catalog_takes_two_queries_per_catalog():
+    config = _config(catalog="main")
+    conn = FakeDatabricksConnection()
+    config.load_catalog(conn)
+
+    assert len(conn.queries) == 2
+    assert all("table_catalog = 'main'" in query for query in conn.queries)
+    assert config.get_schemas(conn) == ["sales", "staging"]
+    assert config.list_tables(conn, "sales") == ["orders", "orders_view"]
+
+    metadata = config.load_schema_metadata(conn, "sales")
+    assert metadata is not None
+    assert [col["type"] for col in metadata["orders"].columns] == ["int64 NOT NULL", "decimal(10, 2)"]
+    assert metadata["orders"].last_modified == MODIFIED
+    assert metadata["orders"].description == "Customer orders"
+    assert metadata["orders"].columns[0]["description"] == "Order id"
+    assert len(conn.queries) == 2
+
+
+def test_load_catalog_pushes_patterns_down():
+    config = _config(catalog="main", include=["sales.*"], exclude=["*.orders_view"])
+    conn = FakeDatabricksConnection()
+    config.load_catalog(conn)
+
+    assert "(table_schema || '.' || table_name) LIKE 'sales.%'" in conn.queries[0]
+    assert config.list_tables(conn, "sales") == ["orders"]
+
+
+def test_multiple_catalogs_qualify_schemas():
+    config = _config(catalogs=["main", "dev"])
+    conn = FakeDatabricksConnection()
+    config.load_catalog(conn)
+
+    assert len(conn.queries) == 4
+    assert config.get_database_name() == "dbx"
+    assert config.get_schemas(conn) == ["dev.sales", "main.sales", "main.staging"]
+    assert config.list_tables(conn, "dev.sales") == ["orders"]
+
+
+def test_table_stats_come_from_describe_detail():
+    config = _config(catalogs=["main", "dev"])
+    conn = FakeDatabricksConnection()
+    config.load_catalog(conn)
+    conn.queries.clear()
+
+    stats = config.get_table_stats(conn, "main.sales")
+
+    assert stats == {"orders": {"last_modified": MODIFIED, "size_bytes": 2048}}
+    assert conn.queries == ["DESCRIBE DETAIL `main`.`sales`.`orders`"]
+
+
+def test_failed_catalog_load_falls_back_to_per_schema_queries():
+    config = _config(catalog="main", schema_name="sales")
+    conn = FakeDatabricksConnection(fail=True)
+    config.load_catalog(conn)
+
+    assert config.get_schemas(conn) == ["sales"]
+    with pytest.raises(ServerOperationError):
+        config.load_schema_metadata(conn, "sales")
+
+
+def test_clear_catalog():
+    config = _config(catalog="main")
+    config.load_catalog(FakeDatabricksConnection())
+    config.clear_catalog()
+
+    conn = FakeDatabricksConnection()
+    config.load_schema_metadata(conn, "sales")
+    assert len(conn.queries) == 1
@@ -0,0 +1,72 @@
+"""Unit tests for DuckDB file sources."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from nao_core.config.databases.duckdb import DuckDBConfig, DuckDBFileSource, discover_file_views
+
+
+@pytest.fixture
+def lake(tmp_path):
+    pq.write_table(pa.table({"id": [1, 2, 3]}), tmp_path / "orders.parquet")
+    (tmp_path / "users.csv").write_text("id,name\n1,ada\n2,bob\n")
+    (tmp_path / "notes.txt").write_text("not data")
+    (tmp_path / "_SUCCESS").write_text("")
+
+    events = tmp_path / "events"
+    for day, count in (("2024-01-01", 2), ("2024-01-02", 5)):
+        partition = events / f"day={day}"
+        partition.mkdir(parents=True)
+        pq.write_table(pa.table({"value": list(range(count))}), partition / "part-0.parquet")
+    (events / "_SUCCESS").write_text("")
+
+    mixed = tmp_path / "mixed"
+    mixed.mkdir()
+    pq.write_table(pa.table({"a": [1]}), mixed / "a.parquet")
+    (mixed / "b.csv").write_text("a\n1\n")
+    return tmp_path
+
+
+def test_discover_file_views(lake):
+    views = {view.name: view for view in discover_file_views(DuckDBFileSource(path=str(lake)))}
+
+    assert sorted(views) == ["events", "orders", "users"]
+    assert views["orders"].format == "parquet"
+    assert views["users"].format == "csv"
+    assert views["events"].globs == [str(lake / "events" / "**" / "*.parquet")]
+    assert len(views["events"].files) == 2
+
+
+def test_discover_file_views_filters_formats(lake):
+    views = discover_file_views(DuckDBFileSource(path=str(lake), formats=["csv"]))
+
+    assert [view.name for view in views] == ["users"]
+
+
+def test_file_sources_require_in_memory_database(lake):
+    with pytest.raises(ValueError, match="in-memory"):
+        DuckDBConfig(name="lake", path="db.duckdb", file_sources=[DuckDBFileSource(path=str(lake))])
+
+
+def test_connect_exposes_files_as_views(lake):
+    config = DuckDBConfig(name="lake", file_sources=[DuckDBFileSource(path=str(lake), schema_name="raw")])
+    conn = config.connect()
+
+    assert sorted(conn.list_tables(database="raw")) == ["events", "orders", "users"]
+    assert config.get_database_name() == "lake"
+
+    columns = config.load_schema_metadata(conn, "raw")
+    assert [column["name"] for column in columns["events"].columns] == ["value", "day"]
+
+
+def test_file_view_stats_read_parquet_metadata(lake):
+    config = DuckDBConfig(name="lake", file_sources=[DuckDBFileSource(path=str(lake))])
+    conn = config.connect()
+
+    stats = config.get_table_stats(conn, "main")
+
+    assert stats["orders"]["row_count"] == 3
+    assert stats["events"]["row_count"] == 7
+    assert stats["users"]["row_count"] is None
+    assert stats["users"]["size_bytes"] == (lake / "users.csv").stat().st_size
@@ -0,0 +1,151 @@
+"""Unit tests for include/exclude pattern pushdown."""
+
+from fnmatch import fnmatch
+
+import duckdb
+import pytest
+
+from nao_core.config.databases.duckdb import DuckDBConfig
+from nao_core.config.databases.patterns import PatternMatcher, full_name_like_predicate, glob_to_like, like_predicate
+from nao_core.config.databases.redshift import RedshiftConfig
+from nao_core.config.databases.snowflake import SnowflakeConfig
+
+NAMES = ["users", "user_events", "userXevents", "orders", "tmp_orders", "tmpxorders", "100%_done", "a\\b"]
+
+
+def test_glob_to_like_translates_wildcards_and_escapes_literals():
+    assert glob_to_like("main.dim_*") == "main.dim\\_%"
+    assert glob_to_like("main.t?") == "main.t_"
+    assert glob_to_like("main.100%") == "main.100\\%"
+    assert glob_to_like("main.[ab]*") is None
+
+
+@pytest.mark.parametrize(
+    ("include", "exclude"),
+    [
+        (["main.user_*"], []),
+        (["main.*"], ["*.tmp_*"]),
+        ([], ["main.100%*", "main.a\\b"]),
+        (["main.[ou]*"], ["main.tmp?orders"]),
+        (["main.user*", "other.*"], ["*events"]),
+    ],
+)
+def test_like_predicate_matches_fnmatch(include, exclude):
+    predicate = like_predicate("main", "name", include, exclude, "duckdb")
+    assert predicate is not None
+
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE t (name VARCHAR)")
+    conn.executemany("INSERT INTO t VALUES (?)", [[name] for name in NAMES])
+    pushed = {row[0] for row in conn.execute(f"SELECT name FROM t WHERE {predicate}").fetchall()}
+
+    expected = {
+        name
+        for name in NAMES
+        if (not include or any(fnmatch(f"main.{name}", p) for p in include))
+        and not any(fnmatch(f"main.{name}", p) for p in exclude)
+    }
+    if any("[" in p for p in include):
+        assert expected <= pushed
+    else:
+        assert pushed == expected
+
+
+def test_full_name_like_predicate_spans_schemas():
+    predicate = full_name_like_predicate(
+        "(schema_name || '.' || name)", ["main.*", "other.user*"], ["*.tmp_*"], "duckdb"
+    )
+    assert predicate is not None
+
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE t (schema_name VARCHAR, name VARCHAR)")
+    rows = [[schema, name] for schema in ("main", "other", "staging") for name in NAMES]
+    conn.executemany("INSERT INTO t VALUES (?, ?)", rows)
+    pushed = {tuple(row) for row in conn.execute(f"SELECT schema_name, name FROM t WHERE {predicate}").fetchall()}
+
+    assert pushed == {
+        (schema, name)
+        for schema, name in rows
+        if (schema == "main" or (schema == "other" and name.startswith("user"))) and not name.startswith("tmp_")
+    }
+
+
+def test_like_predicate_is_none_without_patterns():
+    assert like_predicate("main", "name", [], [], "duckdb") is None
+
+
+def test_like_predicate_uses_ilike_when_case_insensitive():
+    predicate = like_predicate("PUBLIC", "table_name", ["public.*"], [], "snowflake", case_insensitive=True)
+    assert predicate is not None
+    assert "ILIKE" in predicate
+
+
+def test_schema_may_match_uses_include_prefixes():
+    assert PatternMatcher(["analytics.*"], []).schema_may_match("analytics")
+    assert not PatternMatcher(["analytics.*"], []).schema_may_match("analytics_v2")
+    assert PatternMatcher(["prod_*.*"], []).schema_may_match("prod_sales")
+    assert not PatternMatcher(["prod_*.*"], []).schema_may_match("prod")
+    assert not PatternMatcher(["prod_*.*"], []).schema_may_match("dev_sales")
+    assert PatternMatcher(["*.users"], []).schema_may_match("anything")
+    assert PatternMatcher([], []).schema_may_match("anything")
+
+
+def test_schema_may_match_skips_fully_excluded_schemas():
+    assert not PatternMatcher([], ["temp_*.*"]).schema_may_match("temp_1")
+    assert PatternMatcher([], ["temp_*.backup"]).schema_may_match("temp_1")
+
+
+@pytest.mark.parametrize(
+    ("include", "exclude"),
+    [
+        ([], []),
+        (["main.user*"], []),
+        (["main.*", "other.[ab]*"], ["*.tmp_*", "main.?rders"]),
+        ([], ["*events"]),
+    ],
+)
+def test_matcher_agrees_with_fnmatch(include, exclude):
+    matcher = PatternMatcher(include, exclude)
+
+    for schema in ("main", "other"):
+        for name in NAMES:
+            full_name = f"{schema}.{name}"
+            expected = (not include or any(fnmatch(full_name, p) for p in include)) and not any(
+                fnmatch(full_name, p) for p in exclude
+            )
+            assert matcher.matches(schema, name) == expected
+
+
+def test_matcher_case_insensitive():
+    matcher = PatternMatcher(["Analytics.DIM_*"], ["*.dim_tmp"], case_insensitive=True)
+
+    assert matcher.matches("ANALYTICS", "DIM_USERS")
+    assert not matcher.matches("ANALYTICS", "DIM_TMP")
+    assert matcher.schema_may_match("ANALYTICS")
+    assert not PatternMatcher(["analytics.*"], []).schema_may_match("ANALYTICS")
+
+
+def test_config_rebuilds_matcher_when_patterns_change():
+    config = DuckDBConfig(name="test", include=["main.*"])
+    assert config.pattern_matcher() is config.pattern_matcher()
+    assert not config.matches_pattern("other", "users")
+
+    config.include = ["other.*"]
+    assert config.matches_pattern("other", "users")
+
+
+def test_snowflake_patterns_are_case_insensitive():
+    config = SnowflakeConfig(name="sf", username="u", account_id="a", database="db", include=["public.*"])
+
+    assert config.matches_pattern("PUBLIC", "USERS")
+    assert config.schema_may_match("PUBLIC")
+
+
+def test_redshift_tables_query_escapes_backslashes():
+    # Redshift reads backslashes in string literals as escapes, so the ESCAPE character must be doubled
+    config = RedshiftConfig(name="rs", host="h", database="db", user="u", password="p", include=["public.dim_*"])
+
+    query = config.tables_query("public")
+
+    assert "table_schema = 'public'" in query
+    assert "LIKE 'public.dim\\\\_%' ESCAPE '\\\\'" in query
@@ -0,0 +1,113 @@
+"""Unit tests for the Postgres-family catalog introspector."""
+
+from unittest.mock import MagicMock
+
+from psycopg.errors import InsufficientPrivilege
+
+from nao_core.config.databases.pg_catalog import (
+    format_redshift_type,
+    group_relations,
+    load_postgres_schema,
+    load_redshift_schema,
+)
+from nao_core.config.databases.redshift import RedshiftConfig, RedshiftDatabaseContext
+
+
+def _conn(*results):
+    """Connection whose successive raw_sql calls return cursors over `results`."""
+    conn = MagicMock()
+    conn.raw_sql.side_effect = [MagicMock(fetchall=MagicMock(return_value=rows)) for rows in results]
+    return conn
+
+
+def test_group_relations_keeps_comments_and_estimates():
+    tables = group_relations(
+        [
+            ("orders", "Customer orders", 120, "id", "int64 NOT NULL", False, "Order id"),
+            ("orders", "Customer orders", 120, "note", "string", True, ""),
+            ("empty_view", None, None, None, None, None, None),
+        ]
+    )
+
+    assert tables["orders"].description == "Customer orders"
+    assert tables["orders"].row_count == 120
+    assert tables["orders"].columns == [
+        {"name": "id", "type": "int64 NOT NULL", "nullable": False, "description": "Order id"},
+        {"name": "note", "type": "string", "nullable": True, "description": None},
+    ]
+    assert tables["empty_view"].columns == []
+
+
+def test_load_postgres_schema_binds_names_as_parameters():
+    conn = _conn([("it's", "Quoted", 3, "id", "integer", False, None)])
+
+    tables = load_postgres_schema(conn, "sch'ema", "it's")
+
+    query = conn.raw_sql.call_args.args[0]
+    assert "sch'ema" not in query and "it's" not in query
+    assert conn.raw_sql.call_args.kwargs["params"] == ["sch'ema", "it's"]
+    assert tables["it's"].columns[0]["type"] == "int32 NOT NULL"
+
+
+def test_load_redshift_schema_adds_row_estimates():
+    conn = _conn(
+        [
+            ("users", "App users", "id", "integer", "NO", None, 32, 0, "User id"),
+            ("users", "App users", "name", "character varying", "YES", 256, None, None, None),
+        ],
+        [("users", 42)],
+    )
+
+    tables = load_redshift_schema(conn, "public")
+
+    assert tables["users"].row_count == 42
+    assert tables["users"].description == "App users"
+    assert [col["type"] for col in tables["users"].columns] == ["int32 NOT NULL", "string"]
+    assert [call.kwargs["params"] for call in conn.raw_sql.call_args_list] == [["public"], ["public"]]
+
+
+def test_load_redshift_schema_ignores_unreadable_row_estimates():
+    conn = MagicMock()
+    conn.raw_sql.side_effect = [
+        MagicMock(fetchall=MagicMock(return_value=[("users", None, "id", "integer", "NO", None, 32, 0, None)])),
+        InsufficientPrivilege("permission denied for svv_table_info"),
+    ]
+
+    assert load_redshift_schema(conn, "public")["users"].row_count is None
+
+
+def test_format_redshift_type():
+    assert format_redshift_type("bigint", False, None, 64, 0) == "int64 NOT NULL"
+    assert format_redshift_type("super", True, None, None, None) == "string"
+
+
+def test_redshift_context_loads_single_table_with_parameters():
+    conn = _conn([("users", "App users", "id", "integer", "NO", None, 32, 0, None)])
+    ctx = RedshiftDatabaseContext(conn, "public", "users")
+
+    assert ctx.columns() == [{"name": "id", "type": "int32 NOT NULL", "nullable": False, "description": None}]
+    assert ctx.description() == "App users"
+    assert conn.raw_sql.call_count == 1
+    assert conn.raw_sql.call_args.kwargs["params"] == ["public", "users"]
+
+
+def test_redshift_row_count_quotes_identifiers():
+    conn = _conn([(5,)])
+    ctx = RedshiftDatabaseContext(conn, 'we"ird', "users")
+
+    assert ctx.row_count() == 5
+    assert conn.raw_sql.call_args.args[0] == 'SELECT COUNT(*) FROM "we""ird"."users"'
+
+
+def test_redshift_config_reads_svv_table_info_once():
+    """Row estimates come with the schema metadata, not from a second statistics query."""
+    config = RedshiftConfig(name="rs", host="h", database="db", user="u", password="p")
+    conn = MagicMock()
+    conn.raw_sql.side_effect = [
+        MagicMock(fetchall=MagicMock(return_value=[("users", None, "id", "integer", "NO", None, 32, 0, None)])),
+        MagicMock(fetchall=MagicMock(return_value=[("users", 42)])),
+    ]
+
+    assert config.load_schema_metadata(conn, "public")["users"].row_count == 42
+    assert config.get_table_stats(conn, "public") == {}
+    assert conn.raw_sql.call_count == 2
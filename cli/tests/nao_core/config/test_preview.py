@@ -0,0 +1,65 @@
+"""Unit tests for preview conversion helpers."""
+
+import datetime
+from decimal import Decimal
+
+import pyarrow as pa
+
+from nao_core.config.databases.preview import (
+    TRUNCATION_MARKER,
+    arrow_to_rows,
+    json_safe_value,
+    truncate_cell,
+    tuples_to_rows,
+)
+
+
+def test_arrow_to_rows_keeps_native_values_and_nulls():
+    table = pa.table({"id": [1, 2], "email": ["a@example.com", None], "active": [True, False]})
+
+    assert arrow_to_rows(table) == [
+        {"id": 1, "email": "a@example.com", "active": True},
+        {"id": 2, "email": None, "active": False},
+    ]
+
+
+def test_arrow_to_rows_stringifies_non_json_values():
+    table = pa.table(
+        {
+            "ts": [datetime.datetime(2024, 1, 2, 3, 4, 5)],
+            "amount": pa.array([Decimal("1.50")], type=pa.decimal128(10, 2)),
+            "nested": [{"at": datetime.date(2024, 1, 1), "tags": ["x"]}],
+        }
+    )
+
+    assert arrow_to_rows(table) == [
+        {"ts": "2024-01-02 03:04:05", "amount": "1.50", "nested": {"at": "2024-01-01", "tags": ["x"]}}
+    ]
+
+
+def test_arrow_to_rows_empty_table():
+    assert arrow_to_rows(pa.table({"id": pa.array([], type=pa.int64())})) == []
+
+
+def test_arrow_to_rows_truncates_cells():
+    rows = arrow_to_rows(pa.table({"text": ["x" * 100], "id": [1]}), max_cell_bytes=10)
+
+    assert rows == [{"text": "x" * 10 + TRUNCATION_MARKER, "id": 1}]
+
+
+def test_truncate_cell_respects_utf8_boundaries():
+    assert truncate_cell("éé", 3) == "é" + TRUNCATION_MARKER
+    assert truncate_cell("short", 10) == "short"
+
+
+def test_truncate_cell_serializes_large_nested_values():
+    assert truncate_cell({"key": "value"}, 5) == '{"key' + TRUNCATION_MARKER
+    assert truncate_cell([1], 5) == [1]
+
+
+def test_json_safe_value_recurses():
+    assert json_safe_value({1: (b"a", None)}) == {"1": ["b'a'", None]}
+
+
+def test_tuples_to_rows_pads_missing_values():
+    assert tuples_to_rows(["a", "b"], [(1,)]) == [{"a": 1, "b": None}]
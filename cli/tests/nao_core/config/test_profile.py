@@ -0,0 +1,76 @@
+"""Unit tests for column profiling helpers."""
+
+from nao_core.config.databases.profile import (
+    MAX_VALUE_BYTES,
+    ProfileBudget,
+    ProfileOptions,
+    add_top_values,
+    build_profile,
+    column_kind,
+    estimate_scan_bytes,
+    reserve_scan,
+    top_value_columns,
+)
+
+COLUMNS = [
+    {"name": "id", "type": "int64 NOT NULL"},
+    {"name": "status", "type": "string"},
+    {"name": "tags", "type": "array<string>"},
+]
+
+
+def test_column_kind_strips_parameters_and_nullability():
+    assert column_kind("decimal(10, 2) NOT NULL") == "decimal"
+    assert column_kind("timestamp('UTC')") == "timestamp"
+    assert column_kind("array<int64>") == "array"
+
+
+def test_budget_rejects_scans_that_do_not_fit():
+    budget = ProfileBudget(max_bytes=100)
+
+    assert budget.try_spend(60)
+    assert not budget.try_spend(60)
+    assert budget.try_spend(40)
+    assert budget.spent == 100
+
+
+def test_reserve_scan_uses_smaller_known_row_count():
+    options = ProfileOptions(enabled=True, sample_rows=1000, budget=ProfileBudget(max_bytes=10_000))
+
+    assert reserve_scan(options, COLUMNS, row_count=10)
+    assert options.budget is not None
+    assert options.budget.spent == estimate_scan_bytes(COLUMNS, 10)
+    assert not reserve_scan(options, COLUMNS)
+
+
+def test_build_profile_shapes_aggregates():
+    aggregates = {
+        "rows": 10,
+        "c0_non_null": 10,
+        "c0_distinct": 12,  # approximate count above the number of rows
+        "c0_min": 1,
+        "c0_max": 10,
+        "c1_non_null": 8,
+        "c1_distinct": 2,
+        "c1_min": "x" * (MAX_VALUE_BYTES + 10),
+        "c2_non_null": 5,
+    }
+
+    profile = build_profile(COLUMNS, aggregates, sample_rows=10)
+
+    assert profile["sampled"] is True
+    id_col, status_col, tags_col = profile["columns"]
+    assert id_col["distinct_count"] == 10
+    assert status_col["null_count"] == 2
+    assert status_col["null_ratio"] == 0.2
+    assert status_col["min"].endswith("…")
+    assert tags_col["distinct_count"] is None
+    assert top_value_columns(profile) == [1]
+
+
+def test_add_top_values_orders_by_count_then_value():
+    profile = build_profile(COLUMNS, {"rows": 4, "c1_non_null": 4, "c1_distinct": 3}, sample_rows=100)
+
+    add_top_values(profile, [(1, "b", 1), (1, "c", 2), (1, "a", 1)], top_k=2)
+
+    assert profile["columns"][1]["top_values"] == [{"value": "c", "count": 2}, {"value": "a", "count": 1}]
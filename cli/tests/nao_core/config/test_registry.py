@@ -0,0 +1,151 @@
+"""Unit tests for the connection registry."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import duckdb
+import pytest
+
+from nao_core.config.databases.duckdb import DuckDBConfig
+from nao_core.config.databases.registry import ConnectionRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = ConnectionRegistry()
+    yield registry
+    registry.close()
+
+
+def test_released_connection_is_reused(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+
+    with registry.lease(config) as first:
+        pass
+    with registry.lease(config) as second:
+        pass
+
+    assert first is second
+    assert registry.stats() == {"idle": 1, "leased": 0}
+
+
+def test_concurrent_leases_get_distinct_connections(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+
+    with registry.lease(config) as first, registry.lease(config) as second:
+        assert first is not second
+        assert registry.stats() == {"idle": 0, "leased": 2}
+
+
+def test_sync_options_do_not_change_connection_key():
+    config = DuckDBConfig(name="test", path="db.duckdb")
+
+    assert (
+        config.connection_key() == config.model_copy(update={"name": "other", "sync_concurrency": 4}).connection_key()
+    )
+    assert config.connection_key() != config.model_copy(update={"path": "other.duckdb"}).connection_key()
+
+
+def test_idle_connections_are_evicted(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+    registry.idle_timeout = 0
+
+    with patch.object(DuckDBConfig, "disconnect") as disconnect:
+        with registry.lease(config):
+            pass
+        assert registry.evict_idle() == 1
+
+    disconnect.assert_called_once()
+    assert registry.stats() == {"idle": 0, "leased": 0}
+
+
+def test_unhealthy_connection_is_replaced(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+    registry.health_check_after = 0
+
+    broken = MagicMock()
+    broken.raw_sql.side_effect = duckdb.ConnectionException("connection reset")
+    registry.release(broken)  # unknown connections are ignored
+    with patch.object(DuckDBConfig, "connect", return_value=broken):
+        registry.release(registry.acquire(config))
+
+    with patch.object(DuckDBConfig, "disconnect") as disconnect:
+        conn = registry.acquire(config)
+
+    assert conn is not broken
+    disconnect.assert_called_once_with(broken)
+    registry.release(conn)
+
+
+def test_failed_lease_discards_connection(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+
+    with pytest.raises(RuntimeError):
+        with registry.lease(config):
+            raise RuntimeError("query failed")
+
+    assert registry.stats() == {"idle": 0, "leased": 0}
+
+
+def test_close_disconnects_leased_and_idle_connections(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+    idle = registry.acquire(config)
+    registry.acquire(config)
+    registry.release(idle)
+
+    with patch.object(DuckDBConfig, "disconnect") as disconnect:
+        registry.close(config)
+
+    assert disconnect.call_count == 2
+    assert registry.stats() == {"idle": 0, "leased": 0}
+
+
+def test_close_idle_leaves_leased_connections_open(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+    idle = registry.acquire(config)
+    leased = registry.acquire(config)
+    registry.release(idle)
+
+    with patch.object(DuckDBConfig, "disconnect") as disconnect:
+        assert registry.close_idle(config) == 1
+
+    disconnect.assert_called_once_with(idle)
+    assert registry.stats() == {"idle": 0, "leased": 1}
+    registry.release(leased)
+
+
+def test_query_slot_caps_concurrent_work(registry):
+    config = DuckDBConfig(name="test", path=":memory:", max_concurrent_queries=1)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def hold_slot():
+        with registry.query_slot(config):
+            entered.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_slot)
+    holder.start()
+    entered.wait(5)
+
+    acquired = threading.Event()
+
+    def wait_for_slot():
+        with registry.query_slot(config):
+            acquired.set()
+
+    waiter = threading.Thread(target=wait_for_slot)
+    waiter.start()
+    assert not acquired.wait(0.2)
+
+    release.set()
+    holder.join()
+    waiter.join()
+    assert acquired.is_set()
+
+
+def test_query_slot_without_limit_is_a_no_op(registry):
+    config = DuckDBConfig(name="test", path=":memory:")
+
+    with registry.query_slot(config), registry.query_slot(config):
+        pass
@@ -0,0 +1,192 @@
+"""Unit tests for the Snowflake SHOW-based catalog fast path."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+from snowflake.connector.errors import ProgrammingError
+
+from nao_core.config.databases import snowflake
+from nao_core.config.databases.snowflake import SnowflakeConfig, parse_show_type
+
+
+def _data_type(kind: str, nullable: bool = True, **extra) -> str:
+    return json.dumps({"type": kind, "nullable": nullable, **extra})
+
+
+ORDERS_ALTERED = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+USERS_ALTERED = datetime(2024, 4, 2, 8, 0, tzinfo=timezone.utc)
+
+
+SHOW_OUTPUTS = {
+    "SHOW TABLES": [
+        ("PUBLIC", "ORDERS", "Customer orders", 120, 4096, ORDERS_ALTERED),
+        ("PUBLIC", "USERS", "", 3, 512, USERS_ALTERED),
+        ("STAGING", "RAW_EVENTS", "", 10, 2048, None),
+    ],
+    "SHOW VIEWS": [
+        ("PUBLIC", "ACTIVE_USERS", "Users seen this month", None, None, None),
+        ("INFORMATION_SCHEMA", "TABLES", "", None, None, None),
+    ],
+    "SHOW EXTERNAL TABLES": [],
+    "SHOW COLUMNS": [
+        ("PUBLIC", "ORDERS", "ID", _data_type("FIXED", False, precision=38, scale=0), "Order id"),
+        ("PUBLIC", "ORDERS", "AMOUNT", _data_type("FIXED", precision=10, scale=2), ""),
+        ("PUBLIC", "USERS", "NAME", _data_type("TEXT", length=100), ""),
+        ("PUBLIC", "ACTIVE_USERS", "NAME", _data_type("TEXT"), ""),
+        ("STAGING", "RAW_EVENTS", "PAYLOAD", _data_type("VARIANT"), ""),
+        ("INFORMATION_SCHEMA", "TABLES", "TABLE_NAME", _data_type("TEXT"), ""),
+    ],
+}
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeSnowflakeConnection:
+    """Replays SHOW outputs through RESULT_SCAN and records every query."""
+
+    def __init__(self, outputs=SHOW_OUTPUTS, failing=(), information_schema_tables=None):
+        self.outputs = outputs
+        self.failing = failing
+        self.information_schema_tables = information_schema_tables
+        self.queries: list[str] = []
+        self._last: list = []
+
+    def raw_sql(self, query: str):
+        self.queries.append(query)
+        for command, rows in self.outputs.items():
+            if query == command or query.startswith(f"{command} IN"):
+                if command in self.failing:
+                    raise ProgrammingError("insufficient privileges")
+                self._last = rows
+                return FakeCursor([])
+        if "RESULT_SCAN(LAST_QUERY_ID())" in query:
+            return FakeCursor(self._last)
+        if self.information_schema_tables is not None and "information_schema.tables" in query:
+            return FakeCursor(self.information_schema_tables)
+        raise AssertionError(f"Unexpected query: {query}")
+
+
+@pytest.fixture
+def config():
+    return SnowflakeConfig(name="sf", username="user", account_id="acct", database="DB")
+
+
+def test_parse_show_type():
+    assert parse_show_type(_data_type("FIXED", False, precision=38, scale=0)) == ("NUMBER(38,0)", False)
+    assert parse_show_type(_data_type("REAL")) == ("FLOAT", True)
+    assert parse_show_type(_data_type("TIMESTAMP_NTZ", precision=0, scale=9)) == ("TIMESTAMP_NTZ", True)
+
+
+def test_load_catalog_serves_schemas_from_show_output(config):
+    conn = FakeSnowflakeConnection()
+    config.load_catalog(conn)
+
+    assert conn.queries[0] == "SHOW TABLES IN DATABASE"
+    assert len(conn.queries) == 8  # four SHOW commands, each read once with RESULT_SCAN
+
+    assert config.get_schemas(conn) == ["PUBLIC", "STAGING"]
+    assert config.list_tables(conn, "PUBLIC") == ["ORDERS", "USERS", "ACTIVE_USERS"]
+
+    metadata = config.load_schema_metadata(conn, "PUBLIC")
+    assert metadata is not None
+    assert metadata["ORDERS"].columns == [
+        {"name": "ID", "type": "int64 NOT NULL", "nullable": False, "description": "Order id"},
+        {"name": "AMOUNT", "type": "decimal(10, 2)", "nullable": True, "description": None},
+    ]
+    assert metadata["ORDERS"].description == "Customer orders"
+    assert metadata["ACTIVE_USERS"].description == "Users seen this month"
+    assert metadata["USERS"].description is None
+
+    assert config.get_table_stats(conn, "PUBLIC") == {
+        "ORDERS": {"row_count": 120, "size_bytes": 4096, "last_modified": ORDERS_ALTERED},
+        "USERS": {"row_count": 3, "size_bytes": 512, "last_modified": USERS_ALTERED},
+    }
+    # Everything above was served from the snapshot
+    assert len(conn.queries) == 8
+
+
+def test_table_stats_read_last_modified_from_show_tables(config):
+    conn = FakeSnowflakeConnection()
+
+    stats = config.get_table_stats(conn, "PUBLIC")
+
+    assert conn.queries[0] == 'SHOW TABLES IN SCHEMA "PUBLIC"'
+    assert '"last_altered"' in conn.queries[1]
+    assert stats["ORDERS"]["last_modified"] == ORDERS_ALTERED
+    assert not any("information_schema" in query for query in conn.queries)
+
+
+def test_table_stats_read_last_altered_from_information_schema_when_show_lacks_it(config):
+    # SHOW TABLES output without a last_altered/changed_on column reads back NULL
+    show_tables = [row[:5] + (None,) for row in SHOW_OUTPUTS["SHOW TABLES"]]
+    conn = FakeSnowflakeConnection(
+        {**SHOW_OUTPUTS, "SHOW TABLES": show_tables},
+        information_schema_tables=[("ORDERS", ORDERS_ALTERED), ("USERS", USERS_ALTERED)],
+    )
+
+    stats = config.get_table_stats(conn, "PUBLIC")
+
+    assert stats["ORDERS"]["last_modified"] == ORDERS_ALTERED
+    assert stats["USERS"]["last_modified"] == USERS_ALTERED
+    assert "information_schema.tables" in conn.queries[-1]
+
+
+def test_list_tables_applies_patterns(config):
+    config.exclude = ["public.users"]
+    conn = FakeSnowflakeConnection()
+    config.load_catalog(conn)
+
+    assert config.list_tables(conn, "PUBLIC") == ["ORDERS", "ACTIVE_USERS"]
+
+
+def test_configured_schema_is_listed_alone(config):
+    config.schema_name = "public"
+    conn = FakeSnowflakeConnection()
+    config.load_catalog(conn)
+
+    assert conn.queries[0] == 'SHOW TABLES IN SCHEMA "PUBLIC"'
+    assert config.get_schemas(conn) == ["PUBLIC"]
+
+
+def test_truncated_database_listing_falls_back_to_schema_listings(config, monkeypatch):
+    monkeypatch.setattr(snowflake, "SHOW_RESULT_LIMIT", 5)
+    public_columns = [row for row in SHOW_OUTPUTS["SHOW COLUMNS"] if row[0] == "PUBLIC"]
+    outputs = {'SHOW COLUMNS IN SCHEMA "PUBLIC"': public_columns, **SHOW_OUTPUTS}
+    conn = FakeSnowflakeConnection(outputs)
+    config.load_catalog(conn)
+
+    # SHOW COLUMNS IN DATABASE returned as many rows as the limit: columns are listed per schema
+    conn.queries.clear()
+    metadata = config.load_schema_metadata(conn, "PUBLIC")
+    assert conn.queries[0] == 'SHOW COLUMNS IN SCHEMA "PUBLIC"'
+    assert metadata is not None
+    assert list(metadata) == ["ORDERS", "USERS", "ACTIVE_USERS"]
+
+
+def test_failed_show_falls_back_to_information_schema(config):
+    conn = FakeSnowflakeConnection(failing=("SHOW COLUMNS",))
+    config.load_catalog(conn)
+    assert config.list_tables(conn, "PUBLIC") == ["ORDERS", "USERS", "ACTIVE_USERS"]
+
+    with pytest.raises(AssertionError, match="information_schema.columns"):
+        config.load_schema_metadata(conn, "PUBLIC")
+
+
+def test_clear_catalog(config):
+    conn = FakeSnowflakeConnection()
+    config.load_catalog(conn)
+    config.clear_catalog()
+
+    conn.queries.clear()
+    config.list_tables(conn, "PUBLIC")
+    assert conn.queries[0] == 'SHOW TABLES IN SCHEMA "PUBLIC"'